@@ -11,10 +11,13 @@ __version_info__ = tuple(__version__.split('.'))
 __author__ = 'jefft@tune.com'
 __license__ = 'MIT License'
 
-__python_required_version__ = (3, 0)
+# asyncio.get_running_loop and contextvars of AsyncRequestMvIntegration.
+__python_required_version__ = (3, 7)
 
 from requests_mv_integrations.support.tune_request import (TuneRequest)
+from requests_mv_integrations.support.tune_request_registry import (TuneRequestRegistry)
 
 from .request_mv_integration import (RequestMvIntegration)
+from .request_mv_integration_async import (AsyncRequestMvIntegration)
 from .request_mv_integration_download import (RequestMvIntegrationDownload)
 from .request_mv_integration_upload import (RequestMvIntegrationUpload)
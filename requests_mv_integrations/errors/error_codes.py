@@ -48,5 +48,7 @@ class TuneRequestErrorCodes(HttpStatusCode):
     REQ_ERR_AUTH_JSON_ERROR = 612  # Auth JSON Error
     REQ_ERR_AUTH_RESP_ERROR = 613  # Auth Response Error
     REQ_ERR_JSON_DECODING_ERROR = 614  # JSON Decoding Error
+    REQ_ERR_CIRCUIT_OPEN = 615  # Circuit Open: Host failing, request not sent
+    REQ_ERR_DEADLINE_EXCEEDED = 616  # Deadline Exceeded: Time budget of call exhausted
 
     REQ_ERR_UNEXPECTED = 699  # Unexpected Error
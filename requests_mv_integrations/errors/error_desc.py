@@ -27,6 +27,8 @@ tune_reporting_error_names = {
     612: 'Auth JSON Error',
     613: 'Auth Response Error',
     614: 'JSON Decoding Error',
+    615: 'Circuit Open',
+    616: 'Deadline Exceeded',
     699: 'Unexpected Error'
 }
 
@@ -48,6 +50,8 @@ tune_reporting_error_descs = {
     612: 'Auth JSON Error',
     613: 'Auth Response Error',
     614: 'JSON Decoding Error',
+    615: 'Circuit open: host failing, request not sent',
+    616: 'Deadline exceeded: time budget of call exhausted',
     699: 'Unexpected Error'
 }
 
@@ -9,3 +9,4 @@ from .custom import (
     TuneRequestClientError, TuneRequestServiceError, TuneRequestModuleError, TuneRequestValueError,
     TuneRequestAuthenticationError
 )
+from .request_excps import (build_request_error)
@@ -25,6 +25,7 @@ class TuneRequestBaseError(Exception):
     __error_details = None
     __error_origin = 'Module'
     __error_request_curl = None
+    __error_headers = None
 
     def __init__(
         self,
@@ -35,7 +36,8 @@ class TuneRequestBaseError(Exception):
         error_reason=None,
         error_details=None,
         error_origin=None,
-        error_request_curl=None
+        error_request_curl=None,
+        error_headers=None
     ):
         if error_code is not None:
             self.__exit_code = error_code
@@ -53,6 +55,7 @@ class TuneRequestBaseError(Exception):
         self.__error_reason = error_reason or None
         self.__error_details = error_details or None
         self.__error_request_curl = error_request_curl or None
+        self.__error_headers = error_headers or None
 
     @property
     def error_message(self):
@@ -97,9 +100,11 @@ class TuneRequestBaseError(Exception):
 
     @property
     def error_request_curl(self):
-        """Get property of error request curl.
+        """Get property of error request curl, built upon read if lazy.
         """
-        return self.__error_request_curl
+        if self.__error_request_curl is None:
+            return None
+        return str(self.__error_request_curl)
 
     @error_request_curl.setter
     def error_request_curl(self, value):
@@ -107,6 +112,12 @@ class TuneRequestBaseError(Exception):
         """
         self.__error_request_curl = value
 
+    @property
+    def error_headers(self):
+        """Get property of response headers for error.
+        """
+        return self.__error_headers
+
     @staticmethod
     def _error_message(error_message, error_code):
         error_message_ = None
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations.exceptions
+
+import requests
+
+from requests_mv_integrations.errors import (
+    print_traceback,
+    TuneRequestErrorCodes,
+)
+from requests_mv_integrations.exceptions.base import (TuneRequestBaseError)
+from requests_mv_integrations.exceptions.custom import (
+    TuneRequestModuleError,
+    TuneRequestServiceError,
+)
+
+
+def build_request_error(ex, error_request_curl=None):
+    """Build TUNE Request error from exception raised while sending a request.
+
+    Args:
+        ex: Exception raised by requests, urllib3 or this module.
+        error_request_curl: (optional) cUrl command of failed request.
+
+    Returns:
+        TuneRequestBaseError
+
+    """
+    if isinstance(ex, TuneRequestBaseError):
+        return ex
+
+    if isinstance(ex, (
+        requests.exceptions.ConnectTimeout,
+        requests.exceptions.ReadTimeout,
+        requests.exceptions.Timeout,
+    )):
+        return TuneRequestServiceError(
+            error_message="Request: Exception: Timeout",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.GATEWAY_TIMEOUT
+        )
+
+    if isinstance(ex, requests.exceptions.HTTPError):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: HTTP Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_HTTP
+        )
+
+    if isinstance(ex, requests.exceptions.ConnectionError):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: Connection Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
+        )
+
+    if isinstance(ex, BrokenPipeError):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: Broken Pipe Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
+        )
+
+    if isinstance(ex, ConnectionError):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: Connection Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
+        )
+
+    if isinstance(ex, requests.packages.urllib3.exceptions.ProtocolError):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: Protocol Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
+        )
+
+    if isinstance(ex, requests.packages.urllib3.exceptions.ReadTimeoutError):
+        return TuneRequestServiceError(
+            error_message="Request: Exception: Urllib3: Read Timeout Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.GATEWAY_TIMEOUT
+        )
+
+    if isinstance(ex, requests.exceptions.TooManyRedirects):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: Too Many Redirects",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_REDIRECTS
+        )
+
+    if isinstance(ex, requests.exceptions.RequestException):
+        return TuneRequestModuleError(
+            error_message="Request: Exception: Request Error",
+            errors=ex,
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST
+        )
+
+    print_traceback(ex)
+
+    return TuneRequestModuleError(
+        error_message="Request: Exception: Unexpected",
+        errors=ex,
+        error_request_curl=error_request_curl,
+        error_code=TuneRequestErrorCodes.REQ_ERR_SOFTWARE
+    )
@@ -8,8 +8,10 @@ import datetime as dt
 import json
 import logging
 import os
+import threading
 import time
 import urllib.parse
+import weakref
 from functools import partial
 
 import bs4
@@ -38,7 +40,6 @@ from requests_mv_integrations import (
 )
 from requests_mv_integrations.errors import (
     get_exception_message,
-    print_traceback,
     TuneRequestErrorCodes,
 )
 from requests_mv_integrations.exceptions import (
@@ -47,23 +48,42 @@ from requests_mv_integrations.exceptions import (
     TuneRequestServiceError,
     TuneRequestModuleError,
     TuneRequestValueError,
+    build_request_error,
 )
 from requests_mv_integrations.support import (
     build_response_error_details,
-    command_line_request_curl,
     base_class_name,
     python_check_version,
     safe_dict,
     safe_str,
+    LazyRequestCurl,
+    RequestContext,
+    RequestDeadline,
+    RequestRetryClassifier,
+    RetryDelaySource,
+    RetryExcpKind,
     REQUEST_RETRY_EXCPS,
     REQUEST_RETRY_HTTP_STATUS_CODES,
     __USER_AGENT__,
+    retry_cause_excps,
 )
-from requests_mv_integrations.support.tune_request import (TuneRequest)
+from requests_mv_integrations.support.tune_request_registry import (TuneRequestRegistry)
 
 python_check_version(__python_required_version__)
 
 
+class RequestRetryStep(object):
+    """Step of retry loop that its sync or async driver performs.
+
+    SEND: Call request function; send back its response, or throw its exception.
+    SLEEP: Wait seconds, before an attempt or between attempts.
+    """
+    SEND = 'send'
+    SLEEP = 'sleep'
+
+    ALL = (SEND, SLEEP)
+
+
 # @brief Request with retry class for TUNE Multiverse classes
 #
 # @namespace requests_mv_integrations.RequestMvIntegration
@@ -90,17 +110,40 @@ class RequestMvIntegration(object):
     __request_retry_func = None
     __request_retry_excps = REQUEST_RETRY_EXCPS
     __request_retry_excps_func = None
+    __rate_limiter = None
+    __circuit_breakers = None
 
-    __built_request_curl = None
     __logger = None
 
+    @property
+    def request_context(self):
+        """Get Property: Context of last request made by current thread.
+        """
+        return getattr(self._thread_local, 'request_context', None)
+
+    @request_context.setter
+    def request_context(self, value):
+        self._thread_local.request_context = value
+
     @property
     def built_request_curl(self):
-        return self.__built_request_curl
+        """Get Property: Built cUrl of last request made by current thread,
+        a LazyRequestCurl built upon str() or formatting.
+        """
+        if self.request_context:
+            return self.request_context.built_request_curl
 
     @built_request_curl.setter
     def built_request_curl(self, value):
-        self.__built_request_curl = value
+        if self.request_context:
+            self.request_context.built_request_curl = value
+
+    @property
+    def request_attempts(self):
+        """Get Property: Attempts sent on the wire by last request made by current thread.
+        """
+        if self.request_context:
+            return self.request_context.request_attempts
 
     @property
     def logger(self):
@@ -123,12 +166,33 @@ class RequestMvIntegration(object):
 
     @property
     def tune_request(self):
-        return self.__tune_request
+        """Get Property: TuneRequest provided, else the one used by last request of current thread.
+        """
+        if self.__tune_request:
+            return self.__tune_request
+
+        if self.request_context:
+            return self.request_context.tune_request
 
     @tune_request.setter
     def tune_request(self, value):
         self.__tune_request = value
 
+    def pool_stats(self):
+        """Connection pool hit and miss counters of sessions used by this instance,
+        see :meth:`TuneRequest.pool_stats`.
+        """
+        pools_stats = {'pools': [], 'pool_requests': 0, 'pool_hits': 0, 'pool_misses': 0}
+
+        for tune_request in list(self._tune_requests_used):
+            tune_request_pool_stats = tune_request.pool_stats()
+
+            pools_stats['pools'].extend(tune_request_pool_stats['pools'])
+            for pool_counter in ['pool_requests', 'pool_hits', 'pool_misses']:
+                pools_stats[pool_counter] += tune_request_pool_stats[pool_counter]
+
+        return pools_stats
+
     @property
     def request_retry_http_status_codes(self):
         return self.__request_retry_http_status_codes
@@ -161,16 +225,79 @@ class RequestMvIntegration(object):
     def request_retry_excps_func(self, value):
         self.__request_retry_excps_func = value
 
+    @property
+    def rate_limiter(self):
+        """Get Property: RequestRateLimiter shared by requests, None if not limited.
+        """
+        return self.__rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value):
+        self.__rate_limiter = value
+
+    @property
+    def circuit_breakers(self):
+        """Get Property: RequestCircuitBreakers shared by requests, None if not used.
+        """
+        return self.__circuit_breakers
+
+    @circuit_breakers.setter
+    def circuit_breakers(self, value):
+        self.__circuit_breakers = value
+
     def __init__(
         self,
         logger_level=logging.INFO,
         logger_format=TuneLoggingFormat.JSON,
         tune_request=None,
+        host_group=None,
+        pool_connections=None,
+        pool_maxsize=None,
+        pool_block=None,
+        pool_adapters=None,
+        rate_limiter=None,
+        circuit_breakers=None,
     ):
+        """Request with retry.
+
+        Args:
+            logger_level:
+            logger_format:
+            tune_request: (optional) TuneRequest pooled session used by all
+                requests, else one is taken from :class:`TuneRequestRegistry`
+                per host group. TuneRequest has no adapter retries unless
+                given 'retry_tries'; those then add to retries of requests,
+                and are counted in 'request_attempts'.
+            host_group: (optional) Name of group of hosts sharing a pooled session.
+            pool_connections: (optional) Number of host pools to cache.
+            pool_maxsize: (optional) Maximum number of connections kept per host pool.
+            pool_block: (optional) Block when a host pool has no free connection.
+            pool_adapters: (optional) Per URL prefix pool overrides, see :class:`TuneRequest`.
+            rate_limiter: (optional) RequestRateLimiter each attempt waits upon before being sent.
+            circuit_breakers: (optional) RequestCircuitBreakers failing attempts fast
+                while their host is failing.
+        """
         self.logger_level = logger_level
         self.logger_format = logger_format
 
+        self._thread_local = threading.local()
+        self._tune_requests_used = weakref.WeakSet()
+
+        self.host_group = host_group
+
+        self.pool_config = {}
+        if pool_connections is not None:
+            self.pool_config.update({'pool_connections': pool_connections})
+        if pool_maxsize is not None:
+            self.pool_config.update({'pool_maxsize': pool_maxsize})
+        if pool_block is not None:
+            self.pool_config.update({'pool_block': pool_block})
+        if pool_adapters is not None:
+            self.pool_config.update({'pool_adapters': pool_adapters})
+
         self.tune_request = tune_request
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
         self._requests_logger()
 
     def _requests_logger(self):
@@ -190,24 +317,72 @@ class RequestMvIntegration(object):
             requests_logger.propagate = True
             requests_logger.setLevel(level=request_logger_level)
 
-    def _prep_request_retry(self, request_retry=None, request_retry_http_status_codes=None):
-        self.timeout = self._REQUEST_CONFIG['timeout']
-        self.retry_tries = self._REQUEST_CONFIG['tries']
-        self.retry_delay = self._REQUEST_CONFIG['delay']
-        self.retry_max_delay = None
-        self.retry_backoff = 0
-        self.retry_jitter = 0
-
-        if request_retry:
-            self.timeout = request_retry.get('timeout', self._REQUEST_CONFIG['timeout'])
-            self.retry_tries = request_retry.get('tries', self._REQUEST_CONFIG['tries'])
-            self.retry_delay = request_retry.get('delay', self._REQUEST_CONFIG['delay'])
-            self.retry_max_delay = request_retry.get('max_delay', None)
-            self.retry_backoff = request_retry.get('backoff', 0)
-            self.retry_jitter = request_retry.get('jitter', 0)
-
-        self.request_retry_http_status_codes = \
-            request_retry_http_status_codes or REQUEST_RETRY_HTTP_STATUS_CODES
+    def _prep_request_retry(
+        self,
+        request_retry=None,
+        request_retry_http_status_codes=None,
+        request_retry_excps=None,
+        request_retry_func=None,
+        request_retry_excps_func=None,
+        request_retry_classifier=None,
+        request_deadline=None,
+        request_method=None,
+        request_label=None,
+    ):
+        """Prepare retry policy of one call.
+
+        Retries are all made here, by :meth:`_request_retry`: adapter of
+        pooled session has no retries of its own by default, and the retry
+        classifier, unless one is given, retries upon HTTP status codes,
+        connection failures and, for idempotent methods, dropped connections.
+
+        Returns:
+            RequestContext
+
+        """
+        if not request_retry:
+            request_retry = {}
+
+        if request_retry_excps is None:
+            request_retry_excps = self.request_retry_excps
+
+        if request_retry_func is None:
+            request_retry_func = self.request_retry_func
+
+        if request_retry_excps_func is None:
+            request_retry_excps_func = self.request_retry_excps_func
+
+        request_context = RequestContext(
+            timeout=request_retry.get('timeout', self._REQUEST_CONFIG['timeout']),
+            retry_tries=request_retry.get('tries', self._REQUEST_CONFIG['tries']),
+            retry_delay=request_retry.get('delay', self._REQUEST_CONFIG['delay']),
+            retry_max_delay=request_retry.get('max_delay', None),
+            retry_backoff=request_retry.get('backoff', 0),
+            retry_jitter=request_retry.get('jitter', 0),
+            retry_seed=request_retry.get('seed', None),
+            retry_budget=request_retry.get('budget', None),
+            retry_http_status_tries=request_retry.get('http_status_tries', None),
+            request_retry_http_status_codes=request_retry_http_status_codes or self.request_retry_http_status_codes,
+            request_retry_excps=request_retry_excps,
+            request_retry_func=request_retry_func,
+            request_retry_excps_func=request_retry_excps_func,
+            request_retry_classifier=request_retry_classifier or RequestRetryClassifier(
+                retry_excps=request_retry_excps,
+                retry_excps_func=request_retry_excps_func,
+                retry_func=request_retry_func,
+                retry_http_status_codes=request_retry_http_status_codes or self.request_retry_http_status_codes,
+                retry_cause_excps=retry_cause_excps(request_method),
+            ),
+            request_deadline=RequestDeadline.from_value(request_deadline),
+            request_label=request_label,
+        )
+
+        request_context.tune_request = self.__tune_request or TuneRequestRegistry().get(
+            host_group=self.host_group, **self.pool_config
+        )
+        self._tune_requests_used.add(request_context.tune_request)
+
+        return request_context
 
     def request(
         self,
@@ -221,6 +396,8 @@ class RequestMvIntegration(object):
         request_retry_http_status_codes=None,
         request_retry_func=None,
         request_retry_excps_func=None,
+        request_retry_classifier=None,
+        request_deadline=None,
         request_headers=None,
         request_auth=None,
         cookie_payload=None,
@@ -246,6 +423,13 @@ class RequestMvIntegration(object):
                 to request_retry_excps.
             request_retry_excps: An exception or a tuple of exceptions
                 to catch.
+            request_retry_excps_func: (optional) Function deciding if other
+                exceptions are retried upon.
+            request_retry_classifier: (optional) RequestRetryClassifier,
+                alternative to request_retry_excps, request_retry_func and
+                request_retry_excps_func.
+            request_deadline: (optional) Seconds, or RequestDeadline, the
+                call must complete within, all attempts and delays included.
             request_headers: (optional) Dictionary of HTTP Headers to
                 send with the :class:`Request`.
             request_auth: (optional) Auth tuple to enable Basic/Digest/Custom HTTP Auth.
@@ -269,19 +453,147 @@ class RequestMvIntegration(object):
             * delay: initial delay between attempts. default: 1.
             * max_delay: the maximum value of delay. default: None (no limit).
             * backoff: multiplier applied to delay between attempts.
-                default: 1 (no backoff).
+                default: 1 (no backoff). Or a backoff strategy, e.g.
+                FullJitterBackoff, setting delays instead of delay and jitter.
             * jitter: extra seconds added to delay between attempts.
                 default: 0.
+            * seed: seed of random delays of backoff strategy.
+                default: None (system entropy).
+            * budget: RetryBudget shared by calls, capping their retries.
+                default: None (no budget).
+            * http_status_tries: the maximum number of attempts answered by
+                HTTP status codes retried upon, e.g. to cap those of infinite
+                tries. default: None (tries).
         """
-        self.logger.debug("Request: Start: {}".format(request_label if request_label else ""))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Request: Start: {}".format(request_label if request_label else ""))
+
+        kwargs, request_context = self._prep_request(
+            request_method=request_method,
+            request_url=request_url,
+            request_params=request_params,
+            request_data=request_data,
+            request_json=request_json,
+            request_retry=request_retry,
+            request_retry_excps=request_retry_excps,
+            request_retry_http_status_codes=request_retry_http_status_codes,
+            request_retry_func=request_retry_func,
+            request_retry_excps_func=request_retry_excps_func,
+            request_retry_classifier=request_retry_classifier,
+            request_deadline=request_deadline,
+            request_headers=request_headers,
+            request_auth=request_auth,
+            cookie_payload=cookie_payload,
+            build_request_curl=build_request_curl,
+            allow_redirects=allow_redirects,
+            verify=verify,
+            stream=stream,
+            request_label=request_label
+        )
 
-        timeout = None
+        self.request_context = request_context
+
+        time_start_req = dt.datetime.now()
+
+        request_context.tune_request.acquire()
+        try:
+            response = self._request_retry(
+                call_func=self._request,
+                fargs=None,
+                fkwargs=kwargs,
+                request_context=request_context
+            )
+
+        except Exception as ex:
+            raise build_request_error(ex, error_request_curl=request_context.built_request_curl)
+
+        finally:
+            request_context.tune_request.release()
+
+        self._request_completed(time_start_req, request_context)
+
+        return response
+
+    def request_send(self, request, request_context, verify=True, stream=True):
+        """Send prepared request as one more attempt of call of request context,
+        e.g. one resuming a download.
+
+        Like any attempt of that call, it waits upon rate limiter, fails fast
+        if circuit of host is open and its timeout is shrunk to fit deadline.
+        It goes through pooled session, with its proxies, cert and verify
+        merged as for any request.
+
+        Args:
+            request: requests.PreparedRequest
+            request_context: RequestContext of call it is an attempt of.
+            verify: (optional) whether the SSL cert will be verified.
+            stream: (optional) if False, the response content will be
+                immediately downloaded.
+
+        Returns:
+            requests.Response
+
+        """
+        request_url = request.url
+
+        self._request_rate_limit(request_url, request_context)
+
+        timeout = self._request_deadline_timeout(request_context.timeout, request_url, request_context)
+
+        session = request_context.tune_request.session
+        send_kwargs = session.merge_environment_settings(request_url, {}, stream, verify, None)
+
+        if timeout is not None:
+            send_kwargs.update({'timeout': (timeout, timeout)})
+
+        circuit_breaker = self._request_circuit_breaker(request_url, request_context)
+
+        request_context.request_attempts += 1
+
+        try:
+            response = session.send(request, allow_redirects=False, **send_kwargs)
+        except Exception as ex:
+            self._request_circuit_record(circuit_breaker, ex)
+            raise
+        except BaseException:
+            self._request_circuit_release(circuit_breaker)
+            raise
+        self._request_circuit_record(circuit_breaker)
+
+        request_context.request_attempts += self._request_adapter_retries(response)
+
+        return response
+
+    def _prep_request(
+        self,
+        request_method,
+        request_url,
+        request_params=None,
+        request_data=None,
+        request_json=None,
+        request_retry=None,
+        request_retry_excps=None,
+        request_retry_http_status_codes=None,
+        request_retry_func=None,
+        request_retry_excps_func=None,
+        request_retry_classifier=None,
+        request_deadline=None,
+        request_headers=None,
+        request_auth=None,
+        cookie_payload=None,
+        build_request_curl=True,
+        allow_redirects=True,
+        verify=True,
+        stream=False,
+        request_label=None
+    ):
+        """Prepare request: retry configuration and arguments of :meth:`_request`.
 
-        retry_tries = None
-        retry_delay = None
-        retry_backoff = 0
-        retry_jitter = 0
-        retry_max_delay = None
+        Returns:
+            tuple: (kwargs of :meth:`_request`, RequestContext)
+
+        """
+        timeout = None
 
         if not verify:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
@@ -289,8 +601,7 @@ class RequestMvIntegration(object):
         if request_method:
             request_method = request_method.upper()
 
-        if not request_retry:
-            request_retry = {}
+        request_retry = dict(request_retry) if request_retry else {}
 
         if 'timeout' not in request_retry:
             request_retry['timeout'] = self._REQUEST_CONFIG['timeout']
@@ -299,42 +610,51 @@ class RequestMvIntegration(object):
         if 'delay' not in request_retry:
             request_retry['delay'] = self._REQUEST_CONFIG['delay']
 
-        self._prep_request_retry(request_retry, request_retry_http_status_codes)
+        request_context = self._prep_request_retry(
+            request_retry=request_retry,
+            request_retry_http_status_codes=request_retry_http_status_codes,
+            request_retry_excps=request_retry_excps,
+            request_retry_func=request_retry_func,
+            request_retry_excps_func=request_retry_excps_func,
+            request_retry_classifier=request_retry_classifier,
+            request_deadline=request_deadline,
+            request_method=request_method,
+            request_label=request_label,
+        )
 
-        if not self.tune_request:
-            self.tune_request = TuneRequest(
-                retry_tries=self.retry_tries,
-                retry_backoff=self.retry_backoff,
-                retry_codes=self.request_retry_http_status_codes
-            )
+        logger_debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        logger_extra = {
-            'request_method': request_method,
-            'request_url': request_url,
-        }
+        if logger_debug:
+            logger_extra = {
+                'request_method': request_method,
+                'request_url': request_url,
+            }
 
-        if request_params:
-            logger_extra.update({'request_params': request_params})
+            if request_params:
+                logger_extra.update({'request_params': request_params})
 
-        if request_retry:
-            logger_extra.update({'request_retry': request_retry})
+            if request_retry:
+                logger_extra.update({'request_retry': request_retry})
 
-        if request_headers:
-            logger_extra.update({'request_headers': request_headers})
+            if request_headers:
+                logger_extra.update({'request_headers': request_headers})
 
-        if request_auth:
-            logger_extra.update({'request_auth': request_auth})
+            if request_auth:
+                logger_extra.update({'request_auth': request_auth})
 
-        if request_json:
-            logger_extra.update({'request_json': request_json})
+            if request_json:
+                logger_extra.update({'request_json': request_json})
 
-        self.logger.debug("Request: Setup: {}".format(request_label if request_label else ""), extra=logger_extra)
+            self.logger.debug(
+                "Request: Setup: {}".format(request_label if request_label else ""), extra=logger_extra
+            )
 
         key_user_agent = 'User-Agent'
         header_user_agent = {key_user_agent: __USER_AGENT__}
 
         if request_headers:
             if key_user_agent not in request_headers:
+                request_headers = dict(request_headers)
                 request_headers.update(header_user_agent)
         else:
             request_headers = header_user_agent
@@ -353,141 +673,34 @@ class RequestMvIntegration(object):
             'build_request_curl': build_request_curl,
             'allow_redirects': allow_redirects,
             'verify': verify,
-            'stream': stream
+            'stream': stream,
+            'request_context': request_context
         }
 
-        time_start_req = dt.datetime.now()
-
-        if request_retry_func is None:
-            request_retry_func = self.request_retry_func
-
-        if request_retry_excps_func is None:
-            request_retry_excps_func = self.request_retry_excps_func
-
-        if request_retry_http_status_codes is not None:
-            self.request_retry_http_status_codes = request_retry_http_status_codes
-
-        if request_retry_excps is not None:
-            self.request_retry_excps = request_retry_excps
-
-        self.logger.debug(
-            "Request: Details: {}".format(request_label if request_label else ""),
-            extra={
-                'request_method': request_method,
-                'request_retry': request_retry,
-                'request_url': request_url,
-                'request_params': request_params,
-                'request_data': request_data,
-                'request_json': request_json,
-                'request_headers': request_headers,
-                'request_auth': request_auth,
-                'timeout': timeout,
-                'allow_redirects': allow_redirects,
-                'verify': verify,
-                'stream': stream
-            }
-        )
-
-        try:
-            self._prep_request_retry(request_retry, request_retry_http_status_codes)
-            response = self._request_retry(
-                call_func=self._request,
-                fargs=None,
-                fkwargs=kwargs,
-                timeout=timeout,
-                request_label=request_label,
-                request_retry_func=request_retry_func,
-                request_retry_excps_func=request_retry_excps_func
-            )
-
-        except (
-            requests.exceptions.ConnectTimeout,
-            requests.exceptions.ReadTimeout,
-            requests.exceptions.Timeout,
-        ) as ex_req_timeout:
-            raise TuneRequestServiceError(
-                error_message="Request: Exception: Timeout",
-                errors=ex_req_timeout,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.GATEWAY_TIMEOUT
-            )
-
-        except requests.exceptions.HTTPError as ex_req_http:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: HTTP Error",
-                errors=ex_req_http,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_HTTP
-            )
-
-        except requests.exceptions.ConnectionError as ex_req_connect:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Connection Error",
-                errors=ex_req_connect,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
-            )
-
-        except BrokenPipeError as ex_broken_pipe:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Broken Pipe Error",
-                errors=ex_broken_pipe,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
-            )
-
-        except ConnectionError as ex_connect:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Connection Error",
-                errors=ex_connect,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
-            )
-
-        except requests.packages.urllib3.exceptions.ProtocolError as ex_req_urllib3_protocol:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Protocol Error",
-                errors=ex_req_urllib3_protocol,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT
-            )
-
-        except requests.packages.urllib3.exceptions.ReadTimeoutError as ex_req_urllib3_read_timeout:
-            raise TuneRequestServiceError(
-                error_message="Request: Exception: Urllib3: Read Timeout Error",
-                errors=ex_req_urllib3_read_timeout,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.GATEWAY_TIMEOUT
-            )
-
-        except requests.exceptions.TooManyRedirects as ex_req_redirects:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Too Many Redirects",
-                errors=ex_req_redirects,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST_REDIRECTS
-            )
-
-        except requests.exceptions.RequestException as ex_req_request:
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Request Error",
-                errors=ex_req_request,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST
+        if logger_debug:
+            self.logger.debug(
+                "Request: Details: {}".format(request_label if request_label else ""),
+                extra={
+                    'request_method': request_method,
+                    'request_retry': request_retry,
+                    'request_url': request_url,
+                    'request_params': request_params,
+                    'request_data': request_data,
+                    'request_json': request_json,
+                    'request_headers': request_headers,
+                    'request_auth': request_auth,
+                    'timeout': timeout,
+                    'allow_redirects': allow_redirects,
+                    'verify': verify,
+                    'stream': stream
+                }
             )
 
-        except TuneRequestBaseError:
-            raise
-
-        except Exception as ex:
-            print_traceback(ex)
+        return kwargs, request_context
 
-            raise TuneRequestModuleError(
-                error_message="Request: Exception: Unexpected",
-                errors=ex,
-                error_request_curl=self.built_request_curl,
-                error_code=TuneRequestErrorCodes.REQ_ERR_SOFTWARE
-            )
+    def _request_completed(self, time_start_req, request_context):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
 
         time_end_req = dt.datetime.now()
         diff_req = time_end_req - time_start_req
@@ -495,247 +708,544 @@ class RequestMvIntegration(object):
         request_time_msecs = int(diff_req.total_seconds() * 1000)
 
         self.logger.debug(
-            "Request: Completed", extra={'request_label': request_label,
+            "Request: Completed", extra={'request_label': request_context.request_label,
+                                         'request_attempts': request_context.request_attempts,
                                          'request_time_msecs': request_time_msecs}
         )
 
-        return response
-
     def _request_retry(
         self,
         call_func,
         fargs=None,
         fkwargs=None,
-        timeout=60,
-        request_retry_func=None,
-        request_retry_excps_func=None,
-        request_label=None,
+        request_context=None,
     ):
         """Request Retry
 
         Args:
             call_func: the function to execute.
-            request_retry_excps: A tuple of exceptions to catch.
             fargs: the positional arguments of the function to execute.
             fkwargs: the named arguments of the function to execute.
-            timeout: (optional) How long to wait for the server to send
-                data before giving up.
-            request_retry_func: (optional) Retry alternative to request_retry_excps.
+            request_context: Retry policy of this call:
+
+                timeout: How long to wait for the server to send
+                    data before giving up.
+                retry_tries: the maximum number of attempts.
+                    default: -1 (infinite).
+                retry_delay: initial delay between attempts.
+                    default: 0.
+                retry_max_delay:the maximum value of delay.
+                    default: None (no limit).
+                retry_backoff: multiplier applied to delay between attempts.
+                    default: 1 (no backoff).
+                retry_jitter: extra seconds added to delay between attempts.
+                    default: 0.
+                request_retry_excps: A tuple of exceptions to catch.
+                request_retry_func: (optional) Retry alternative to request_retry_excps.
+                request_retry_classifier: RequestRetryClassifier deciding retries.
+                request_label: Label
 
-            retry_tries: the maximum number of attempts.
-                default: -1 (infinite).
-            retry_delay: initial delay between attempts.
-                default: 0.
-            retry_max_delay:the maximum value of delay.
-                default: None (no limit).
-            retry_backoff: multiplier applied to delay between attempts.
-                default: 1 (no backoff).
-            retry_jitter: extra seconds added to delay between attempts.
-                default: 0.
-            request_label: Label
+        Returns:
+            requests.Response
+
+        """
+        retry_steps = self._request_retry_steps(call_func, fargs, fkwargs, request_context)
+
+        try:
+            retry_step, retry_value = next(retry_steps)
+            while True:
+                try:
+                    if retry_step == RequestRetryStep.SLEEP:
+                        time.sleep(retry_value)
+                        step_result = None
+                    else:
+                        step_result = retry_value()
+                except BaseException as ex:
+                    retry_step, retry_value = retry_steps.throw(ex)
+                    continue
+
+                retry_step, retry_value = retry_steps.send(step_result)
+
+        except StopIteration as retry_stop:
+            return retry_stop.value
+
+    def _request_retry_steps(self, call_func, fargs=None, fkwargs=None, request_context=None):
+        """Request Retry: Steps of retry loop, shared by sync and async drivers.
+
+        Generator yielding (RequestRetryStep, value) for driver to perform,
+        so that only sending and sleeping differ between drivers. Driver sends
+        back response of SEND step, or throws exception it raised.
 
         Returns:
+            requests.Response, as value of StopIteration.
 
         """
-        request_retry_extra = {'timeout': timeout}
+        self._request_retry_start(request_context)
+
+        args = fargs if fargs else list()
+        kwargs = fkwargs if fkwargs else dict()
+
+        request_url = kwargs['request_url'] if kwargs and 'request_url' in kwargs else ""
+
+        _attempts = 0
+
+        _tries, _delay, _timeout = request_context.retry_tries, request_context.retry_delay, request_context.timeout
+        while _tries:
+            _attempts += 1
+
+            self._request_retry_attempt(_attempts, _tries, _delay, _timeout, request_url, request_context)
+
+            _tries -= 1
+
+            if self.rate_limiter is not None:
+                wait_secs = self._request_rate_limit_wait(request_url, request_context)
+                if wait_secs > 0:
+                    yield RequestRetryStep.SLEEP, wait_secs
+                self._request_rate_limited(wait_secs, request_url, request_context)
+
+            kwargs['timeout'] = self._request_deadline_timeout(_timeout, request_url, request_context)
+            request_func = partial(call_func, *args, **kwargs)
+
+            circuit_breaker = self._request_circuit_breaker(request_url, request_context)
+
+            request_context.request_attempts += 1
 
-        request_retry_extra.update({'request_retry_http_status_codes': self.request_retry_http_status_codes})
+            try:
+                try:
+                    response = yield RequestRetryStep.SEND, request_func
+                except Exception as ex:
+                    self._request_circuit_record(circuit_breaker, ex)
+                    raise
+                except BaseException:
+                    self._request_circuit_release(circuit_breaker)
+                    raise
+                self._request_circuit_record(circuit_breaker)
+
+                request_context.request_attempts += self._request_adapter_retries(response)
+
+                retry_decision = self._request_retry_response(response, request_url, request_context)
+                if not retry_decision.retry:
+                    return response
+
+            except Exception as ex:
+                retry_decision = self._request_retry_excp(ex, _tries, request_url, request_context)
+
+            _tries = self._request_retry_http_status(_tries, retry_decision, request_context)
+
+            self._request_retry_exhausted(_attempts, _tries, request_url, request_context)
+
+            _sleep_delay, _delay_source = self._request_retry_sleep_delay(_delay, retry_decision, request_context)
+
+            self._request_retry_perform(_tries, _sleep_delay, _timeout, request_url, request_context, _delay_source)
+
+            yield RequestRetryStep.SLEEP, _sleep_delay
+
+            _delay = self._request_retry_delay(_delay, request_context)
+
+    def _request_retry_start(self, request_context):
+        if request_context.retry_budget is not None:
+            request_context.retry_budget.request()
 
-        if self.request_retry_excps is not None:
-            request_retry_excp_names = [excp.__name__ for excp in list(self.request_retry_excps)]
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        request_label = request_context.request_label
+        request_retry_extra = {'timeout': request_context.timeout}
+
+        request_retry_extra.update({
+            'request_retry_http_status_codes': request_context.request_retry_http_status_codes
+        })
+
+        if request_context.request_retry_excps is not None:
+            request_retry_excp_names = [excp.__name__ for excp in list(request_context.request_retry_excps)]
             request_retry_extra.update({'request_retry_excps': request_retry_excp_names})
 
-        if request_retry_func is not None:
-            request_retry_func_name = request_retry_func.__name__
+        if request_context.request_retry_func is not None:
+            request_retry_func_name = request_context.request_retry_func.__name__
             request_retry_extra.update({'request_retry_func': request_retry_func_name})
 
-        if request_retry_excps_func is not None:
-            request_retry_excps_func_name = request_retry_excps_func.__name__
+        if request_context.request_retry_excps_func is not None:
+            request_retry_excps_func_name = request_context.request_retry_excps_func.__name__
             request_retry_extra.update({'request_retry_excps_func': request_retry_excps_func_name})
 
         self.logger.debug(
             "Request Retry: Start: {}".format(request_label if request_label else ""), extra=request_retry_extra
         )
 
-        args = fargs if fargs else list()
-        kwargs = fkwargs if fkwargs else dict()
+    def _request_retry_attempt(self, attempts, tries, delay, timeout, request_url, request_context):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
 
-        request_url = kwargs['request_url'] if kwargs and 'request_url' in kwargs else ""
+        request_label = request_context.request_label
+        self.logger.debug(
+            "Request Retry: Attempt: {}: {}".format(request_label if request_label else "", attempts),
+            extra={
+                'attempts': attempts,
+                'timeout': timeout,
+                'tries': tries,
+                'delay': delay,
+                'request_url': request_url
+            }
+        )
 
-        _attempts = 0
+    def _request_rate_limit(self, request_url, request_context):
+        """Request Retry: Wait upon rate limiter before sending attempt.
+        """
+        if self.rate_limiter is None:
+            return
 
-        _tries, _delay, _timeout = self.retry_tries, self.retry_delay, self.timeout
-        while _tries:
-            _attempts += 1
+        wait_secs = self._request_rate_limit_wait(request_url, request_context)
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+        self._request_rate_limited(wait_secs, request_url, request_context)
 
-            fkwargs['timeout'] = _timeout
-            request_func = partial(call_func, *args, **kwargs)
+    def _request_rate_limit_wait(self, request_url, request_context):
+        """Request Retry: Seconds to wait upon rate limiter before sending attempt.
+
+        Deadline of call, if any, is checked before a token is taken, and
+        wait is capped by its remaining time: deadline is checked again
+        once waited, by :meth:`_request_deadline_timeout`.
+
+        Raises:
+            TuneRequestModuleError: REQ_ERR_DEADLINE_EXCEEDED if deadline passed.
+
+        """
+        request_deadline = request_context.request_deadline
+        if request_deadline is not None:
+            request_deadline.check(
+                request_context.request_label, request_url, error_request_curl=request_context.built_request_curl
+            )
+
+        wait_secs = self.rate_limiter.reserve(request_url, request_context.request_label)
+
+        if request_deadline is not None and wait_secs > 0 and not request_deadline.fits(wait_secs):
+            self.logger.warning(
+                "Request Retry: Rate Limited: Wait Capped by Deadline",
+                extra={'wait_secs': wait_secs,
+                       'deadline_secs': request_deadline.deadline_secs,
+                       'deadline_remaining': request_deadline.remaining,
+                       'request_url': request_url,
+                       'request_label': request_context.request_label}
+            )
+            wait_secs = request_deadline.remaining
+
+        return wait_secs
+
+    def _request_deadline_timeout(self, timeout, request_url, request_context):
+        """Request Retry: Timeout of attempt, shrunk to fit deadline of call if any.
+
+        Raises:
+            TuneRequestModuleError: REQ_ERR_DEADLINE_EXCEEDED if deadline passed,
+                or if no time is left for attempt.
+
+        """
+        request_deadline = request_context.request_deadline
+        if request_deadline is None:
+            return timeout
+
+        request_deadline.check(
+            request_context.request_label, request_url, error_request_curl=request_context.built_request_curl
+        )
+
+        timeout = request_deadline.timeout(timeout)
+
+        if min(timeout if isinstance(timeout, tuple) else (timeout, )) <= 0:
+            request_deadline.exceeded(
+                request_context.request_label, request_url, error_request_curl=request_context.built_request_curl
+            )
+
+        return timeout
+
+    def _request_circuit_breaker(self, request_url, request_context):
+        """Request Retry: Circuit breaker of host, failing attempt fast if open.
+
+        Returns:
+            CircuitBreaker letting attempt through, None if not used.
+
+        """
+        if self.circuit_breakers is None:
+            return None
+
+        circuit_breaker = self.circuit_breakers.circuit_breaker(request_url)
+        if circuit_breaker.allow():
+            return circuit_breaker
 
+        request_label = request_context.request_label
+
+        self.logger.error(
+            "Request Retry: Circuit Open",
+            extra={
+                'circuit_name': circuit_breaker.name,
+                'circuit_state': circuit_breaker.state,
+                'circuit_retry_after': circuit_breaker.retry_after,
+                'request_url': request_url,
+                'request_label': request_label
+            }
+        )
+
+        raise TuneRequestServiceError(
+            error_message="Request Retry: Circuit Open: {}: {}".format(circuit_breaker.name, request_label),
+            error_request_curl=request_context.built_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_CIRCUIT_OPEN
+        )
+
+    def _request_circuit_record(self, circuit_breaker, excp=None):
+        """Request Retry: Record outcome of attempt let through by circuit breaker.
+        """
+        if circuit_breaker is None:
+            return
+
+        if excp is not None and self.circuit_breakers.is_failure(excp):
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
+    @staticmethod
+    def _request_adapter_retries(response):
+        """Request Retry: Requests retried by adapter of pooled session before response,
+        0 unless TuneRequest provided makes retries of its own.
+        """
+        response_retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        return len(response_retries.history) if response_retries is not None else 0
+
+    def _request_circuit_release(self, circuit_breaker):
+        """Request Retry: Release circuit breaker slot of attempt interrupted before its outcome.
+        """
+        if circuit_breaker is None:
+            return
+
+        circuit_breaker.release()
+
+    def _request_rate_limited(self, wait_secs, request_url, request_context):
+        if wait_secs > 0:
             self.logger.debug(
-                "Request Retry: Attempt: {}: {}".format(request_label if request_label else "", _attempts),
-                extra={
-                    'attempts': _attempts,
-                    'timeout': _timeout,
-                    'tries': _tries,
-                    'delay': _delay,
-                    'request_url': request_url
-                }
+                "Request Retry: Rate Limited",
+                extra={'wait_secs': wait_secs,
+                       'request_url': request_url,
+                       'request_label': request_context.request_label}
             )
 
-            error_exception = None
-            _tries -= 1
+    def _request_retry_response(self, response, request_url, request_context):
+        """Request Retry: Classify response of an attempt.
 
-            try:
-                response = request_func()
+        Returns:
+            RetryDecision: Not retry if response is final, else retry candidate.
 
-                if response is None:
-                    raise TuneRequestModuleError(
-                        error_message="Request Retry: No response",
-                        error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE
-                    )
+        """
+        request_label = request_context.request_label
 
-                self.logger.debug(
-                    "Request Retry: Checking Response",
-                    extra={'request_url': request_url,
-                           'request_label': request_label}
-                )
+        if response is None:
+            raise TuneRequestModuleError(
+                error_message="Request Retry: No response",
+                error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE
+            )
 
-                if request_retry_func is not None:
-                    if not request_retry_func(response):
-                        self.logger.debug(
-                            "Request Retry: Response: Valid: Not Retry Candidate",
-                            extra={'request_url': request_url,
-                                   'request_label': request_label}
-                        )
-                        return response
-                else:
-                    self.logger.debug(
-                        "Request Retry: Response: Valid",
-                        extra={'request_url': request_url,
-                               'request_label': request_label}
-                    )
-                    return response
+        retry_decision = request_context.request_retry_classifier.classify_response(response)
 
-                self.logger.debug(
-                    "Request Retry: Response: Valid: Retry Candidate",
-                    extra={'request_url': request_url,
-                           'request_label': request_label}
-                )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Request Retry: Response: Valid: {}".format(
+                    "Retry Candidate" if retry_decision.retry else "Not Retry Candidate"
+                ),
+                extra={'request_url': request_url,
+                       'retry_reason': retry_decision.reason,
+                       'request_label': request_label}
+            )
 
-            except self.request_retry_excps as retry_ex:
-                error_exception = retry_ex
+        return retry_decision
 
-                self.logger.warning(
-                    "Request Retry: Expected: {}: Retry Candidate".format(base_class_name(error_exception)),
-                    extra={
-                        'error_details': get_exception_message(error_exception),
-                        'request_url': request_url,
-                        'request_label': request_label
-                    }
-                )
+    def _request_retry_excp(self, excp, tries, request_url, request_context):
+        """Request Retry: Classify exception raised by an attempt.
 
-                if not _tries:
-                    self.logger.error(
-                        "Request Retry: Expected: {}: Exhausted Retries".format(base_class_name(error_exception))
-                    )
-                    raise
+        Raises exception if it is not a retry candidate or if retries are exhausted.
 
-            except TuneRequestBaseError as tmv_ex:
-                error_exception = tmv_ex
-                tmv_ex_extra = tmv_ex.to_dict()
-                tmv_ex_extra.update({
-                    'error_exception': base_class_name(error_exception),
-                    'error_details': get_exception_message(error_exception),
-                    'request_label': request_label
-                })
+        Returns:
+            RetryDecision: Retry candidate.
 
-                if not self.request_retry_excps_func or \
-                        not self.request_retry_excps_func(tmv_ex, request_label):
-                    self.logger.error(
-                        "Request Retry: Integration: {}: Not Retry Candidate".format(base_class_name(error_exception)),
-                        extra=tmv_ex_extra
-                    )
-                    raise
+        """
+        request_label = request_context.request_label
 
-                self.logger.warning(
-                    "Request Retry: Integration: {}: Retry Candidate".format(base_class_name(error_exception)),
-                    extra=tmv_ex_extra
-                )
+        retry_decision = request_context.request_retry_classifier.classify_excp(excp, request_label)
+        excp_kind = retry_decision.excp_kind
+        excp_name = base_class_name(excp)
 
-                if not _tries:
-                    self.logger.error(
-                        "Request Retry: Integration: {}: Exhausted Retries".format(base_class_name(error_exception))
-                    )
-                    raise
+        excp_extra = excp.to_dict() if isinstance(excp, TuneRequestBaseError) else {}
+        excp_extra.update({
+            'error_exception': excp_name,
+            'error_details': get_exception_message(excp),
+            'retry_reason': retry_decision.reason,
+            'request_url': request_url,
+            'request_label': request_label
+        })
 
-            except Exception as ex:
-                error_exception = ex
-                ex_extra = {
-                    'error_exception': base_class_name(error_exception),
-                    'error_details': get_exception_message(error_exception),
+        if not retry_decision.retry:
+            self.logger.error(
+                "Request Retry: {}: {}: Not Retry Candidate".format(excp_kind, excp_name), extra=excp_extra
+            )
+            raise excp
+
+        self.logger.warning("Request Retry: {}: {}: Retry Candidate".format(excp_kind, excp_name), extra=excp_extra)
+
+        if tries:
+            return retry_decision
+
+        if excp_kind == RetryExcpKind.UNEXPECTED:
+            raise TuneRequestModuleError(
+                error_message="Unexpected: {}".format(excp_name),
+                errors=excp,
+                error_request_curl=request_context.built_request_curl,
+                error_code=TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED
+            )
+
+        self.logger.error("Request Retry: {}: {}: Exhausted Retries".format(excp_kind, excp_name))
+        raise excp
+
+    def _request_retry_http_status(self, tries, retry_decision, request_context):
+        """Request Retry: Tries left once attempt is retried upon its HTTP status,
+        0 if attempts answered by HTTP status codes retried upon are exhausted.
+        """
+        if retry_decision.http_status_code is None or request_context.retry_http_status_tries is None:
+            return tries
+
+        request_context.retry_http_status_tries -= 1
+        if request_context.retry_http_status_tries > 0:
+            return tries
+
+        self.logger.warning(
+            "Request Retry: HTTP Status: {}: Exhausted Retries".format(retry_decision.http_status_code),
+            extra={'request_label': request_context.request_label}
+        )
+        return 0
+
+    def _request_retry_exhausted(self, attempts, tries, request_url, request_context):
+        request_label = request_context.request_label
+
+        if tries and request_context.retry_budget is not None and \
+                not request_context.retry_budget.withdraw():
+            self.logger.error(
+                "Request Retry: Retry Budget Exhausted",
+                extra={
+                    'attempts': attempts,
+                    'tries': tries,
                     'request_url': request_url,
                     'request_label': request_label
                 }
+            )
 
-                if not self.request_retry_excps_func or \
-                        not self.request_retry_excps_func(error_exception, request_label):
-                    self.logger.error(
-                        "Request Retry: Unexpected: {}: Not Retry Candidate".format(base_class_name(error_exception)),
-                        extra=ex_extra
-                    )
-                    raise
+            raise TuneRequestModuleError(
+                error_message=("Request Retry: Retry Budget Exhausted: {}: {}").format(request_label, request_url),
+                error_request_curl=request_context.built_request_curl,
+                error_code=TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED
+            )
 
-                self.logger.warning(
-                    "Request Retry: Unexpected: {}: Retry Candidate".format(base_class_name(error_exception)),
-                    extra=ex_extra
-                )
+        if tries:
+            return
 
-                if not _tries:
-                    raise TuneRequestModuleError(
-                        error_message="Unexpected: {}".format(base_class_name(error_exception)),
-                        errors=error_exception,
-                        error_request_curl=self.built_request_curl,
-                        error_code=TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED
-                    )
+        self.logger.error(
+            "Request Retry: Exhausted Retries",
+            extra={
+                'attempts': attempts,
+                'tries': tries,
+                'request_url': request_url,
+                'request_label': request_label
+            }
+        )
 
-            if not _tries:
-                self.logger.error(
-                    "Request Retry: Exhausted Retries",
-                    extra={
-                        'attempts': _attempts,
-                        'tries': _tries,
-                        'request_url': request_url,
-                        'request_label': request_label
-                    }
-                )
+        raise TuneRequestModuleError(
+            error_message=("Request Retry: Exhausted Retries: {}: {}").format(request_label, request_url),
+            error_request_curl=request_context.built_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED
+        )
 
-                raise TuneRequestModuleError(
-                    error_message=("Request Retry: Exhausted Retries: {}: {}").format(request_label, request_url),
-                    error_request_curl=self.built_request_curl,
-                    error_code=TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED
-                )
+    def _request_retry_perform(
+        self, tries, delay, timeout, request_url, request_context, delay_source=RetryDelaySource.RETRY_POLICY
+    ):
+        request_label = request_context.request_label
+        self.logger.info(
+            "Request Retry: Performing Retry",
+            extra={
+                'tries': tries,
+                'delay': delay,
+                'delay_source': delay_source,
+                'timeout': timeout,
+                'request_url': request_url,
+                'request_label': request_label
+            }
+        )
+
+    def _request_retry_sleep_delay(self, delay, retry_decision, request_context):
+        """Request Retry: Seconds to sleep before next attempt.
+
+        Server asked delay, from 'Retry-After' or 'X-RateLimit-Reset' headers,
+        takes precedence over delay of retry policy, that of backoff strategy
+        if any; both are capped by max_delay.
 
-            self.logger.info(
-                "Request Retry: Performing Retry",
+        Args:
+            delay: Current delay of retry policy.
+            retry_decision: RetryDecision of last attempt.
+            request_context: Retry policy of this call.
+
+        Returns:
+            tuple: (delay, RetryDelaySource)
+
+        Raises:
+            TuneRequestModuleError: REQ_ERR_DEADLINE_EXCEEDED if no attempt
+                fits deadline after delay.
+
+        """
+        if retry_decision.delay is None:
+            delay_source = RetryDelaySource.RETRY_POLICY
+            if request_context.retry_backoff_delays is not None:
+                delay = next(request_context.retry_backoff_delays)
+                if request_context.retry_max_delay is not None:
+                    delay = min(delay, request_context.retry_max_delay)
+        else:
+            delay, delay_source = retry_decision.delay, retry_decision.delay_source
+            if request_context.retry_max_delay is not None:
+                delay = min(delay, request_context.retry_max_delay)
+
+        request_deadline = request_context.request_deadline
+        if request_deadline is not None and not request_deadline.fits(delay):
+            self.logger.error(
+                "Request Retry: Deadline Exceeded",
                 extra={
-                    'tries': _tries,
-                    'delay': _delay,
-                    'timeout': _timeout,
-                    'request_url': request_url,
-                    'request_label': request_label
+                    'delay': delay,
+                    'delay_source': delay_source,
+                    'deadline_secs': request_deadline.deadline_secs,
+                    'deadline_remaining': request_deadline.remaining,
+                    'request_label': request_context.request_label
                 }
             )
+            request_deadline.exceeded(
+                request_context.request_label, error_request_curl=request_context.built_request_curl
+            )
+
+        return delay, delay_source
+
+    def _request_retry_delay(self, delay, request_context):
+        """Request Retry: Delay before next attempt.
+
+        Args:
+            delay: Current delay.
+            request_context: Retry policy of this call.
+
+        Returns:
+            Next delay with backoff, jitter and max_delay applied.
+
+        """
+        if request_context.retry_backoff_delays is not None:
+            return delay  # Delays are those of backoff strategy.
 
-            time.sleep(_delay)
+        if request_context.retry_backoff and request_context.retry_backoff > 0:
+            delay *= request_context.retry_backoff
 
-            if self.retry_backoff and self.retry_backoff > 0:
-                _delay *= self.retry_backoff
+        if request_context.retry_jitter and request_context.retry_jitter > 0:
+            delay += request_context.retry_jitter
 
-            if self.retry_jitter and self.retry_jitter > 0:
-                _delay += self.retry_jitter
+        if request_context.retry_max_delay is not None:
+            delay = min(delay, request_context.retry_max_delay)
 
-            if self.retry_max_delay is not None:
-                _delay = min(_delay, self.retry_max_delay)
+        return delay
 
     # Request Data
     #
@@ -754,7 +1264,8 @@ class RequestMvIntegration(object):
         build_request_curl=True,
         allow_redirects=True,
         verify=True,
-        stream=False
+        stream=False,
+        request_context=None
     ):
         """Constructs and sends a :class:`Request <Request>`.
 
@@ -779,6 +1290,7 @@ class RequestMvIntegration(object):
                 CA_BUNDLE path can also be provided. Defaults to ``True``.
             stream: (optional) if ``False``, the response content will be
                 immediately downloaded.
+            request_context: (optional) Context of this call, holds built request cUrl.
 
         Returns:
             requests.Response
@@ -790,13 +1302,19 @@ class RequestMvIntegration(object):
         if not request_url:
             raise TuneRequestValueError(error_message="Parameter 'request_url' not defined")
 
-        self.built_request_curl = None
+        if request_context is None:
+            request_context = self._prep_request_retry(request_label=request_label)
 
-        self.logger.debug(
-            "Session: Details",
-            extra={'cookie_payload': self.tune_request.session.cookies.get_dict(),
-                   'request_label': request_label}
-        )
+        request_context.built_request_curl = None
+
+        logger_debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        if logger_debug:
+            self.logger.debug(
+                "Session: Details",
+                extra={'cookie_payload': request_context.tune_request.session.cookies.get_dict(),
+                       'request_label': request_label}
+            )
 
         response = None
         headers = None
@@ -806,27 +1324,26 @@ class RequestMvIntegration(object):
 
         request_method = request_method.upper()
 
-        if request_data and isinstance(request_data, str):
-            if len(request_data) <= 20:
-                request_data_extra = request_data
+        if logger_debug:
+            if request_data and isinstance(request_data, str):
+                if len(request_data) <= 20:
+                    request_data_extra = request_data
+                else:
+                    request_data_extra = request_data[:20] + ' ...'
             else:
-                request_data_extra = request_data[:20] + ' ...'
-        else:
-            request_data_extra = safe_str(request_data)
+                request_data_extra = safe_str(request_data)
 
-        request_extra = {
-            'request_method': request_method,
-            'request_url': request_url,
-            'timeout': timeout,
-            'request_params': safe_dict(request_params),
-            'request_data': request_data_extra,
-            'request_headers': safe_dict(headers),
-            'request_label': request_label
-        }
-
-        self.logger.debug("Send Request: Details: {}".format(request_label), extra=request_extra)
+            request_extra = {
+                'request_method': request_method,
+                'request_url': request_url,
+                'timeout': timeout,
+                'request_params': safe_dict(request_params),
+                'request_data': request_data_extra,
+                'request_headers': safe_dict(headers),
+                'request_label': request_label
+            }
 
-        self.built_request_curl = None
+            self.logger.debug("Send Request: Details: {}".format(request_label), extra=request_extra)
 
         kwargs = {}
         if headers:
@@ -835,7 +1352,7 @@ class RequestMvIntegration(object):
         if request_auth:
             kwargs.update({'auth': request_auth})
 
-        if timeout:
+        if timeout is not None:
             kwargs.update({'timeout': (timeout, timeout)})
 
         if allow_redirects:
@@ -857,7 +1374,7 @@ class RequestMvIntegration(object):
                         urllib.parse.urlencode(request_params)
 
                 if build_request_curl:
-                    self.built_request_curl = command_line_request_curl(
+                    request_context.built_request_curl = LazyRequestCurl(
                         request_method=request_method,
                         request_url=request_url,
                         request_headers=headers,
@@ -867,28 +1384,29 @@ class RequestMvIntegration(object):
                         request_allow_redirects=allow_redirects
                     )
 
-                    self.logger.debug(
-                        "Send Request: Request Base: GET",
-                        extra={
-                            'request_label': request_label,
-                            'request_method': request_method,
-                            'request_curl': self.built_request_curl
-                        }
-                    )
+                    if logger_debug:
+                        self.logger.debug(
+                            "Send Request: Request Base: GET",
+                            extra={
+                                'request_label': request_label,
+                                'request_method': request_method,
+                                'request_curl': str(request_context.built_request_curl)
+                            }
+                        )
 
                 if request_params_encoded:
                     kwargs.update({'params': request_params_encoded})
 
                 kwargs.update({'request_method': 'GET', 'request_url': request_url})
 
-                response = self.tune_request.request(**kwargs)
+                response = request_context.tune_request.request(**kwargs)
 
             elif request_method == 'POST':
                 if request_params:
                     request_url += "?" + urllib.parse.urlencode(request_params)
 
                 if build_request_curl:
-                    self.built_request_curl = command_line_request_curl(
+                    request_context.built_request_curl = LazyRequestCurl(
                         request_method=request_method,
                         request_url=request_url,
                         request_headers=headers,
@@ -899,14 +1417,15 @@ class RequestMvIntegration(object):
                         request_allow_redirects=allow_redirects
                     )
 
-                    self.logger.debug(
-                        "Send Request: Request Base: POST",
-                        extra={
-                            'request_label': request_label,
-                            'request_method': request_method,
-                            'request_curl': self.built_request_curl
-                        }
-                    )
+                    if logger_debug:
+                        self.logger.debug(
+                            "Send Request: Request Base: POST",
+                            extra={
+                                'request_label': request_label,
+                                'request_method': request_method,
+                                'request_curl': str(request_context.built_request_curl)
+                            }
+                        )
 
                 if request_data:
                     kwargs.update({'data': request_data})
@@ -915,14 +1434,14 @@ class RequestMvIntegration(object):
 
                 kwargs.update({'request_method': 'POST', 'request_url': request_url})
 
-                response = self.tune_request.request(**kwargs)
+                response = request_context.tune_request.request(**kwargs)
 
             elif request_method == 'PUT':
                 if request_params:
                     request_url += "?" + urllib.parse.urlencode(request_params)
 
                 if build_request_curl:
-                    self.built_request_curl = command_line_request_curl(
+                    request_context.built_request_curl = LazyRequestCurl(
                         request_method=request_method,
                         request_url=request_url,
                         request_headers=headers,
@@ -932,18 +1451,19 @@ class RequestMvIntegration(object):
                         request_allow_redirects=allow_redirects
                     )
 
-                    self.logger.debug(
-                        "Send Request: Request Base: PUT",
-                        extra={'request_label': request_label,
-                               'request_curl': self.built_request_curl}
-                    )
+                    if logger_debug:
+                        self.logger.debug(
+                            "Send Request: Request Base: PUT",
+                            extra={'request_label': request_label,
+                                   'request_curl': str(request_context.built_request_curl)}
+                        )
 
                 if request_data:
                     kwargs.update({'data': request_data})
 
                 kwargs.update({'request_method': 'PUT', 'request_url': request_url})
 
-                response = self.tune_request.request(**kwargs)
+                response = request_context.tune_request.request(**kwargs)
 
             elif request_method == 'HEAD':
                 if request_params:
@@ -955,7 +1475,19 @@ class RequestMvIntegration(object):
 
                 kwargs.update({'request_method': 'HEAD', 'request_url': request_url})
 
-                response = self.tune_request.request(**kwargs)
+                response = request_context.tune_request.request(**kwargs)
+
+            elif request_method == 'DELETE':
+                if request_params:
+                    request_url += \
+                        "?" + urllib.parse.urlencode(request_params)
+
+                if headers:
+                    kwargs.update({'headers': headers})
+
+                kwargs.update({'request_method': 'DELETE', 'request_url': request_url})
+
+                response = request_context.tune_request.request(**kwargs)
 
             else:
                 raise ValueError("Request: Unexpected 'request_method':'{}'".format(request_method))
@@ -972,31 +1504,16 @@ class RequestMvIntegration(object):
             raise
 
         if response is None:
-            self.logger.error("Failed to get response", extra={'request_curl': self.built_request_curl})
+            self.logger.error(
+                "Failed to get response", extra={'request_curl': safe_str(request_context.built_request_curl)}
+            )
             raise TuneRequestModuleError(
                 error_message="Failed to get response",
                 error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE,
-                error_request_curl=self.built_request_curl
+                error_request_curl=request_context.built_request_curl
             )
 
         http_status_code = response.status_code
-        response_headers = json.loads(json.dumps(dict(response.headers)))
-
-        http_status_type = \
-            http_status_code_to_type(http_status_code)
-        http_status_desc = \
-            http_status_code_to_desc(http_status_code)
-
-        response_extra = {
-            'request_label': request_label,
-            'http_status_code': http_status_code,
-            'http_status_type': http_status_type,
-            'http_status_desc': http_status_desc,
-            'response_headers': safe_dict(response_headers),
-            'request_label': request_label
-        }
-
-        self.logger.debug("Send Request: Response: Details", extra=response_extra)
 
         http_status_successful = is_http_status_type(
             http_status_code=http_status_code, http_status_type=HttpStatusType.SUCCESSFUL
@@ -1006,22 +1523,40 @@ class RequestMvIntegration(object):
             http_status_code=http_status_code, http_status_type=HttpStatusType.REDIRECTION
         )
 
-        if http_status_successful or http_status_redirection:
-            if hasattr(response, 'url') and \
-                    response.url and \
-                    len(response.url) > 0:
-                response_extra.update({'response_url': response.url})
+        http_status_failed = not (http_status_successful or http_status_redirection)
 
-            self.logger.debug(
-                "Send Request: Cookie Payload",
-                extra={'cookie_payload': self.tune_request.session.cookies.get_dict(),
-                       'request_label': request_label}
-            )
+        # Response details are only built if logged, or to report a failed response.
+        if logger_debug or http_status_failed:
+            response_headers = json.loads(json.dumps(dict(response.headers)))
+
+            response_extra = {
+                'request_label': request_label,
+                'http_status_code': http_status_code,
+                'http_status_type': http_status_code_to_type(http_status_code),
+                'http_status_desc': http_status_code_to_desc(http_status_code),
+                'response_headers': safe_dict(response_headers),
+            }
+
+            if logger_debug:
+                self.logger.debug("Send Request: Response: Details", extra=response_extra)
+
+        if not http_status_failed:
+            if logger_debug:
+                self.logger.debug(
+                    "Send Request: Cookie Payload",
+                    extra={'cookie_payload': request_context.tune_request.session.cookies.get_dict(),
+                           'request_label': request_label}
+                )
 
             assert response
             return response
         else:
-            response_extra.update({'error_request_curl': self.built_request_curl})
+            # Built only now that request failed.
+            error_request_curl = request_context.built_request_curl
+            if error_request_curl is not None:
+                error_request_curl = str(error_request_curl)
+
+            response_extra.update({'error_request_curl': error_request_curl})
 
             self.logger.error("Send Request: Response: Failed", extra=response_extra)
 
@@ -1044,9 +1579,9 @@ class RequestMvIntegration(object):
                     extra_error['response_details'] = \
                         error_response_details[:100] + ' ...'
 
-            if self.built_request_curl and \
+            if error_request_curl and \
                     'error_request_curl' not in extra_error:
-                extra_error.update({'error_request_curl': self.built_request_curl})
+                extra_error.update({'error_request_curl': error_request_curl})
 
             self.logger.error("Send Request: Error: Response: Details", extra=extra_error)
 
@@ -1054,7 +1589,8 @@ class RequestMvIntegration(object):
                 'error_status': json_response_error.get("response_status", None),
                 'error_reason': json_response_error.get("response_reason", None),
                 'error_details': json_response_error.get("response_details", None),
-                'error_request_curl': self.built_request_curl
+                'error_request_curl': error_request_curl,
+                'error_headers': response_headers
             }
 
             if http_status_code in [
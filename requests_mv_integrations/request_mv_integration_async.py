@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+
+import asyncio
+import contextvars
+import datetime as dt
+import logging
+from concurrent.futures import (ThreadPoolExecutor)
+
+from logging_mv_integrations import (TuneLoggingFormat)
+
+from requests_mv_integrations import (__python_required_version__)
+from requests_mv_integrations.exceptions import (build_request_error)
+from requests_mv_integrations.support import (python_check_version)
+from .request_mv_integration import (RequestMvIntegration, RequestRetryStep)
+
+python_check_version(__python_required_version__)
+
+# Request context of each AsyncRequestMvIntegration instance, by instance id,
+# within current task: coroutines sharing the loop thread do not share it.
+_REQUEST_CONTEXTS = contextvars.ContextVar('request_contexts', default=None)
+
+
+# @brief Asyncio request with retry class for TUNE Multiverse classes
+#
+# @namespace requests_mv_integrations.AsyncRequestMvIntegration
+class AsyncRequestMvIntegration(RequestMvIntegration):
+    """Asyncio request with retry class for TUNE Multiverse classes.
+
+    Same retry, error-mapping and :class:`TuneRequestBaseError` semantics as
+    :class:`RequestMvIntegration`, but :meth:`request` is a coroutine and
+    delays between retries are awaited instead of blocking a thread.
+
+    Each attempt is sent through the pooled session of :class:`TuneRequest`
+    in an executor, so a thread is held only for the duration of the HTTP
+    exchange itself.
+
+    Context of last request is kept per task, not per thread, as all
+    coroutines of an event loop run in its thread.
+    """
+
+    __executor = None
+
+    @property
+    def request_context(self):
+        """Get Property: Context of last request made by current task.
+        """
+        request_contexts = _REQUEST_CONTEXTS.get()
+        return request_contexts.get(id(self)) if request_contexts else None
+
+    @request_context.setter
+    def request_context(self, value):
+        # Copied: context of a task is inherited by tasks it creates.
+        request_contexts = dict(_REQUEST_CONTEXTS.get() or {})
+        request_contexts[id(self)] = value
+        _REQUEST_CONTEXTS.set(request_contexts)
+
+    def __init__(
+        self,
+        logger_level=logging.INFO,
+        logger_format=TuneLoggingFormat.JSON,
+        tune_request=None,
+        executor=None,
+        max_workers=None,
+        **pool_config
+    ):
+        super(AsyncRequestMvIntegration, self).__init__(
+            logger_level=logger_level,
+            logger_format=logger_format,
+            tune_request=tune_request,
+            **pool_config
+        )
+
+        if executor is None and max_workers:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        self.executor = executor
+
+    @property
+    def executor(self):
+        """Get Property: Executor sending requests, None for the event loop default.
+        """
+        return self.__executor
+
+    @executor.setter
+    def executor(self, value):
+        self.__executor = value
+
+    async def request(
+        self,
+        request_method,
+        request_url,
+        request_params=None,
+        request_data=None,
+        request_json=None,
+        request_retry=None,
+        request_retry_excps=None,
+        request_retry_http_status_codes=None,
+        request_retry_func=None,
+        request_retry_excps_func=None,
+        request_retry_classifier=None,
+        request_deadline=None,
+        request_headers=None,
+        request_auth=None,
+        cookie_payload=None,
+        build_request_curl=True,
+        allow_redirects=True,
+        verify=True,
+        stream=False,
+        request_label=None
+    ):
+        """Request data from remote source with retries.
+
+        Args: See :meth:`RequestMvIntegration.request`.
+
+        Returns:
+            requests.Response
+
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Async Request: Start: {}".format(request_label if request_label else ""))
+
+        kwargs, request_context = self._prep_request(
+            request_method=request_method,
+            request_url=request_url,
+            request_params=request_params,
+            request_data=request_data,
+            request_json=request_json,
+            request_retry=request_retry,
+            request_retry_excps=request_retry_excps,
+            request_retry_http_status_codes=request_retry_http_status_codes,
+            request_retry_func=request_retry_func,
+            request_retry_excps_func=request_retry_excps_func,
+            request_retry_classifier=request_retry_classifier,
+            request_deadline=request_deadline,
+            request_headers=request_headers,
+            request_auth=request_auth,
+            cookie_payload=cookie_payload,
+            build_request_curl=build_request_curl,
+            allow_redirects=allow_redirects,
+            verify=verify,
+            stream=stream,
+            request_label=request_label
+        )
+
+        self.request_context = request_context
+
+        time_start_req = dt.datetime.now()
+
+        request_context.tune_request.acquire()
+        try:
+            response = await self._request_retry_async(
+                call_func=self._request,
+                fargs=None,
+                fkwargs=kwargs,
+                request_context=request_context
+            )
+
+        except Exception as ex:
+            raise build_request_error(ex, error_request_curl=request_context.built_request_curl)
+
+        finally:
+            request_context.tune_request.release()
+
+        self._request_completed(time_start_req, request_context)
+
+        return response
+
+    async def _request_retry_async(
+        self,
+        call_func,
+        fargs=None,
+        fkwargs=None,
+        request_context=None,
+    ):
+        """Request Retry: Coroutine counterpart of :meth:`RequestMvIntegration._request_retry`,
+        driving same steps: attempts are sent in executor and delays awaited.
+        """
+        loop = asyncio.get_running_loop()
+
+        retry_steps = self._request_retry_steps(call_func, fargs, fkwargs, request_context)
+
+        try:
+            retry_step, retry_value = next(retry_steps)
+            while True:
+                try:
+                    if retry_step == RequestRetryStep.SLEEP:
+                        await asyncio.sleep(retry_value)
+                        step_result = None
+                    else:
+                        step_result = await loop.run_in_executor(self.executor, retry_value)
+                except BaseException as ex:
+                    retry_step, retry_value = retry_steps.throw(ex)
+                    continue
+
+                retry_step, retry_value = retry_steps.send(step_result)
+
+        except StopIteration as retry_stop:
+            return retry_stop.value
@@ -6,13 +6,15 @@
 import logging
 import csv
 import datetime as dt
-import gzip
-import http.client as http_client
 import io
+import http.client as http_client
 import json
 import os
 import re
+import threading
 import time
+from concurrent.futures import (ThreadPoolExecutor, as_completed)
+from functools import partial
 
 import requests
 from logging_mv_integrations import (TuneLoggingFormat)
@@ -23,13 +25,31 @@ from requests_mv_integrations.errors import (get_exception_message, TuneRequestE
 from requests_mv_integrations.exceptions.custom import (TuneRequestModuleError,)
 from requests_mv_integrations.support import (
     base_class_name,
+    BomStreamStripper,
     convert_size,
+    csv_column_batches,
+    csv_response_text,
     csv_skip_last_row,
+    csv_stream_rows,
+    CsvBatchFormat,
+    CsvRowFormat,
     detect_bom,
+    DOWNLOAD_CHUNK_SIZE,
+    DownloadDurability,
+    DownloadFileWriter,
+    DownloadRangeRefused,
+    download_segments_plan,
+    GzipStreamDecompressor,
     handle_json_decode_error,
+    JsonStreamParser,
     python_check_version,
-    remove_bom,
+    RequestDeadline,
+    RequestRetryClassifier,
+    ResumableDownload,
+    RETRY_CONNECTION_RESET_EXCPS,
     safe_dict,
+    SegmentFileWriter,
+    validate_response,
 )
 from .request_mv_integration import (RequestMvIntegration)
 
@@ -37,6 +57,21 @@ log = logging.getLogger(__name__)
 
 python_check_version(__python_required_version__)
 
+DOWNLOAD_SEGMENT_RETRY_CLASSIFIER = RequestRetryClassifier(
+    retry_excps=(
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.ConnectionError,
+        http_client.IncompleteRead,
+    ),
+    retry_cause_excps=RETRY_CONNECTION_RESET_EXCPS,
+)
+
+# Tries and delay of a download unless its 'request_retry' sets them.
+DOWNLOAD_RETRY_CONFIG = {
+    "tries": 60,
+    "delay": 10,
+}
+
 
 class RequestMvIntegrationDownload(object):
 
@@ -103,7 +138,16 @@ class RequestMvIntegrationDownload(object):
         csv_header=None,
         encoding_write=None,
         encoding_read=None,
-        decode_unicode=False
+        decode_unicode=False,
+        download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+        download_durability=DownloadDurability.END,
+        download_fsync_interval_mb=None,
+        csv_stream=False,
+        csv_batch_size=None,
+        csv_schema=None,
+        csv_batch_format=CsvBatchFormat.PYTHON,
+        download_segments=None,
+        request_deadline=None
     ):
         """Download and Read CSV file.
 
@@ -116,7 +160,9 @@ class RequestMvIntegrationDownload(object):
                 string for the :class:`Request`.
             request_data: (optional) Dictionary, bytes, or file-like object to
                 send in the body of the :class:`Request`.
-            request_retry: (optional) Retry configuration.
+            request_retry: (optional) Retry configuration. Its tries are
+                shared by the requests of download and their content,
+                default: 60 tries, 10 secs delay.
             request_headers: (optional) Dictionary of HTTP Headers to
                 send with the :class:`Request`.
             request_auth: (optional) Auth tuple to enable
@@ -135,9 +181,29 @@ class RequestMvIntegrationDownload(object):
             encoding_write:
             encoding_read:
             decode_unicode:
+            download_chunk_size: (optional) Bytes read from response per chunk.
+            download_durability: (optional) DownloadDurability policy of downloaded file.
+            download_fsync_interval_mb: (optional) Megabytes written between fsync
+                for DownloadDurability.INTERVAL.
+            csv_stream: (optional) If True, read rows straight from response
+                without temporary file. Response is not requested again if
+                its body breaks off while reading.
+            csv_batch_size: (optional) If set, yield batches of this many rows
+                as typed columns instead of rows.
+            csv_schema: (optional) Dictionary of column types (int, float or
+                str) by column name for batches, else types are inferred from
+                first batch and kept for later ones.
+            csv_batch_format: (optional) CsvBatchFormat of batches: 'python'
+                (default), 'numpy' or 'arrow'.
+            download_segments: (optional) If set, and server accepts byte ranges,
+                download this many segments concurrently. GET requests
+                without body only: segments are requested by HEAD and GET.
+            request_deadline: (optional) Seconds, or RequestDeadline, download
+                must complete within, all requests and retries included.
 
         Returns:
-            Generator containing CSV data by rows in JSON dictionary format.
+            Generator containing CSV data by rows in JSON dictionary format,
+            or by batches of columns if csv_batch_size.
 
         """
         log.info(
@@ -151,12 +217,31 @@ class RequestMvIntegrationDownload(object):
         )
 
         timer_start = dt.datetime.now()
+        request_deadline = RequestDeadline.from_value(request_deadline)
+
+        tmp_csv_file_path = None
+        if download_segments and not csv_stream and self._download_ranges_allowed(request_method, request_data):
+            (tmp_csv_file_path, tmp_csv_file_size) = self.download_ranges(
+                request_url=request_url,
+                tmp_directory=tmp_directory,
+                tmp_file_name=tmp_csv_file_name,
+                request_params=request_params,
+                request_headers=request_headers,
+                request_auth=request_auth,
+                verify=verify,
+                request_label=request_label,
+                download_segments=download_segments,
+                download_chunk_size=download_chunk_size,
+                download_durability=download_durability,
+                request_deadline=request_deadline
+            )
+
+        request_attempts = self.mv_request.request_attempts if tmp_csv_file_path is not None else 0
 
         _attempts = 0
-        _tries = 60
-        _delay = 10
+        _tries, _delay = self._download_retry_policy(request_retry)
 
-        while _tries:
+        while _tries and tmp_csv_file_path is None:
             _attempts += 1
 
             log.info(
@@ -170,7 +255,7 @@ class RequestMvIntegrationDownload(object):
                 request_url=request_url,
                 request_params=request_params,
                 request_data=request_data,
-                request_retry=request_retry,
+                request_retry=dict(request_retry or {}, tries=_tries),
                 request_retry_func=request_retry_func,
                 request_retry_excps=request_retry_excps,
                 request_retry_http_status_codes=request_retry_http_status_codes,
@@ -181,6 +266,7 @@ class RequestMvIntegrationDownload(object):
                 allow_redirects=allow_redirects,
                 verify=verify,
                 stream=True,
+                request_deadline=request_deadline,
                 request_label=request_label
             )
 
@@ -195,31 +281,34 @@ class RequestMvIntegrationDownload(object):
                     error_message="Request CSV Download: No response", error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST
                 )
 
-            http_status_code = response.status_code
-
-            timer_end = dt.datetime.now()
-            timer_delta = timer_end - timer_start
-            response_time_secs = timer_delta.seconds
-            response_headers = None
-
-            if hasattr(response, 'headers'):
-                response_headers = \
-                    json.loads(
-                        json.dumps(
-                            dict(response.headers)
+            if log.isEnabledFor(logging.DEBUG):
+                timer_end = dt.datetime.now()
+                timer_delta = timer_end - timer_start
+                response_time_secs = timer_delta.seconds
+                response_headers = None
+
+                if hasattr(response, 'headers'):
+                    response_headers = \
+                        json.loads(
+                            json.dumps(
+                                dict(response.headers)
+                            )
                         )
-                    )
 
-            log.debug(
-                "Request CSV Download: Response Status",
-                extra={
-                    'http_status_code': http_status_code,
-                    'response_time_secs': response_time_secs,
-                    'response_url': response.url,
-                    'response_headers': safe_dict(response_headers),
-                    'request_label': request_label
-                }
-            )
+                log.debug(
+                    "Request CSV Download: Response Status",
+                    extra={
+                        'http_status_code': response.status_code,
+                        'response_time_secs': response_time_secs,
+                        'response_url': response.url,
+                        'response_headers': safe_dict(response_headers),
+                        'request_label': request_label
+                    }
+                )
+
+            if csv_stream:
+                request_attempts += self.mv_request.request_attempts
+                break
 
             (tmp_csv_file_path, tmp_csv_file_size) = self.download_csv(
                 response,
@@ -227,13 +316,19 @@ class RequestMvIntegrationDownload(object):
                 tmp_csv_file_name,
                 request_label=request_label,
                 encoding_write=encoding_write,
-                decode_unicode=decode_unicode
+                decode_unicode=decode_unicode,
+                download_chunk_size=download_chunk_size,
+                download_durability=download_durability,
+                download_fsync_interval_mb=download_fsync_interval_mb,
+                verify=verify
             )
 
+            request_attempts += self.mv_request.request_attempts
+
             if tmp_csv_file_path is not None:
                 break
 
-            _tries -= 1
+            _tries = self._download_tries_left(_tries)
             if not _tries:
                 log.error(
                     "Request CSV Download: Exhausted Retries",
@@ -255,19 +350,39 @@ class RequestMvIntegrationDownload(object):
                        'request_label': request_label}
             )
 
-            time.sleep(_delay)
+            time.sleep(self._download_retry_delay(_delay, request_deadline, request_url, request_label))
 
-        log.info(
-            "Request CSV Download: Downloaded",
-            extra={
-                'request_label': request_label,
-                'file_path': tmp_csv_file_path,
-                'file_size': convert_size(tmp_csv_file_size),
-                'encoding_read': encoding_read
-            }
-        )
+        if csv_stream:
+            log.info(
+                "Request CSV Download: Streaming",
+                extra={'request_label': request_label,
+                       'request_attempts': request_attempts,
+                       'encoding_read': encoding_read}
+            )
+
+            csv_file_r = csv_response_text(response, encoding_read=encoding_read, chunk_size=download_chunk_size)
+        else:
+            log.info(
+                "Request CSV Download: Downloaded",
+                extra={
+                    'request_label': request_label,
+                    'request_attempts': request_attempts,
+                    'file_path': tmp_csv_file_path,
+                    'file_size': convert_size(tmp_csv_file_size),
+                    'encoding_read': encoding_read
+                }
+            )
+
+            bom_enc, bom_len, bom_header = detect_bom(tmp_csv_file_path)
+            if bom_len > 0:
+                # Segmented download keeps BOM within file: read past it.
+                csv_file_rb = open(file=tmp_csv_file_path, mode='rb')
+                csv_file_rb.seek(bom_len)
+                csv_file_r = io.TextIOWrapper(csv_file_rb, encoding=encoding_read)
+            else:
+                csv_file_r = open(file=tmp_csv_file_path, mode='r', encoding=encoding_read)
 
-        with open(file=tmp_csv_file_path, mode='r', encoding=encoding_read) as csv_file_r:
+        with csv_file_r:
             if read_first_row:
                 csv_report_name = csv_file_r.readline()
                 csv_report_name = re.sub('\"', '', csv_report_name)
@@ -290,6 +405,21 @@ class RequestMvIntegrationDownload(object):
 
             csv_fieldnames = csv_header if csv_header else csv_header_actual
 
+            if csv_batch_size:
+                csv_rows = filter(None, csv.reader(csv_file_r, delimiter=csv_delimiter))
+                if skip_last_row:
+                    csv_rows = csv_skip_last_row(csv_rows)
+
+                for batch in csv_column_batches(
+                    csv_rows,
+                    csv_fieldnames,
+                    batch_size=csv_batch_size,
+                    csv_schema=csv_schema,
+                    csv_batch_format=csv_batch_format
+                ):
+                    yield batch
+                return
+
             csv_dict_reader = csv.DictReader(csv_file_r, fieldnames=csv_fieldnames, delimiter=csv_delimiter)
 
             if skip_last_row:
@@ -318,7 +448,14 @@ class RequestMvIntegrationDownload(object):
         allow_redirects=True,
         verify=True,
         encoding_write=None,
-        encoding_read=None
+        encoding_read=None,
+        download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+        download_durability=DownloadDurability.END,
+        download_fsync_interval_mb=None,
+        json_stream=False,
+        json_path=None,
+        download_segments=None,
+        request_deadline=None
     ):
         """Download and Read JSON file.
 
@@ -331,7 +468,9 @@ class RequestMvIntegrationDownload(object):
                 string for the :class:`Request`.
             request_data: (optional) Dictionary, bytes, or file-like object to
                 send in the body of the :class:`Request`.
-            request_retry: (optional) Retry configuration.
+            request_retry: (optional) Retry configuration. Its tries are
+                shared by the requests of download and their content,
+                default: 60 tries, 10 secs delay.
             request_headers: (optional) Dictionary of HTTP Headers to
                 send with the :class:`Request`.
             request_auth: (optional) Auth tuple to enable
@@ -344,10 +483,22 @@ class RequestMvIntegrationDownload(object):
                 CA_BUNDLE path can also be provided. Defaults to ``True``.
             encoding_write:
             encoding_read:
-            decode_unicode:
+            download_chunk_size: (optional) Bytes read from response per chunk.
+            download_durability: (optional) DownloadDurability policy of downloaded file.
+            download_fsync_interval_mb: (optional) Megabytes written between fsync
+                for DownloadDurability.INTERVAL.
+            json_stream: (optional) If True, return a generator yielding items of
+                JSON array one at a time instead of loading whole JSON.
+            json_path: (optional) Dotted keys path to JSON array to be
+                streamed, e.g. 'data.records'. Defaults to JSON document itself.
+            download_segments: (optional) If set, and server accepts byte ranges,
+                download this many segments concurrently. GET requests
+                without body only: segments are requested by HEAD and GET.
+            request_deadline: (optional) Seconds, or RequestDeadline, download
+                must complete within, all requests and retries included.
 
         Returns:
-            Generator containing JSON data by rows in JSON dictionary format.
+            JSON data, or Generator of JSON array items if json_stream.
 
         """
         log.debug(
@@ -361,12 +512,37 @@ class RequestMvIntegrationDownload(object):
         )
 
         timer_start = dt.datetime.now()
+        request_deadline = RequestDeadline.from_value(request_deadline)
+
+        response = None
+        json_chunks = None
+        tmp_json_file_path = None
+        if download_segments and self._download_ranges_allowed(request_method, request_data):
+            (tmp_json_file_path, chunk_total_sum) = self.download_ranges(
+                request_url=request_url,
+                tmp_directory=tmp_directory,
+                tmp_file_name=tmp_json_file_name,
+                request_params=request_params,
+                request_headers=request_headers,
+                request_auth=request_auth,
+                verify=verify,
+                request_label=request_label,
+                download_segments=download_segments,
+                download_chunk_size=download_chunk_size,
+                download_durability=download_durability,
+                request_deadline=request_deadline
+            )
+
+            if tmp_json_file_path is not None and detect_bom(tmp_json_file_path)[0] == 'gzip':
+                json_chunks = self._download_gunzip(tmp_json_file_path, download_chunk_size=download_chunk_size)
+
+        downloaded_ranges = tmp_json_file_path is not None
+        request_attempts = self.mv_request.request_attempts if downloaded_ranges else 0
 
         _attempts = 0
-        _tries = 60
-        _delay = 10
+        _tries, _delay = self._download_retry_policy(request_retry)
 
-        while _tries:
+        while _tries and not downloaded_ranges:
             _attempts += 1
 
             log.info(
@@ -381,7 +557,7 @@ class RequestMvIntegrationDownload(object):
                 request_url=request_url,
                 request_params=request_params,
                 request_data=request_data,
-                request_retry=request_retry,
+                request_retry=dict(request_retry or {}, tries=_tries),
                 request_retry_func=request_retry_func,
                 request_retry_excps=request_retry_excps,
                 request_retry_excps_func=request_retry_excps_func,
@@ -391,6 +567,7 @@ class RequestMvIntegrationDownload(object):
                 allow_redirects=allow_redirects,
                 verify=verify,
                 stream=True,
+                request_deadline=request_deadline,
                 request_label=request_label
             )
 
@@ -406,31 +583,30 @@ class RequestMvIntegrationDownload(object):
                     error_code=TuneRequestErrorCodes.REQ_ERR_REQUEST
                 )
 
-            http_status_code = response.status_code
-
-            timer_end = dt.datetime.now()
-            timer_delta = timer_end - timer_start
-            response_time_secs = timer_delta.seconds
-            response_headers = None
-
-            if hasattr(response, 'headers'):
-                response_headers = \
-                    json.loads(
-                        json.dumps(
-                            dict(response.headers)
+            if log.isEnabledFor(logging.DEBUG):
+                timer_end = dt.datetime.now()
+                timer_delta = timer_end - timer_start
+                response_time_secs = timer_delta.seconds
+                response_headers = None
+
+                if hasattr(response, 'headers'):
+                    response_headers = \
+                        json.loads(
+                            json.dumps(
+                                dict(response.headers)
+                            )
                         )
-                    )
 
-            log.debug(
-                "Request JSON Download: Response Status",
-                extra={
-                    'http_status_code': http_status_code,
-                    'response_time_secs': response_time_secs,
-                    'response_url': response.url,
-                    'response_headers': safe_dict(response_headers),
-                    'request_label': request_label
-                }
-            )
+                log.debug(
+                    "Request JSON Download: Response Status",
+                    extra={
+                        'http_status_code': response.status_code,
+                        'response_time_secs': response_time_secs,
+                        'response_url': response.url,
+                        'response_headers': safe_dict(response_headers),
+                        'request_label': request_label
+                    }
+                )
 
             if not os.path.exists(tmp_directory):
                 os.mkdir(tmp_directory)
@@ -466,26 +642,34 @@ class RequestMvIntegrationDownload(object):
                            'request_label': request_label}
                 )
 
-                _tries -= 1
                 error_exception = None
                 error_details = None
-                chunk_size = 8192
+                json_raw_writer = DownloadFileWriter(
+                    json_raw_file_w,
+                    durability=download_durability,
+                    fsync_interval_mb=download_fsync_interval_mb
+                )
+                json_resumable = ResumableDownload(response, send_func=self._download_resume_send(verify))
                 try:
-                    raw_response = response.raw
-                    while True:
-                        chunk = raw_response.read(chunk_size, decode_content=True)
-                        if not chunk:
-                            break
+                    try:
+                        json_chunks = GzipStreamDecompressor(
+                            json_resumable.iter_content(chunk_size=download_chunk_size),
+                            max_chunk_size=download_chunk_size
+                        )
 
-                        chunk_total_sum += chunk_size
+                        for chunk in json_chunks:
+                            json_raw_writer.write(chunk)
+                            chunk_total_sum = json_raw_writer.bytes_written
 
-                        json_raw_file_w.write(chunk)
-                        json_raw_file_w.flush()
-                        os.fsync(json_raw_file_w.fileno())
+                        json_raw_writer.finish()
+                    finally:
+                        request_attempts += self.mv_request.request_attempts
+                        _tries = self._download_tries_left(_tries)
 
                     log.debug(
                         "Request JSON Download: By Chunk: Completed",
                         extra={'file_path': tmp_json_file_path,
+                               'resumes': json_resumable.resumes,
                                'request_label': request_label}
                     )
 
@@ -576,10 +760,9 @@ class RequestMvIntegrationDownload(object):
                     }
                 )
 
-                time.sleep(_delay)
+                time.sleep(self._download_retry_delay(_delay, request_deadline, request_url, request_label))
 
         tmp_json_file_size = os.path.getsize(tmp_json_file_path)
-        bom_enc, bom_len, bom_header = detect_bom(tmp_json_file_path)
 
         log.info(
             "Request JSON Download: By Chunk: Completed: Details",
@@ -587,25 +770,12 @@ class RequestMvIntegrationDownload(object):
                 'file_path': tmp_json_file_path,
                 'file_size': convert_size(tmp_json_file_size),
                 'chunk_total_sum': chunk_total_sum,
-                'bom_encoding': bom_enc
+                'request_attempts': request_attempts,
+                'is_gzip': json_chunks.is_gzip if json_chunks else False,
+                'gzip_size': convert_size(json_chunks.bytes_compressed) if json_chunks and json_chunks.is_gzip else None
             }
         )
 
-        if bom_enc == 'gzip':
-            tmp_json_gz_file_path = "{}.gz".format(tmp_json_file_path)
-
-            os.rename(src=tmp_json_file_path, dst=tmp_json_gz_file_path)
-
-            with open(file=tmp_json_file_path, mode=mode_write, encoding=encoding_write) as json_file_w:
-                log.debug(
-                    "Request JSON Download: GZip: Started",
-                    extra={'file_path': tmp_json_file_path,
-                           'request_label': request_label}
-                )
-
-                with gzip.open(tmp_json_gz_file_path, 'r') as gzip_file_r:
-                    json_file_w.write(gzip_file_r.read())
-
         response_extra = {
             'file_path': tmp_json_file_path,
             'file_size': convert_size(tmp_json_file_size),
@@ -614,9 +784,22 @@ class RequestMvIntegrationDownload(object):
 
         log.info("Request JSON Download: Read Downloaded", extra=response_extra)
 
+        if json_stream:
+            return self._read_json_stream(
+                tmp_json_file_path=tmp_json_file_path,
+                response=response,
+                response_extra=response_extra,
+                json_path=json_path,
+                encoding_read=encoding_read,
+                download_chunk_size=download_chunk_size,
+                request_label=request_label
+            )
+
         json_download = None
         with open(tmp_json_file_path, mode='r') as json_file_r:
             json_file_content = json_file_r.read()
+            if json_file_content.startswith('\ufeff'):
+                json_file_content = json_file_content[1:]
             try:
                 json_download = json.loads(json_file_content)
             except json.decoder.JSONDecodeError as json_decode_ex:
@@ -659,8 +842,450 @@ class RequestMvIntegrationDownload(object):
 
         return json_download
 
+    def _read_json_stream(
+        self,
+        tmp_json_file_path,
+        response,
+        response_extra,
+        json_path=None,
+        encoding_read=None,
+        download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+        request_label=None
+    ):
+        """Yield items of JSON array from downloaded JSON file, reading it by chunk.
+        """
+        with open(tmp_json_file_path, mode='rb') as json_file_r:
+            json_items = JsonStreamParser(
+                iter(lambda: json_file_r.read(download_chunk_size), b''),
+                json_path=json_path,
+                encoding=encoding_read or 'utf-8'
+            )
+
+            try:
+                for json_item in json_items:
+                    yield json_item
+
+            except ValueError as json_decode_ex:
+                response_extra.update({'json_path': json_path, 'json_items_count': json_items.items_count})
+
+                handle_json_decode_error(
+                    response_decode_ex=json_decode_ex,
+                    response=response,
+                    response_extra=response_extra,
+                    request_label=request_label,
+                    request_curl=self.built_request_curl
+                )
+
+        response_extra.update({'json_items_count': json_items.items_count})
+
+        log.info("Request JSON Download: Finished", extra=response_extra)
+
+    def stream_json(
+        self,
+        request_url,
+        request_params=None,
+        json_path=None,
+        request_retry=None,
+        request_headers=None,
+        chunk_size=DOWNLOAD_CHUNK_SIZE,
+        request_label="Stream JSON"
+    ):
+        """Stream JSON and Yield items of JSON array as response body arrives.
+
+        Args:
+            request_url:
+            request_params:
+            json_path: Dotted keys path to JSON array, e.g. 'data.records'.
+            request_retry:
+            request_headers:
+            chunk_size:
+            request_label:
+
+        Returns:
+            Generator of JSON array items.
+
+        """
+        log.info("Stream JSON: Start", extra={'request_url': request_url, 'request_label': request_label})
+
+        response = self.mv_request.request(
+            request_method="GET",
+            request_url=request_url,
+            request_params=request_params,
+            request_retry=request_retry,
+            request_headers=request_headers,
+            stream=True,
+            request_label=request_label
+        )
+
+        raw_response = response.raw
+        json_items = JsonStreamParser(
+            GzipStreamDecompressor(
+                iter(lambda: raw_response.read(chunk_size, decode_content=True), b''),
+                max_chunk_size=chunk_size
+            ),
+            json_path=json_path
+        )
+
+        try:
+            for json_item in json_items:
+                yield json_item
+
+        except ValueError as json_decode_ex:
+            handle_json_decode_error(
+                response_decode_ex=json_decode_ex,
+                response=response,
+                response_extra={'json_path': json_path,
+                                'json_items_count': json_items.items_count},
+                request_label=request_label,
+                request_curl=self.built_request_curl
+            )
+
+        finally:
+            response.close()
+
+        log.info(
+            "Stream JSON: Finished",
+            extra={'json_items_count': json_items.items_count,
+                   'request_label': request_label}
+        )
+
+    def download_ranges(
+        self,
+        request_url,
+        tmp_directory,
+        tmp_file_name,
+        request_params=None,
+        request_headers=None,
+        request_auth=None,
+        verify=True,
+        request_label=None,
+        download_segments=4,
+        download_segment_tries=3,
+        download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+        download_durability=DownloadDurability.END,
+        request_deadline=None
+    ):
+        """Download file by concurrent byte ranges into a preallocated file.
+
+        Each segment is requested through pooled session of :class:`TuneRequest`
+        with 'Range' header, written in place by position, and retried on its
+        own from where it broke off. Attempts of segments are added to those
+        of the HEAD request, so that 'request_attempts' of current thread
+        reports those of whole download.
+
+        Args:
+            request_url: URL of file.
+            tmp_directory: Temporary directory to hold downloaded file.
+            tmp_file_name: Temporary name for downloaded file.
+            request_params: (optional) Dictionary or bytes to be sent in the query
+                string for the :class:`Request`.
+            request_headers: (optional) Dictionary of HTTP Headers.
+            request_auth: (optional) Auth tuple.
+            verify: (optional) whether the SSL cert will be verified.
+            request_label: (optional) Label of request.
+            download_segments: (optional) Maximum number of concurrent segments.
+            download_segment_tries: (optional) Tries of each segment.
+            download_chunk_size: (optional) Bytes read from response per chunk.
+            download_durability: (optional) DownloadDurability policy of downloaded file.
+            request_deadline: (optional) Seconds, or RequestDeadline, download
+                must complete within.
+
+        Returns:
+            (file path, file size), or (None, 0) if server does not support
+            byte ranges of file, or refuses those of a segment: caller then
+            downloads file as a single stream.
+
+        """
+        request_deadline = RequestDeadline.from_value(request_deadline)
+
+        response = self.mv_request.request(
+            request_method='HEAD',
+            request_url=request_url,
+            request_params=request_params,
+            request_headers=request_headers,
+            request_auth=request_auth,
+            verify=verify,
+            request_deadline=request_deadline,
+            request_label=request_label
+        )
+
+        accept_ranges = response.headers.get('Accept-Ranges', '').lower()
+        content_encoding = response.headers.get('Content-Encoding', 'identity').lower()
+        content_length = response.headers.get('Content-Length', '')
+
+        if accept_ranges != 'bytes' or content_encoding != 'identity' or not content_length.isdigit():
+            log.info(
+                "Download Ranges: Not Supported",
+                extra={'accept_ranges': accept_ranges,
+                       'content_encoding': content_encoding,
+                       'content_length': content_length,
+                       'request_label': request_label}
+            )
+            return (None, 0)
+
+        content_length = int(content_length)
+        segments_plan = download_segments_plan(content_length, download_segments)
+
+        if not os.path.exists(tmp_directory):
+            os.mkdir(tmp_directory)
+
+        tmp_file_path = \
+            "{tmp_directory}/{tmp_file_name}".format(
+                tmp_directory=tmp_directory,
+                tmp_file_name=tmp_file_name
+            )
+
+        log.info(
+            "Download Ranges: Start",
+            extra={'file_path': tmp_file_path,
+                   'content_length': convert_size(content_length),
+                   'segments': len(segments_plan),
+                   'request_label': request_label}
+        )
+
+        timer_start = dt.datetime.now()
+        segments_abort = threading.Event()
+        segments_refused = None
+
+        with SegmentFileWriter(tmp_file_path, content_length) as file_writer:
+            with ThreadPoolExecutor(max_workers=max(1, len(segments_plan))) as executor:
+                segment_futures = [
+                    executor.submit(
+                        self._download_range_segment,
+                        file_writer=file_writer,
+                        segments_abort=segments_abort,
+                        range_start=range_start,
+                        range_end=range_end,
+                        request_url=request_url,
+                        request_params=request_params,
+                        request_headers=request_headers,
+                        request_auth=request_auth,
+                        verify=verify,
+                        request_label=request_label,
+                        download_segment_tries=download_segment_tries,
+                        download_chunk_size=download_chunk_size,
+                        request_deadline=request_deadline
+                    ) for range_start, range_end in segments_plan
+                ]
+
+                try:
+                    for segment_future in as_completed(segment_futures):
+                        self.mv_request.request_context.request_attempts += segment_future.result()
+                except DownloadRangeRefused as range_refused_ex:
+                    segments_abort.set()
+                    segments_refused = range_refused_ex
+                except Exception:
+                    segments_abort.set()
+                    raise
+
+            if segments_refused is None:
+                file_writer.finish(fsync=(download_durability != DownloadDurability.NONE))
+
+        if segments_refused is not None:
+            log.warning(
+                "Download Ranges: Refused: Single Stream",
+                extra={'http_status_code': segments_refused.http_status_code,
+                       'request_label': request_label}
+            )
+            os.remove(tmp_file_path)
+            return (None, 0)
+
+        tmp_file_size = os.path.getsize(tmp_file_path)
+
+        log.info(
+            "Download Ranges: Completed",
+            extra={'file_path': tmp_file_path,
+                   'file_size': convert_size(tmp_file_size),
+                   'segments': len(segments_plan),
+                   'request_attempts': self.mv_request.request_attempts,
+                   'download_secs': (dt.datetime.now() - timer_start).total_seconds(),
+                   'request_label': request_label}
+        )
+
+        return (tmp_file_path, tmp_file_size)
+
+    def _download_range_segment(
+        self,
+        file_writer,
+        segments_abort,
+        range_start,
+        range_end,
+        request_url,
+        request_params=None,
+        request_headers=None,
+        request_auth=None,
+        verify=True,
+        request_label=None,
+        download_segment_tries=3,
+        download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+        request_deadline=None
+    ):
+        """Download one byte range segment, resuming from last written offset upon failure.
+
+        Tries are shared by the requests of segment: each attempt they send
+        takes one, whether the request or its content fails.
+
+        Returns:
+            Attempts sent.
+
+        """
+        offset = range_start
+        _tries = download_segment_tries
+        request_attempts = 0
+
+        while True:
+            segment_headers = dict(request_headers or {})
+            segment_headers['Range'] = "bytes={}-{}".format(offset, range_end)
+
+            try:
+                response = self.mv_request.request(
+                    request_method='GET',
+                    request_url=request_url,
+                    request_params=request_params,
+                    request_headers=segment_headers,
+                    request_retry={'tries': _tries},
+                    request_auth=request_auth,
+                    build_request_curl=False,
+                    verify=verify,
+                    stream=True,
+                    request_deadline=request_deadline,
+                    request_label=request_label
+                )
+
+                if response.status_code != 206:
+                    response.close()
+                    raise DownloadRangeRefused(response.status_code)
+
+                with response:
+                    for chunk in response.iter_content(chunk_size=download_chunk_size):
+                        if segments_abort.is_set():
+                            return request_attempts + self.mv_request.request_attempts
+                        chunk = chunk[:range_end + 1 - offset]
+                        file_writer.write_at(offset, chunk)
+                        offset += len(chunk)
+
+                if offset > range_end:
+                    return request_attempts + self.mv_request.request_attempts
+
+                raise http_client.IncompleteRead(b'', range_end + 1 - offset)
+
+            except Exception as segment_ex:
+                if not DOWNLOAD_SEGMENT_RETRY_CLASSIFIER.classify_excp(segment_ex, request_label).retry:
+                    raise
+
+                request_attempts += self.mv_request.request_attempts
+                _tries = self._download_tries_left(_tries)
+
+                log.warning(
+                    "Download Ranges: Segment: Retry",
+                    extra={'range_start': range_start,
+                           'range_end': range_end,
+                           'offset': offset,
+                           'tries': _tries,
+                           'error_exception': base_class_name(segment_ex),
+                           'error_details': get_exception_message(segment_ex),
+                           'request_label': request_label}
+                )
+
+                if not _tries or segments_abort.is_set():
+                    raise
+
+    @staticmethod
+    def _download_ranges_allowed(request_method, request_data=None):
+        """Whether request may be downloaded by segments, requested by HEAD and GET.
+        """
+        return bool(request_method) and request_method.upper() == 'GET' and not request_data
+
+    def _download_retry_policy(self, request_retry):
+        """Tries and delay of a download, from its retry configuration.
+
+        Tries are shared by the requests of download: each attempt they send
+        takes one, whether the request or its content fails, so a download
+        sends no more attempts than configured. Unless configured, they are
+        those downloads always had, see DOWNLOAD_RETRY_CONFIG.
+
+        Returns:
+            tuple: (tries, delay)
+
+        """
+        request_retry = request_retry or {}
+        return (
+            request_retry.get('tries', DOWNLOAD_RETRY_CONFIG['tries']),
+            request_retry.get('delay', DOWNLOAD_RETRY_CONFIG['delay']),
+        )
+
+    def _download_tries_left(self, tries):
+        """Tries left once last request of current thread is done, negative if infinite.
+        """
+        if tries < 0:
+            return tries
+        return max(0, tries - self.mv_request.request_attempts)
+
+    def _download_retry_delay(self, delay, request_deadline, request_url, request_label=None):
+        """Delay before download is retried.
+
+        Raises:
+            TuneRequestModuleError: REQ_ERR_DEADLINE_EXCEEDED if no attempt
+                fits deadline after delay.
+
+        """
+        if request_deadline is not None and not request_deadline.fits(delay):
+            log.error(
+                "Request Download: Deadline Exceeded",
+                extra={'delay': delay,
+                       'deadline_secs': request_deadline.deadline_secs,
+                       'deadline_remaining': request_deadline.remaining,
+                       'request_url': request_url,
+                       'request_label': request_label}
+            )
+            request_deadline.exceeded(request_label, request_url)
+
+        return delay
+
+    def _download_resume_send(self, verify=True):
+        """Function sending requests resuming a download as attempts of last
+        request of current thread: same session, verify, rate limiter,
+        circuit breaker and deadline.
+        """
+        request_context = self.mv_request.request_context
+        if request_context is None:
+            return None
+        return partial(self.mv_request.request_send, request_context=request_context, verify=verify)
+
+    def _download_gunzip(self, tmp_file_path, download_chunk_size=DOWNLOAD_CHUNK_SIZE):
+        """Decompress downloaded gzip file in place, chunk by chunk.
+
+        Returns:
+            GzipStreamDecompressor used, once consumed.
+
+        """
+        tmp_gz_file_path = "{}.gz".format(tmp_file_path)
+        os.rename(src=tmp_file_path, dst=tmp_gz_file_path)
+
+        with open(tmp_gz_file_path, mode='rb') as gz_file_r, open(tmp_file_path, mode='wb') as file_w:
+            gz_chunks = GzipStreamDecompressor(
+                iter(lambda: gz_file_r.read(download_chunk_size), b''),
+                max_chunk_size=download_chunk_size
+            )
+            for chunk in gz_chunks:
+                file_w.write(chunk)
+
+        os.remove(tmp_gz_file_path)
+
+        return gz_chunks
+
     def download_csv(
-        self, response, tmp_directory, tmp_csv_file_name, request_label=None, encoding_write=None, decode_unicode=False
+        self,
+        response,
+        tmp_directory,
+        tmp_csv_file_name,
+        request_label=None,
+        encoding_write=None,
+        decode_unicode=False,
+        download_chunk_size=DOWNLOAD_CHUNK_SIZE,
+        download_durability=DownloadDurability.END,
+        download_fsync_interval_mb=None,
+        verify=True
     ):
         log.debug("Download CSV: Start")
 
@@ -701,20 +1326,32 @@ class RequestMvIntegrationDownload(object):
             error_exception = None
             error_details = None
 
+            csv_writer = DownloadFileWriter(
+                csv_file_wb,
+                durability=download_durability,
+                fsync_interval_mb=download_fsync_interval_mb
+            )
+
+            csv_resumable = ResumableDownload(response, send_func=self._download_resume_send(verify))
+            csv_chunks = csv_resumable.iter_content(chunk_size=download_chunk_size)
+            if decode_unicode:
+                csv_chunks = requests.utils.stream_decode_response_unicode(csv_chunks, response)
+            csv_chunks = BomStreamStripper(csv_chunks)
+
             try:
-                for chunk in response.iter_content(chunk_size=8192, decode_unicode=decode_unicode):
+                for chunk in csv_chunks:
                     if not chunk:
                         break
 
-                    chunk_total_sum += 8192
+                    csv_writer.write(chunk)
+                    chunk_total_sum = csv_writer.bytes_written
 
-                    csv_file_wb.write(chunk)
-                    csv_file_wb.flush()
-                    os.fsync(csv_file_wb.fileno())
+                csv_writer.finish()
 
                 log.debug(
                     "Download CSV: By Chunk: Completed",
                     extra={'file_path': tmp_csv_file_path,
+                           'resumes': csv_resumable.resumes,
                            'request_label': request_label}
                 )
 
@@ -775,7 +1412,6 @@ class RequestMvIntegrationDownload(object):
                 raise
 
         tmp_csv_file_size = os.path.getsize(tmp_csv_file_path)
-        bom_enc, bom_len, bom_header = detect_bom(tmp_csv_file_path)
 
         log.debug(
             "Download CSV: By Chunk: Completed: Details",
@@ -783,31 +1419,11 @@ class RequestMvIntegrationDownload(object):
                 'file_path': tmp_csv_file_path,
                 'file_size': convert_size(tmp_csv_file_size),
                 'chunk_total_sum': convert_size(chunk_total_sum),
-                'bom_encoding': bom_enc
+                'bom_encoding': csv_chunks.bom_enc,
+                'bom_len': csv_chunks.bom_len
             }
         )
 
-        tmp_csv_file_name_wo_ext = \
-            os.path.splitext(
-                os.path.basename(tmp_csv_file_name)
-            )[0]
-
-        tmp_csv_file_path_wo_bom = \
-            "{tmp_directory}/{tmp_csv_file_name}_wo_bom.csv".format(
-                tmp_directory=tmp_directory,
-                tmp_csv_file_name=tmp_csv_file_name_wo_ext
-            )
-
-        if os.path.exists(tmp_csv_file_path_wo_bom):
-            os.remove(tmp_csv_file_path_wo_bom)
-
-        bom_enc, bom_len = remove_bom(tmp_csv_file_path, tmp_csv_file_path_wo_bom)
-
-        log.debug("Download CSV: Encoding", extra={'bom_enc': bom_enc, 'bom_len': bom_len})
-
-        if bom_len > 0:
-            tmp_csv_file_path = tmp_csv_file_path_wo_bom
-
         return (tmp_csv_file_path, tmp_csv_file_size)
 
     def stream_csv(
@@ -817,9 +1433,13 @@ class RequestMvIntegrationDownload(object):
         csv_delimiter=',',
         request_retry=None,
         request_headers=None,
-        chunk_size=1024,
+        chunk_size=DOWNLOAD_CHUNK_SIZE,
         decode_unicode=False,
-        remove_bom_length=0
+        remove_bom_length=0,
+        csv_header=None,
+        csv_row_format=CsvRowFormat.DICT,
+        batch_size=10000,
+        encoding_read=None
     ):
         """Stream CSV and Yield JSON
 
@@ -829,11 +1449,17 @@ class RequestMvIntegrationDownload(object):
             csv_delimiter:
             request_retry:
             request_headers:
-            chunk_size:
-            decode_unicode:
-            remove_bom_length:
+            chunk_size: Bytes read from response per chunk.
+            decode_unicode: Unused, response is decoded using 'encoding_read'.
+            remove_bom_length: Unused, BOM is detected and removed.
+            csv_header: (optional) Header keys, if CSV first row is not header.
+            csv_row_format: (optional) CsvRowFormat: 'dict' (default), 'tuple'
+                or 'columns' batches.
+            batch_size: (optional) Rows per batch for CsvRowFormat.COLUMNS.
+            encoding_read: (optional) Encoding of CSV, default 'utf-8'.
 
         Returns:
+            Generator of CSV rows in 'csv_row_format'.
 
         """
         log.info("Stream CSV: Start", extra={'report_url': request_url})
@@ -857,7 +1483,7 @@ class RequestMvIntegrationDownload(object):
             }
         )
 
-        self.validate_response(response=response, request_label="Stream CSV")
+        validate_response(response=response, request_curl=self.built_request_curl, request_label="Stream CSV")
 
         response_content_type = response.headers.get('Content-Type', None)
         response_transfer_encoding = response.headers.get('Transfer-Encoding', None)
@@ -872,65 +1498,12 @@ class RequestMvIntegrationDownload(object):
             }
         )
 
-        line_count = 0
-        csv_keys_str = None
-        csv_keys_list = None
-        csv_keys_list_len = None
-        pre_str_line = None
-
-        for str_line in response.iter_lines(chunk_size=chunk_size, decode_unicode=decode_unicode):
-
-            if str_line:  # filter out keep-alive new chunks
-                line_count += 1
-
-                if line_count == 1:
-                    if remove_bom_length > 0:
-                        str_line = str_line[remove_bom_length:]
-                    csv_keys_str = str_line
-                    csv_keys_list = csv_keys_str.split(csv_delimiter)
-                    csv_keys_list = [csv_key.strip() for csv_key in csv_keys_list]
-                    csv_keys_list_len = len(csv_keys_list)
-                    continue
-
-                if pre_str_line is not None:
-                    str_line = pre_str_line + str_line
-                    pre_str_line = None
-
-                csv_values_str = str_line.replace('\n', ' ').replace('\r', ' ')
-
-                csv_values_str_io = io.StringIO(csv_values_str)
-                reader = csv.reader(csv_values_str_io, delimiter=csv_delimiter)
-                csv_values_list = None
-                for row in reader:
-                    csv_values_list = row
-
-                csv_values_list_len = len(csv_values_list)
-
-                if csv_values_list_len < csv_keys_list_len:
-                    pre_str_line = str_line
-                    continue
-
-                if csv_keys_list_len != csv_values_list_len:
-                    log.error(
-                        "Mismatch: CSV Key",
-                        extra={
-                            'line': line_count,
-                            'csv_keys_list_len': csv_keys_list_len,
-                            'csv_keys_str': csv_keys_str,
-                            'csv_keys_list': csv_keys_list,
-                            'csv_values_list_len': csv_values_list_len,
-                            'csv_values_str': csv_values_str,
-                            'csv_values_list': csv_values_list,
-                        }
-                    )
-                    raise TuneRequestModuleError(
-                        error_message="Mismatch: CSV Key '{}': Values '{}'".format(csv_keys_str, csv_values_str),
-                        error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE
-                    )
-
-                json_data_row = {}
-                for idx, csv_key in enumerate(csv_keys_list):
-                    csv_value = csv_values_list[idx]
-                    json_data_row.update({csv_key: csv_value.strip('"')})
-
-                yield json_data_row
+        with csv_response_text(response, encoding_read=encoding_read, chunk_size=chunk_size, newline='') as csv_file_r:
+            for row in csv_stream_rows(
+                csv_file_r,
+                csv_delimiter=csv_delimiter,
+                csv_header=csv_header,
+                csv_row_format=csv_row_format,
+                batch_size=batch_size
+            ):
+                yield row
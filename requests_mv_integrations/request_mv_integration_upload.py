@@ -4,8 +4,10 @@
 #  @namespace requests_mv_integrations
 
 import logging
+import os
+from concurrent.futures import (ThreadPoolExecutor)
+from xml.sax.saxutils import (escape)
 
-import requests
 from logging_mv_integrations import (TuneLoggingFormat)
 
 from requests_mv_integrations import (__python_required_version__)
@@ -17,12 +19,22 @@ from requests_mv_integrations.errors import (
 from requests_mv_integrations.exceptions.custom import (
     TuneRequestBaseError,
     TuneRequestModuleError,
+    TuneRequestValueError,
 )
 from requests_mv_integrations.support import (
     base_class_name,
+    convert_size,
+    GzipFileStream,
+    GzipSpooledFile,
     python_check_version,
+    RequestRetryClassifier,
+    RETRY_CONNECTION_RESET_EXCPS,
     REQUEST_RETRY_EXCPS,
     REQUEST_RETRY_HTTP_STATUS_CODES,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_PART_SIZE,
+    UploadFormat,
+    UploadStream,
 )
 from .request_mv_integration import (RequestMvIntegration)
 
@@ -30,6 +42,11 @@ log = logging.getLogger(__name__)
 
 python_check_version(__python_required_version__)
 
+UPLOAD_RETRY_CLASSIFIER = RequestRetryClassifier(retry_cause_excps=RETRY_CONNECTION_RESET_EXCPS)
+
+# Uploads retry connection resets forever, HTTP status codes retried upon this many attempts only.
+UPLOAD_HTTP_STATUS_TRIES = 5
+
 
 class RequestMvIntegrationUpload(object):
 
@@ -67,7 +84,9 @@ class RequestMvIntegrationUpload(object):
         upload_data_file_size,
         is_upload_gzip,
         request_label,
-        upload_timeout=None
+        upload_timeout=None,
+        upload_gzip_level=None,
+        upload_gzip_spool=False
     ):
         """Upload File to requested URL.
 
@@ -76,6 +95,13 @@ class RequestMvIntegrationUpload(object):
             upload_data_file_path:
             upload_data_file_size:
             upload_timeout:
+            upload_gzip_level: (optional) If set and file is not gzip already,
+                gzip file on the fly while uploading at this compression
+                level (1-9); body is then sent chunked, which some servers
+                reject, e.g. S3 presigned PUT URLs.
+            upload_gzip_spool: (optional) If True, with 'upload_gzip_level',
+                gzip file into a spooled temporary file before uploading it,
+                so body is sent with 'Content-Length' instead of chunked.
 
         Returns:
 
@@ -83,11 +109,21 @@ class RequestMvIntegrationUpload(object):
         request_retry_excps = REQUEST_RETRY_EXCPS
         request_retry_http_status_codes = REQUEST_RETRY_HTTP_STATUS_CODES
 
-        upload_request_retry = {"timeout": 60, "tries": -1, "delay": 60}
+        upload_request_retry = {
+            "timeout": 60,
+            "tries": -1,
+            "delay": 60,
+            "http_status_tries": UPLOAD_HTTP_STATUS_TRIES
+        }
+
+        upload_gzip_stream = upload_gzip_level is not None and not is_upload_gzip
 
-        upload_request_headers = {'Content-Length': '{}'.format(upload_data_file_size)}
+        if upload_gzip_stream:
+            upload_request_headers = {}
+        else:
+            upload_request_headers = {'Content-Length': '{}'.format(upload_data_file_size)}
 
-        if is_upload_gzip:
+        if is_upload_gzip or upload_gzip_stream:
             upload_request_headers.update({'Content-Type': 'application/gzip'})
         else:
             upload_request_headers.update({'Content-Type': 'application/json; charset=utf8'})
@@ -100,13 +136,22 @@ class RequestMvIntegrationUpload(object):
             'upload_data_file_path': upload_data_file_path,
             'upload_data_file_size': upload_data_file_size,
             'upload_request_retry': upload_request_retry,
-            'upload_request_headers': upload_request_headers
+            'upload_request_headers': upload_request_headers,
+            'upload_gzip_level': upload_gzip_level if upload_gzip_stream else None,
+            'upload_gzip_spool': upload_gzip_spool if upload_gzip_stream else None
         }
 
         log.debug("Upload: Details", extra=upload_extra)
 
+        if upload_gzip_stream and upload_gzip_spool:
+            upload_fp = GzipSpooledFile(upload_data_file_path, gzip_level=upload_gzip_level)
+        elif upload_gzip_stream:
+            upload_fp = GzipFileStream(upload_data_file_path, gzip_level=upload_gzip_level)
+        else:
+            upload_fp = open(upload_data_file_path, 'rb')
+
         try:
-            with open(upload_data_file_path, 'rb') as upload_fp:
+            with upload_fp:
                 response = self.mv_request.request(
                     request_method="PUT",
                     request_url=upload_request_url,
@@ -147,6 +192,14 @@ class RequestMvIntegrationUpload(object):
                 error_code=TuneRequestErrorCodes.REQ_ERR_UPLOAD_DATA
             )
 
+        if upload_gzip_stream:
+            log.info(
+                "Request Upload: GZip: Completed",
+                extra={'upload_data_file_size': convert_size(upload_fp.bytes_read),
+                       'upload_gzip_size': convert_size(upload_fp.bytes_sent),
+                       'request_label': request_label}
+            )
+
         return response
 
     def request_upload_data(self, upload_request_url, upload_data, upload_data_size, upload_timeout=None):
@@ -167,7 +220,12 @@ class RequestMvIntegrationUpload(object):
         request_retry_excps = REQUEST_RETRY_EXCPS
         request_retry_http_status_codes = REQUEST_RETRY_HTTP_STATUS_CODES
 
-        upload_request_retry = {"timeout": 60, "tries": -1, "delay": 60}
+        upload_request_retry = {
+            "timeout": 60,
+            "tries": -1,
+            "delay": 60,
+            "http_status_tries": UPLOAD_HTTP_STATUS_TRIES
+        }
 
         request_headers = {
             'Content-type': 'application/json; charset=utf8',
@@ -216,69 +274,388 @@ class RequestMvIntegrationUpload(object):
 
         return response
 
-    def _upload_request_retry_excps_func(self, excp, request_label):
-        """Upload Request Retry Exception Function
+    def request_upload_stream(
+        self,
+        upload_request_url,
+        upload_records,
+        request_label,
+        upload_format=UploadFormat.NDJSON,
+        upload_gzip_level=None,
+        upload_data_size=None,
+        upload_chunk_size=UPLOAD_CHUNK_SIZE,
+        upload_progress_func=None,
+        upload_timeout=None,
+        request_method="PUT"
+    ):
+        """Upload records to requested URL, serialized as they are sent.
 
         Args:
-            excp:
+            upload_request_url: URL to upload to.
+            upload_records: Iterable of records, or callable returning a new
+                iterable of same records. Upload is retried only if callable.
+            request_label: Label of request.
+            upload_format: (optional) UploadFormat: 'ndjson' (default), 'json'
+                array, or 'bytes' for records already bytes.
+            upload_gzip_level: (optional) If set, gzip body on the fly at this
+                compression level (1-9).
+            upload_data_size: (optional) Size of body of 'bytes' records, sent
+                as 'Content-Length' instead of chunked transfer encoding.
+            upload_chunk_size: (optional) Bytes per chunk sent.
+            upload_progress_func: (optional) Called with dictionary of
+                'records_count', 'bytes_read', 'bytes_sent', 'elapsed_secs'
+                and 'bytes_per_sec' after each chunk sent.
+            upload_timeout: (optional) Timeout in seconds.
+            request_method: (optional) 'PUT' (default) or 'POST'.
 
         Returns:
+            requests.Response
 
         """
-        error_exception = base_class_name(excp)
-        error_details = get_exception_message(excp)
-
-        if isinstance(excp, TuneRequestBaseError):
-            log.debug(
-                "Request Retry: Upload Exception Func",
-                extra={
-                    'request_label': request_label,
-                    'error_exception': error_exception,
-                    'error_details': error_details
-                }
+        try:
+            upload_stream = UploadStream(
+                upload_records,
+                upload_format=upload_format,
+                gzip_level=upload_gzip_level,
+                chunk_size=upload_chunk_size,
+                content_length=upload_data_size,
+                progress_func=upload_progress_func
             )
-        else:
-            log.debug(
-                "Request Retry: Upload Exception Func: Unexpected",
-                extra={
-                    'request_label': request_label,
-                    'error_exception': error_exception,
-                    'error_details': error_details
-                }
+        except ValueError as ex:
+            raise TuneRequestValueError(error_message=get_exception_message(ex), errors=ex)
+
+        request_retry_excps = REQUEST_RETRY_EXCPS
+        request_retry_http_status_codes = REQUEST_RETRY_HTTP_STATUS_CODES
+
+        upload_request_retry = {
+            "timeout": 60,
+            "tries": -1,
+            "delay": 60,
+            "http_status_tries": UPLOAD_HTTP_STATUS_TRIES
+        }
+        if not upload_stream.is_repeatable:
+            upload_request_retry["tries"] = 1
+
+        if upload_timeout:
+            upload_request_retry["timeout"] = int(upload_timeout)
+
+        upload_request_headers = {'Content-Type': upload_stream.content_type}
+
+        log.info(
+            "Upload Stream: Start",
+            extra={
+                'upload_request_url': upload_request_url,
+                'upload_format': upload_format,
+                'upload_gzip_level': upload_gzip_level,
+                'upload_data_size': upload_data_size,
+                'upload_request_retry': upload_request_retry,
+                'request_label': request_label
+            }
+        )
+
+        try:
+            response = self.mv_request.request(
+                request_method=request_method,
+                request_url=upload_request_url,
+                request_params=None,
+                request_data=upload_stream,
+                request_retry=upload_request_retry,
+                request_headers=upload_request_headers,
+                request_retry_excps=request_retry_excps,
+                request_retry_http_status_codes=request_retry_http_status_codes,
+                request_retry_excps_func=self._upload_request_retry_excps_func,
+                allow_redirects=False,
+                build_request_curl=False,
+                request_label="{}: Request Upload Stream".format(request_label)
             )
+        except TuneRequestBaseError as tmv_ex:
+            tmv_ex_extra = tmv_ex.to_dict()
+            tmv_ex_extra.update({'error_exception': base_class_name(tmv_ex)})
+            tmv_ex_extra.update(upload_stream.upload_progress)
 
-        if isinstance(excp, TuneRequestBaseError) and \
-                excp.error_code == TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT:
-            if error_details.find('RemoteDisconnected') >= 0 or \
-                    error_details.find('ConnectionResetError') >= 0:
-                log.debug(
-                    "Request Retry: Upload Exception Func: Retry",
-                    extra={
-                        'request_label': request_label,
-                        'error_exception': error_exception,
-                        'error_details': error_details
-                    }
-                )
-                return True
-
-        if isinstance(excp, requests.exceptions.ConnectionError):
-            if error_details.find('RemoteDisconnected') >= 0 or \
-                    error_details.find('ConnectionResetError') >= 0:
-                log.debug(
-                    "Request Retry: Upload Exception Func: Retry",
-                    extra={
-                        'request_label': request_label,
-                        'error_exception': error_exception,
-                        'error_details': error_details
-                    }
+            log.error("Upload Stream: Failed", extra=tmv_ex_extra)
+            raise
+
+        except Exception as ex:
+            print_traceback(ex)
+
+            log.error(
+                "Upload Stream: Failed: Unexpected",
+                extra={'error_exception': base_class_name(ex),
+                       'error_details': get_exception_message(ex)}
+            )
+            raise TuneRequestModuleError(
+                error_message=("Upload Stream: Failed: Unexpected: {}: {}").format(
+                    base_class_name(ex), get_exception_message(ex)
+                ),
+                errors=ex,
+                error_code=TuneRequestErrorCodes.REQ_ERR_UPLOAD_DATA
+            )
+
+        upload_extra = upload_stream.upload_progress
+        upload_extra.update({'request_label': request_label})
+
+        log.info("Upload Stream: Completed", extra=upload_extra)
+
+        return response
+
+    def request_upload_multipart(
+        self,
+        upload_part_url_func,
+        upload_data_file_path,
+        request_label,
+        upload_complete_url=None,
+        upload_complete_func=None,
+        upload_abort_url=None,
+        upload_abort_func=None,
+        upload_part_size=UPLOAD_PART_SIZE,
+        upload_workers=4,
+        upload_part_tries=5,
+        upload_timeout=None
+    ):
+        """Upload File in parts concurrently, S3-style multipart upload.
+
+        Each part is sent as one PUT to URL of its part number, retried on its
+        own, and its 'ETag' kept. Once all parts are uploaded, upload is
+        committed by POST of CompleteMultipartUpload XML listing parts to
+        'upload_complete_url', or by calling 'upload_complete_func'.
+
+        If a part fails, parts not started are cancelled and, once parts
+        started are done, upload is aborted by DELETE of 'upload_abort_url',
+        or by calling 'upload_abort_func', so that parts uploaded are not
+        left stored; error of part is then raised.
+
+        Args:
+            upload_part_url_func: Callable returning URL (e.g. presigned) of
+                part number, numbered from 1; called as each part starts, so
+                that URLs of parts waiting for a worker do not expire.
+            upload_data_file_path: Path of file to upload.
+            request_label: Label of request.
+            upload_complete_url: (optional) URL to commit upload to.
+            upload_complete_func: (optional) Callable committing upload, given
+                list of (part number, ETag); its result is returned.
+            upload_abort_url: (optional) URL to abort upload at if a part fails.
+            upload_abort_func: (optional) Callable aborting upload if a part fails.
+            upload_part_size: (optional) Bytes per part, last part excepted.
+            upload_workers: (optional) Parts uploaded concurrently.
+            upload_part_tries: (optional) Tries of each part.
+            upload_timeout: (optional) Timeout in seconds of each part.
+
+        Returns:
+            requests.Response of commit, result of 'upload_complete_func', or
+            list of (part number, ETag) if neither is provided.
+
+        """
+        upload_data_file_size = os.path.getsize(upload_data_file_path)
+        upload_parts_count = max(1, -(-upload_data_file_size // upload_part_size))
+
+        upload_extra = {
+            'upload_data_file_path': upload_data_file_path,
+            'upload_data_file_size': convert_size(upload_data_file_size),
+            'upload_parts_count': upload_parts_count,
+            'upload_workers': upload_workers,
+            'request_label': request_label
+        }
+
+        log.info("Request Upload Multipart: Start", extra=upload_extra)
+
+        upload_request_retry = {"timeout": 60, "tries": upload_part_tries, "delay": 10}
+        if upload_timeout:
+            upload_request_retry["timeout"] = int(upload_timeout)
+
+        upload_parts = None
+        upload_part_ex = None
+
+        with ThreadPoolExecutor(max_workers=upload_workers) as executor:
+            upload_futures = [
+                executor.submit(
+                    self._upload_part,
+                    upload_data_file_path=upload_data_file_path,
+                    upload_part_number=upload_part_number,
+                    upload_part_url_func=upload_part_url_func,
+                    upload_part_offset=(upload_part_number - 1) * upload_part_size,
+                    upload_part_size=upload_part_size,
+                    upload_request_retry=upload_request_retry,
+                    request_label=request_label
+                ) for upload_part_number in range(1, upload_parts_count + 1)
+            ]
+
+            try:
+                upload_parts = [upload_future.result() for upload_future in upload_futures]
+            except Exception as ex:
+                upload_part_ex = ex
+                for upload_future in upload_futures:
+                    upload_future.cancel()
+
+        if upload_part_ex is not None:
+            self._upload_multipart_abort(
+                upload_abort_url=upload_abort_url,
+                upload_abort_func=upload_abort_func,
+                upload_request_retry=upload_request_retry,
+                request_label=request_label
+            )
+            raise upload_part_ex
+
+        log.info("Request Upload Multipart: Parts Uploaded", extra=upload_extra)
+
+        if upload_complete_func:
+            return upload_complete_func(upload_parts)
+
+        if not upload_complete_url:
+            return upload_parts
+
+        upload_complete_xml = "<CompleteMultipartUpload>{}</CompleteMultipartUpload>".format(
+            "".join(
+                "<Part><PartNumber>{}</PartNumber><ETag>{}</ETag></Part>".format(
+                    upload_part_number, escape(upload_part_etag or '')
+                ) for upload_part_number, upload_part_etag in upload_parts
+            )
+        )
+
+        try:
+            response = self.mv_request.request(
+                request_method="POST",
+                request_url=upload_complete_url,
+                request_data=upload_complete_xml.encode('utf-8'),
+                request_retry=upload_request_retry,
+                request_headers={'Content-Type': 'application/xml'},
+                request_retry_excps=REQUEST_RETRY_EXCPS,
+                request_retry_http_status_codes=REQUEST_RETRY_HTTP_STATUS_CODES,
+                request_retry_excps_func=self._upload_request_retry_excps_func,
+                allow_redirects=False,
+                build_request_curl=False,
+                request_label="{}: Request Upload Multipart: Complete".format(request_label)
+            )
+        except TuneRequestBaseError as tmv_ex:
+            tmv_ex_extra = tmv_ex.to_dict()
+            tmv_ex_extra.update({'error_exception': base_class_name(tmv_ex)})
+
+            log.error("Request Upload Multipart: Complete: Failed", extra=tmv_ex_extra)
+            raise
+
+        log.info("Request Upload Multipart: Completed", extra=upload_extra)
+
+        return response
+
+    def _upload_part(
+        self,
+        upload_data_file_path,
+        upload_part_number,
+        upload_part_url_func,
+        upload_part_offset,
+        upload_part_size,
+        upload_request_retry,
+        request_label
+    ):
+        """Upload one part of multipart upload.
+
+        Returns:
+            (part number, ETag)
+
+        """
+        with open(upload_data_file_path, 'rb') as upload_fp:
+            upload_fp.seek(upload_part_offset)
+            upload_part_data = upload_fp.read(upload_part_size)
+
+        upload_part_url = upload_part_url_func(upload_part_number)
+
+        try:
+            response = self.mv_request.request(
+                request_method="PUT",
+                request_url=upload_part_url,
+                request_data=upload_part_data,
+                request_retry=dict(upload_request_retry),
+                request_headers={'Content-Length': '{}'.format(len(upload_part_data))},
+                request_retry_excps=REQUEST_RETRY_EXCPS,
+                request_retry_http_status_codes=REQUEST_RETRY_HTTP_STATUS_CODES,
+                request_retry_excps_func=self._upload_request_retry_excps_func,
+                allow_redirects=False,
+                build_request_curl=False,
+                request_label="{}: Request Upload Multipart: Part {}".format(request_label, upload_part_number)
+            )
+        except TuneRequestBaseError as tmv_ex:
+            tmv_ex_extra = tmv_ex.to_dict()
+            tmv_ex_extra.update({'error_exception': base_class_name(tmv_ex),
+                                 'upload_part_number': upload_part_number})
+
+            log.error("Request Upload Multipart: Part: Failed", extra=tmv_ex_extra)
+            raise
+
+        upload_part_etag = response.headers.get('ETag')
+        if not upload_part_etag:
+            log.error(
+                "Request Upload Multipart: Part: No ETag",
+                extra={'upload_part_number': upload_part_number,
+                       'http_status_code': response.status_code,
+                       'request_label': request_label}
+            )
+            raise TuneRequestModuleError(
+                error_message="Request Upload Multipart: Part {}: No ETag".format(upload_part_number),
+                error_code=TuneRequestErrorCodes.REQ_ERR_UPLOAD_DATA
+            )
+
+        log.debug(
+            "Request Upload Multipart: Part: Uploaded",
+            extra={'upload_part_number': upload_part_number,
+                   'upload_part_size': len(upload_part_data),
+                   'upload_part_etag': upload_part_etag,
+                   'request_label': request_label}
+        )
+
+        return (upload_part_number, upload_part_etag)
+
+    def _upload_multipart_abort(self, upload_abort_url, upload_abort_func, upload_request_retry, request_label):
+        """Abort multipart upload once a part failed.
+
+        Failure to abort is logged, not raised, so that error of part is.
+        """
+        if not upload_abort_url and not upload_abort_func:
+            return
+
+        try:
+            if upload_abort_func:
+                upload_abort_func()
+            else:
+                self.mv_request.request(
+                    request_method="DELETE",
+                    request_url=upload_abort_url,
+                    request_retry=dict(upload_request_retry),
+                    request_retry_excps=REQUEST_RETRY_EXCPS,
+                    request_retry_http_status_codes=REQUEST_RETRY_HTTP_STATUS_CODES,
+                    allow_redirects=False,
+                    build_request_curl=False,
+                    request_label="{}: Request Upload Multipart: Abort".format(request_label)
                 )
-                return True
+        except Exception as ex:
+            log.error(
+                "Request Upload Multipart: Abort: Failed",
+                extra={'error_exception': base_class_name(ex),
+                       'error_details': get_exception_message(ex),
+                       'request_label': request_label}
+            )
+            return
+
+        log.warning("Request Upload Multipart: Aborted", extra={'request_label': request_label})
+
+    def _upload_request_retry_excps_func(self, excp, request_label):
+        """Upload Request Retry Exception Function
+
+        Retries upload whose connection was reset or closed by server.
+
+        Args:
+            excp: Exception raised by upload attempt.
+            request_label: Label
+
+        Returns:
+            True if upload is retried.
+
+        """
+        retry_decision = UPLOAD_RETRY_CLASSIFIER.classify_excp(excp, request_label)
 
         log.debug(
-            "Request Retry: Upload Exception Func: Not Retry",
+            "Request Retry: Upload Exception Func: {}".format("Retry" if retry_decision.retry else "Not Retry"),
             extra={'request_label': request_label,
-                   'error_exception': error_exception,
-                   'error_details': error_details}
+                   'error_exception': base_class_name(excp),
+                   'retry_reason': retry_decision.reason}
         )
 
-        return False
+        return retry_decision.retry
@@ -4,6 +4,7 @@
 #  @namespace requests_mv_integrations
 
 from .bom_encoding import (
+    BomStreamStripper,
     detect_bom,
     get_bom_encoding,
     remove_bom,
@@ -20,7 +21,12 @@ from .constants import (
     REQUEST_RETRY_EXCPS,
     REQUEST_RETRY_HTTP_STATUS_CODES,
 )
-from .curl import (command_line_request_curl)
+from .curl import (command_line_request_curl, LazyRequestCurl)
+from .download_writer import (
+    DOWNLOAD_CHUNK_SIZE,
+    DownloadDurability,
+    DownloadFileWriter,
+)
 from .safe_cast import (
     safe_cast,
     safe_dict,
@@ -29,7 +35,12 @@ from .safe_cast import (
     safe_str,
 )
 from .response import (
+    CsvBatchFormat,
+    CsvRowFormat,
+    csv_column_batches,
+    csv_response_text,
     csv_skip_last_row,
+    csv_stream_rows,
     requests_response_text_html,
     requests_response_text_xml,
     validate_response,
@@ -38,8 +49,59 @@ from .response import (
     build_response_error_details,
     handle_json_decode_error,
 )
-from .tune_request import (TuneRequest)
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    RequestCircuitBreakers,
+)
+from .download_resume import (ResumableDownload)
+from .download_segments import (
+    DOWNLOAD_SEGMENT_MIN_SIZE,
+    DownloadRangeRefused,
+    download_segments_plan,
+    SegmentFileWriter,
+)
+from .gzip_stream import (GzipStreamDecompressor)
+from .json_stream import (JsonStreamParser)
+from .rate_limit import (
+    FileTokenBucket,
+    RateLimitKey,
+    RequestRateLimiter,
+    TokenBucket,
+)
+from .request_context import (RequestContext)
+from .request_deadline import (RequestDeadline)
+from .retry_backoff import (
+    DecorrelatedJitterBackoff,
+    EqualJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+    RetryBudget,
+)
+from .retry_classifier import (
+    excp_chain,
+    RETRY_CONNECT_EXCPS,
+    RETRY_CONNECTION_RESET_EXCPS,
+    RETRY_IDEMPOTENT_METHODS,
+    RETRY_READ_EXCPS,
+    RequestRetryClassifier,
+    retry_after_delay,
+    retry_cause_excps,
+    RetryDecision,
+    RetryDelaySource,
+    RetryExcpKind,
+)
+from .tune_request import (TuneRequest, TuneRetry)
+from .tune_request_registry import (TuneRequestRegistry)
 from .singleton import (Singleton)
+from .upload_stream import (
+    GzipFileStream,
+    GzipSpooledFile,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_PART_SIZE,
+    UploadFormat,
+    UploadStream,
+)
 from .utils import (
     base_class_name,
     full_class_name,
@@ -87,3 +87,47 @@ def remove_bom(filename, newfilename):
                 newfile_wb.write(contents)
 
         return bom_enc, bom_len
+
+
+class BomStreamStripper(object):
+    """Iterate chunks with byte order mark (BOM) removed from the first one.
+
+    BOM is detected on the first bytes as they stream in, so that the file
+    written from chunks needs no rewrite afterwards. Detected encoding and
+    length are available as 'bom_enc' and 'bom_len' once iterated.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+
+        self.bom_enc = None
+        self.bom_len = 0
+        self.bom_header = None
+
+    def __iter__(self):
+        head = None
+        for chunk in self.chunks:
+            if not chunk:
+                continue
+            head = chunk if head is None else head + chunk
+            if isinstance(head, str) or len(head) >= 6:
+                break
+
+        if head is None:
+            self.bom_enc = 'ANSI'
+            return
+
+        if isinstance(head, str):
+            # Decoded chunks: BOM, whatever its encoding, is decoded as U+FEFF.
+            self.bom_enc, self.bom_len = ('UTF-8', 1) if head.startswith('\ufeff') else ('ANSI', 0)
+        else:
+            self.bom_enc, self.bom_len = get_bom_encoding(head)
+
+        self.bom_header = str(head[:6])
+
+        head = head[self.bom_len:]
+        if head:
+            yield head
+
+        for chunk in self.chunks:
+            yield chunk
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Circuit Breaker
+"""
+
+import logging
+import threading
+import time
+import urllib.parse
+
+from requests_mv_integrations.exceptions.custom import (
+    TuneRequestClientError,
+    TuneRequestValueError,
+)
+
+log = logging.getLogger(__name__)
+
+
+class CircuitState(object):
+    """State of a circuit breaker.
+
+    CLOSED: Requests are sent, failures are counted.
+    OPEN: Requests fail fast without being sent.
+    HALF_OPEN: Trial requests are sent to test recovery.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    ALL = (CLOSED, OPEN, HALF_OPEN)
+
+
+class CircuitBreaker(object):
+    """Circuit breaker of one host.
+
+    Opens after 'failure_threshold' consecutive failures. Once open for
+    'recovery_secs', lets 'half_open_trials' trial requests through: it
+    closes upon a trial success and opens again upon a trial failure.
+
+    Args:
+        name: Name, e.g. host, for logging.
+        failure_threshold: (optional) Consecutive failures opening circuit.
+        recovery_secs: (optional) Seconds open before trial requests.
+        half_open_trials: (optional) Concurrent trial requests when half open.
+        clock: (optional) Function returning monotonic seconds.
+    """
+
+    def __init__(self, name=None, failure_threshold=5, recovery_secs=30.0, half_open_trials=1, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_secs = recovery_secs
+        self.half_open_trials = half_open_trials
+        self.clock = clock
+
+        self.__state = CircuitState.CLOSED
+        self.__failures = 0
+        self.__opened_at = None
+        self.__trials = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def state(self):
+        return self.__state
+
+    @property
+    def failures(self):
+        return self.__failures
+
+    @property
+    def retry_after(self):
+        """Seconds until trial requests are let through, 0.0 if not open.
+        """
+        if self.__state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.__opened_at + self.recovery_secs - self.clock())
+
+    def allow(self):
+        """Whether a request may be sent; if so, its outcome must be recorded,
+        or its slot released.
+
+        Returns:
+            Boolean
+
+        """
+        with self.__lock:
+            if self.__state == CircuitState.OPEN:
+                if self.clock() - self.__opened_at < self.recovery_secs:
+                    return False
+                self.__transition(CircuitState.HALF_OPEN)
+
+            if self.__state == CircuitState.HALF_OPEN:
+                if self.__trials >= self.half_open_trials:
+                    return False
+                self.__trials += 1
+
+            return True
+
+    def release(self):
+        """Give back slot of a request let through whose outcome is unknown,
+        e.g. interrupted, so that it does not hold a trial of half open circuit.
+        """
+        with self.__lock:
+            if self.__state == CircuitState.HALF_OPEN and self.__trials > 0:
+                self.__trials -= 1
+
+    def record_success(self):
+        with self.__lock:
+            self.__failures = 0
+            if self.__state == CircuitState.HALF_OPEN:
+                self.__transition(CircuitState.CLOSED)
+
+    def record_failure(self):
+        with self.__lock:
+            self.__failures += 1
+            if self.__state == CircuitState.HALF_OPEN or \
+                    (self.__state == CircuitState.CLOSED and self.__failures >= self.failure_threshold):
+                self.__transition(CircuitState.OPEN)
+
+    def __transition(self, state):
+        log.warning(
+            "Circuit Breaker: {}".format(state),
+            extra={'circuit_name': self.name,
+                   'circuit_state_from': self.__state,
+                   'circuit_failures': self.__failures}
+        )
+
+        self.__state = state
+        self.__trials = 0
+        if state == CircuitState.OPEN:
+            self.__opened_at = self.clock()
+
+
+class RequestCircuitBreakers(object):
+    """Circuit breakers per host, shared by RequestMvIntegration instances.
+
+    An attempt fails its host if it raises anything but a client error
+    (4xx) or an argument error: connection errors, timeouts and server
+    errors (5xx).
+
+    Args: See :class:`CircuitBreaker`.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_secs=30.0, half_open_trials=1, clock=time.monotonic):
+        if failure_threshold < 1:
+            raise TuneRequestValueError(
+                error_message="Circuit Breaker: Invalid 'failure_threshold': {}".format(failure_threshold)
+            )
+
+        self.failure_threshold = failure_threshold
+        self.recovery_secs = recovery_secs
+        self.half_open_trials = half_open_trials
+        self.clock = clock
+
+        self.__circuit_breakers = {}
+        self.__lock = threading.Lock()
+
+    def circuit_breaker(self, request_url):
+        """Circuit breaker of host of URL, created if none.
+        """
+        host = urllib.parse.urlsplit(request_url).netloc.lower()
+
+        with self.__lock:
+            circuit_breaker = self.__circuit_breakers.get(host)
+            if circuit_breaker is None:
+                circuit_breaker = CircuitBreaker(
+                    name=host,
+                    failure_threshold=self.failure_threshold,
+                    recovery_secs=self.recovery_secs,
+                    half_open_trials=self.half_open_trials,
+                    clock=self.clock,
+                )
+                self.__circuit_breakers[host] = circuit_breaker
+            return circuit_breaker
+
+    @staticmethod
+    def is_failure(excp):
+        """Whether exception raised by an attempt fails its host.
+        """
+        return not isinstance(excp, (TuneRequestClientError, TuneRequestValueError))
+
+    def circuit_states(self):
+        """Dictionary of host to CircuitState.
+        """
+        with self.__lock:
+            return {host: circuit_breaker.state for host, circuit_breaker in self.__circuit_breakers.items()}
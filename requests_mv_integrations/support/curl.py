@@ -7,6 +7,7 @@ import re
 import json
 import urllib.parse
 from .constants import (__USER_AGENT__)
+from .utils import (base_class_name)
 from base64 import b64encode
 import requests
 
@@ -192,3 +193,85 @@ def command_line_request_curl(
                 timeout=request_timeout,
                 url=request_url,
             )
+
+
+class LazyRequestCurl(object):
+    """cUrl command of a request, built when first read.
+
+    Keeps references to parts of request instead of building command upon
+    every request, as it is only read when request fails or is logged.
+    Reads as a string: str(), formatting and comparison build it.
+
+    As it is mostly read while handling an error, building it never
+    raises: a request it cannot be built for, e.g. of a bytes or streamed
+    body, reads as a placeholder naming why.
+
+    Args: See :func:`command_line_request_curl`.
+    """
+
+    def __init__(
+        self,
+        request_method,
+        request_url,
+        request_headers,
+        request_data=None,
+        request_auth=None,
+        request_json=None,
+        request_timeout=60,
+        request_allow_redirects=True
+    ):
+        self.request_method = request_method
+        self.request_url = request_url
+        self.request_headers = request_headers
+        self.request_data = request_data
+        self.request_auth = request_auth
+        self.request_json = request_json
+        self.request_timeout = request_timeout
+        self.request_allow_redirects = request_allow_redirects
+
+        self.__request_curl = None
+
+    @property
+    def request_curl(self):
+        """Get Property: cUrl command, built upon first read.
+        """
+        if self.__request_curl is None:
+            try:
+                self.__request_curl = command_line_request_curl(
+                    request_method=self.request_method,
+                    request_url=self.request_url,
+                    # Copied: building command adds headers.
+                    request_headers=dict(self.request_headers) if self.request_headers else None,
+                    request_data=self.request_data,
+                    request_auth=self.request_auth,
+                    request_json=self.request_json,
+                    request_timeout=self.request_timeout,
+                    request_allow_redirects=self.request_allow_redirects
+                )
+            except Exception as ex:
+                self.__request_curl = "curl: Not Available: {}".format(base_class_name(ex))
+
+            if self.__request_curl is None:
+                self.__request_curl = "curl: Not Available: {}".format(self.request_method)
+
+        return self.__request_curl
+
+    def __str__(self):
+        return self.request_curl
+
+    def __repr__(self):
+        return repr(self.request_curl)
+
+    def __len__(self):
+        return len(self.request_curl)
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        if isinstance(other, (str, LazyRequestCurl)):
+            return self.request_curl == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.request_curl)
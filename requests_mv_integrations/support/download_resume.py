@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Resumable Download
+"""
+
+import http.client as http_client
+import logging
+import re
+
+import requests
+
+from .utils import (base_class_name)
+
+log = logging.getLogger(__name__)
+
+RE_CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(\d+|\*)$')
+
+
+class ResumableDownload(object):
+    """Iterate content of a streamed response, resuming it where it broke off.
+
+    Upon ChunkedEncodingError, connection error or IncompleteRead, and if
+    response allows it ('Accept-Ranges: bytes' without 'Content-Encoding'),
+    the request is reissued with 'Range: bytes=<offset>-' and 'If-Range' set
+    to the response validator, and content resumes from 'offset'. Once
+    content ends, its size is checked against 'Content-Length'.
+
+    Request is reissued by 'send_func', if given, e.g. as an attempt of the
+    original call through its session, rate limiter, circuit breaker and
+    deadline; otherwise by the same adapter, with 'timeout' only.
+
+    If the server does not answer 206 Partial Content from 'offset' (e.g.
+    200 OK because content changed), the error is raised so that caller
+    restarts the download.
+    """
+
+    def __init__(self, response, max_resumes=5, timeout=60, send_func=None):
+        self.response = response
+        self.max_resumes = max_resumes
+        self.timeout = timeout
+        self.send_func = send_func
+
+        headers = response.headers
+        content_encoding = headers.get('Content-Encoding', 'identity').lower()
+        content_length = headers.get('Content-Length', '')
+
+        self.content_length = int(content_length) if content_length.isdigit() else None
+        if content_encoding != 'identity':
+            self.content_length = None
+
+        self.resumable = (headers.get('Accept-Ranges', '').lower() == 'bytes' and content_encoding == 'identity')
+        self.validator = headers.get('ETag') or headers.get('Last-Modified')
+
+        self.offset = 0
+        self.resumes = 0
+
+    def iter_content(self, chunk_size):
+        while True:
+            try:
+                for chunk in self.response.iter_content(chunk_size=chunk_size):
+                    self.offset += len(chunk)
+                    yield chunk
+
+                if self.content_length is not None and self.offset < self.content_length:
+                    raise http_client.IncompleteRead(b'', self.content_length - self.offset)
+
+                return
+
+            except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ConnectionError,
+                http_client.IncompleteRead,
+            ) as resume_ex:
+                if not self.resumable or self.resumes >= self.max_resumes or not self.resume():
+                    raise
+
+                log.warning(
+                    "Resumable Download: Resumed",
+                    extra={'offset': self.offset,
+                           'content_length': self.content_length,
+                           'resumes': self.resumes,
+                           'error_exception': base_class_name(resume_ex)}
+                )
+
+    def resume(self):
+        """Reissue request from current offset.
+
+        Returns:
+            True if response continues content from offset.
+
+        """
+        self.resumes += 1
+
+        request = self.response.request.copy()
+        request.headers['Range'] = "bytes={}-".format(self.offset)
+        if self.validator:
+            request.headers['If-Range'] = self.validator
+
+        adapter = self.response.connection
+        self.response.close()
+
+        try:
+            if self.send_func is not None:
+                response = self.send_func(request)
+            else:
+                response = adapter.send(request, stream=True, timeout=self.timeout)
+        except requests.exceptions.RequestException as request_ex:
+            log.warning(
+                "Resumable Download: Resume Failed",
+                extra={'offset': self.offset,
+                       'error_exception': base_class_name(request_ex)}
+            )
+            return False
+
+        content_range = RE_CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+        if response.status_code != 206 or not content_range or int(content_range.group(1)) != self.offset:
+            log.warning(
+                "Resumable Download: Resume Refused",
+                extra={'offset': self.offset,
+                       'http_status_code': response.status_code,
+                       'content_range': response.headers.get('Content-Range')}
+            )
+            response.close()
+            return False
+
+        if self.content_length is None and content_range.group(3).isdigit():
+            self.content_length = int(content_range.group(3))
+
+        self.response = response
+        return True
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Segmented (Range) Download
+"""
+
+import os
+import threading
+
+DOWNLOAD_SEGMENT_MIN_SIZE = 1024 * 1024
+
+
+class DownloadRangeRefused(Exception):
+    """Server answered a segment request with other than its byte range.
+
+    Args:
+        http_status_code: HTTP status code of response, not 206.
+    """
+
+    def __init__(self, http_status_code):
+        super(DownloadRangeRefused, self).__init__(
+            "Download Ranges: Segment: Unexpected status: {}".format(http_status_code)
+        )
+        self.http_status_code = http_status_code
+
+
+def download_segments_plan(content_length, segments, segment_min_size=DOWNLOAD_SEGMENT_MIN_SIZE):
+    """Split content into contiguous byte ranges to be downloaded concurrently.
+
+    Args:
+        content_length: Size of content in bytes.
+        segments: Maximum number of segments.
+        segment_min_size: (optional) Minimum size of a segment in bytes.
+
+    Returns:
+        List of (range_start, range_end) tuples, range_end inclusive.
+
+    """
+    if content_length <= 0:
+        return []
+
+    segments = max(1, min(segments, content_length // max(1, segment_min_size)))
+    segment_size = -(-content_length // segments)
+
+    return [
+        (range_start, min(range_start + segment_size, content_length) - 1)
+        for range_start in range(0, content_length, segment_size)
+    ]
+
+
+class SegmentFileWriter(object):
+    """Write segments into preallocated file by position, from many threads.
+
+    Uses os.pwrite() where available, else serializes seek and write.
+    """
+
+    def __init__(self, file_path, file_size):
+        self.file_path = file_path
+        self.file_size = file_size
+
+        self.__fd = os.open(file_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        self.__lock = None if hasattr(os, 'pwrite') else threading.Lock()
+
+        self.preallocate()
+
+    def preallocate(self):
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(self.__fd, 0, self.file_size)
+                return
+            except OSError:
+                pass  # Not supported by file system.
+        os.ftruncate(self.__fd, self.file_size)
+
+    def write_at(self, offset, chunk):
+        view = memoryview(chunk)
+        while view:
+            if self.__lock is None:
+                written = os.pwrite(self.__fd, view, offset)
+            else:
+                with self.__lock:
+                    os.lseek(self.__fd, offset, os.SEEK_SET)
+                    written = os.write(self.__fd, view)
+            view = view[written:]
+            offset += written
+
+    def finish(self, fsync=True):
+        if fsync:
+            os.fsync(self.__fd)
+        os.close(self.__fd)
+        self.__fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Download File Writer
+"""
+
+import os
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class DownloadDurability(object):
+    """Durability policy of downloaded files.
+
+    NONE: Leave flushing to the operating system.
+    END: fsync once download completes.
+    INTERVAL: fsync every 'fsync_interval_mb' of data written, and at end.
+    """
+    NONE = 'none'
+    END = 'end'
+    INTERVAL = 'interval'
+
+    ALL = (NONE, END, INTERVAL)
+
+
+class DownloadFileWriter(object):
+    """Write downloaded chunks into file applying durability policy.
+    """
+
+    def __init__(self, file_w, durability=DownloadDurability.END, fsync_interval_mb=None):
+        if durability not in DownloadDurability.ALL:
+            raise ValueError("Unexpected 'durability': '{}'".format(durability))
+
+        self.file_w = file_w
+        self.durability = durability
+        self.fsync_interval = int((fsync_interval_mb or 64) * 1024 * 1024)
+
+        self.bytes_written = 0
+        self.__bytes_unsynced = 0
+
+    def write(self, chunk):
+        if not chunk:
+            return
+
+        self.file_w.write(chunk)
+
+        self.bytes_written += len(chunk)
+        self.__bytes_unsynced += len(chunk)
+
+        if self.durability == DownloadDurability.INTERVAL and \
+                self.__bytes_unsynced >= self.fsync_interval:
+            self.fsync()
+
+    def fsync(self):
+        self.file_w.flush()
+        os.fsync(self.file_w.fileno())
+        self.__bytes_unsynced = 0
+
+    def finish(self):
+        """Download completed: fsync unless durability policy is NONE.
+        """
+        if self.durability == DownloadDurability.NONE:
+            self.file_w.flush()
+        else:
+            self.fsync()
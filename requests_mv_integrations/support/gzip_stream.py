@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Streaming GZip decompression
+"""
+
+import zlib
+
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions.custom import (TuneRequestModuleError)
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class GzipStreamDecompressor(object):
+    """Iterate chunks, decompressed as they arrive if stream is gzip.
+
+    Stream is sniffed upon its first bytes: if it is not gzip, chunks are
+    passed through as is. Concatenated gzip members are supported. Each
+    decompressed chunk is bounded by 'max_chunk_size' whatever the
+    compression ratio, so memory stays bounded.
+
+    Raises TuneRequestModuleError if stream ends within a gzip member, so
+    that truncated content is not taken as complete.
+    """
+
+    def __init__(self, chunks, max_chunk_size=1024 * 1024):
+        self.chunks = iter(chunks)
+        self.max_chunk_size = max_chunk_size
+
+        self.is_gzip = None
+        self.bytes_compressed = 0
+
+    def __iter__(self):
+        head = b''
+        for chunk in self.chunks:
+            head += chunk
+            if len(head) >= len(GZIP_MAGIC):
+                break
+
+        self.is_gzip = head.startswith(GZIP_MAGIC)
+
+        if not self.is_gzip:
+            if head:
+                yield head
+            for chunk in self.chunks:
+                yield chunk
+            return
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        member_started = False
+
+        chunk = head
+        while True:
+            self.bytes_compressed += len(chunk)
+
+            while chunk:
+                member_started = True
+                data = decompressor.decompress(chunk, self.max_chunk_size)
+                if data:
+                    yield data
+
+                if decompressor.eof:
+                    # Next gzip member, if any, else trailing padding is ignored.
+                    chunk = decompressor.unused_data
+                    if len(chunk) >= len(GZIP_MAGIC) and not chunk.startswith(GZIP_MAGIC):
+                        chunk = b''
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    member_started = False
+                else:
+                    chunk = decompressor.unconsumed_tail
+
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+
+        data = decompressor.flush()
+        if data:
+            yield data
+
+        if member_started and not decompressor.eof:
+            raise TuneRequestModuleError(
+                error_message="GZip Stream: Truncated: {} bytes compressed".format(self.bytes_compressed),
+                error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE
+            )
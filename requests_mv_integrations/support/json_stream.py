@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Streaming JSON array parser
+"""
+
+import codecs
+import json
+import re
+
+RE_JSON_NOT_WHITESPACE = re.compile(r'[^ \t\n\r]')
+RE_JSON_STRING_SPECIAL = re.compile(r'["\\]')
+RE_JSON_CONTAINER_SPECIAL = re.compile(r'["\[\]{}]')
+RE_JSON_SCALAR_END = re.compile(r'[,\]} \t\n\r]')
+
+
+class JsonStreamParser(object):
+    """Iterate items of a JSON array as chunks of the document arrive.
+
+    Only the item being decoded is held in memory, so memory stays flat
+    whatever the size of the document.
+
+    'json_path' is a dotted path of object keys leading to the array, for
+    example 'data.records' for {"meta": {...}, "data": {"records": [...]}};
+    None when the document itself is the array. Values found before the
+    path are skipped without being decoded. If the value at 'json_path' is
+    not an array, it is yielded as a single item.
+    """
+
+    def __init__(self, chunks, json_path=None, encoding='utf-8'):
+        self.chunks = iter(chunks)
+        self.json_path = json_path.split('.') if json_path else []
+        self.encoding = encoding
+
+        self.items_count = 0
+
+        self.__decoder = codecs.getincrementaldecoder(encoding)()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buf = ''
+        self.__pos = 0
+        self.__eof = False
+
+    def __iter__(self):
+        if self.__peek() == '\ufeff':
+            self.__pos += 1
+
+        for json_key in self.json_path:
+            self.__find_key(json_key)
+
+        if self.__peek() != '[':
+            yield self.__read_value()
+            self.items_count += 1
+            return
+
+        self.__pos += 1
+        if self.__peek() == ']':
+            return
+
+        while True:
+            yield self.__read_value()
+            self.items_count += 1
+
+            ch = self.__peek()
+            if ch == ',':
+                self.__pos += 1
+            elif ch == ']':
+                return
+            else:
+                self.__error("Expecting ',' delimiter or ']'")
+
+    def __fill(self):
+        """Append next decoded chunk to buffer, dropping what was consumed.
+        Returns False once chunks are exhausted.
+        """
+        if self.__eof:
+            return False
+
+        self.__buf = self.__buf[self.__pos:]
+        self.__pos = 0
+
+        for chunk in self.chunks:
+            text = self.__decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self.__buf += text
+                return True
+
+        self.__buf += self.__decoder.decode(b'', final=True)
+        self.__eof = True
+        return False
+
+    def __peek(self):
+        """Skip whitespace and return next character, None at end of document.
+        """
+        while True:
+            match = RE_JSON_NOT_WHITESPACE.search(self.__buf, self.__pos)
+            if match:
+                self.__pos = match.start()
+                return self.__buf[self.__pos]
+
+            self.__pos = len(self.__buf)
+            if not self.__fill():
+                return None
+
+    def __error(self, msg):
+        raise json.JSONDecodeError(msg, self.__buf, self.__pos)
+
+    def __find_key(self, json_key):
+        """Advance to value of 'json_key' within object at current position.
+        """
+        if self.__peek() != '{':
+            self.__error("Expecting object for JSON path key '{}'".format(json_key))
+        self.__pos += 1
+
+        while True:
+            ch = self.__peek()
+            if ch == '}':
+                self.__error("JSON path key '{}' not found".format(json_key))
+            if ch != '"':
+                self.__error("Expecting property name enclosed in double quotes")
+
+            key = self.__read_value()
+
+            if self.__peek() != ':':
+                self.__error("Expecting ':' delimiter")
+            self.__pos += 1
+
+            if key == json_key:
+                return
+
+            self.__skip_value()
+
+            ch = self.__peek()
+            if ch == ',':
+                self.__pos += 1
+            elif ch != '}':
+                self.__error("Expecting ',' delimiter or '}'")
+
+    def __read_value(self):
+        """Decode value at current position, buffering more chunks until complete.
+        """
+        ch = self.__peek()
+
+        # A number is complete only once followed by a delimiter or end of document.
+        if ch is not None and ch in '-0123456789':
+            while not RE_JSON_SCALAR_END.search(self.__buf, self.__pos):
+                if not self.__fill():
+                    break
+
+        while True:
+            try:
+                value, end = self.__json_decoder.raw_decode(self.__buf, self.__pos)
+            except json.JSONDecodeError:
+                if not self.__fill_more():
+                    raise
+                continue
+
+            self.__pos = end
+            return value
+
+    def __fill_more(self):
+        """Buffer at least as much again as pending, to keep decoding retries linear.
+        """
+        pending = len(self.__buf) - self.__pos
+        while self.__fill():
+            if len(self.__buf) - self.__pos >= 2 * pending:
+                break
+        return len(self.__buf) - self.__pos > pending
+
+    def __skip_value(self):
+        """Skip value at current position without decoding it.
+        """
+        ch = self.__peek()
+        if ch is None or ch in ',:]}':
+            self.__error("Expecting value")
+
+        if ch == '"':
+            self.__pos += 1
+            self.__skip_string()
+            return
+
+        if ch not in '[{':
+            while not RE_JSON_SCALAR_END.search(self.__buf, self.__pos):
+                if not self.__fill():
+                    break
+            match = RE_JSON_SCALAR_END.search(self.__buf, self.__pos)
+            self.__pos = match.start() if match else len(self.__buf)
+            return
+
+        depth = 0
+        while True:
+            match = RE_JSON_CONTAINER_SPECIAL.search(self.__buf, self.__pos)
+            if not match:
+                self.__pos = len(self.__buf)
+                if not self.__fill():
+                    self.__error("Unterminated value")
+                continue
+
+            self.__pos = match.end()
+            ch = match.group()
+            if ch == '"':
+                self.__skip_string()
+            elif ch in '[{':
+                depth += 1
+            else:
+                depth -= 1
+                if not depth:
+                    return
+
+    def __skip_string(self):
+        """Skip past closing quote of string whose opening quote was consumed.
+        """
+        while True:
+            match = RE_JSON_STRING_SPECIAL.search(self.__buf, self.__pos)
+            if not match:
+                self.__pos = len(self.__buf)
+                if not self.__fill():
+                    self.__error("Unterminated string")
+                continue
+
+            if match.group() == '"':
+                self.__pos = match.end()
+                return
+
+            # Escape: skip backslash and escaped character.
+            if match.end() + 1 > len(self.__buf):
+                self.__pos = match.start()
+                if not self.__fill():
+                    self.__error("Unterminated string")
+                continue
+            self.__pos = match.end() + 1
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Client-side Rate Limit
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+import urllib.parse
+
+from requests_mv_integrations.exceptions.custom import (TuneRequestValueError)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Not available on Windows: no shared state between processes.
+
+RE_RATE_LIMIT_KEY_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+class RateLimitKey(object):
+    """What requests share a token bucket.
+
+    HOST: Requests to same host (and port).
+    REQUEST_LABEL: Requests of same 'request_label'.
+    """
+    HOST = 'host'
+    REQUEST_LABEL = 'request_label'
+
+    ALL = (HOST, REQUEST_LABEL)
+
+
+class TokenBucket(object):
+    """Token bucket refilled at 'rate' tokens per second up to 'burst' tokens.
+
+    A request takes a token; when none is left, it is given the time to wait
+    until its token is refilled, and tokens go negative so that concurrent
+    requests queue up one after another instead of all waking up at once.
+
+    Args:
+        rate: Tokens refilled per second.
+        burst: (optional) Tokens held at most, defaults to 'rate'.
+        clock: (optional) Function returning monotonic seconds.
+    """
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        if not rate or rate <= 0:
+            raise TuneRequestValueError(error_message="Rate limit: Invalid 'rate': {}".format(rate))
+
+        self.rate = float(rate)
+        self.burst = float(burst) if burst else max(1.0, self.rate)
+        self.clock = clock
+
+        self.__tokens = self.burst
+        self.__time_last = self.clock()
+        self.__lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """Take tokens.
+
+        Returns:
+            Seconds to wait before sending, 0.0 if tokens were available.
+
+        """
+        with self.__lock:
+            self.__tokens, self.__time_last, wait_secs = _token_bucket_take(
+                self.__tokens, self.__time_last, self.clock(), self.rate, self.burst, tokens
+            )
+        return wait_secs
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is kept in a local file, locked while updated,
+    so that it is shared by all processes using same 'file_path'.
+
+    Args:
+        file_path: Path of state file.
+        rate, burst: See :class:`TokenBucket`.
+        clock: (optional) Function returning epoch seconds, same for all processes.
+    """
+
+    def __init__(self, file_path, rate, burst=None, clock=time.time):
+        if fcntl is None:
+            raise TuneRequestValueError(error_message="Rate limit: Shared state requires 'fcntl'")
+
+        super(FileTokenBucket, self).__init__(rate=rate, burst=burst, clock=clock)
+        self.file_path = file_path
+
+    def reserve(self, tokens=1):
+        # Opened per call: a lock held through a file descriptor inherited
+        # by a forked process would not exclude that process.
+        fd = os.open(self.file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+            time_now = self.clock()
+            try:
+                bucket_tokens, bucket_time_last = (float(value) for value in os.pread(fd, 64, 0).split())
+            except ValueError:
+                bucket_tokens, bucket_time_last = self.burst, time_now
+
+            bucket_tokens, bucket_time_last, wait_secs = _token_bucket_take(
+                bucket_tokens, bucket_time_last, time_now, self.rate, self.burst, tokens
+            )
+
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, "{!r} {!r}".format(bucket_tokens, bucket_time_last).encode('ascii'), 0)
+        finally:
+            os.close(fd)  # Releases lock.
+
+        return wait_secs
+
+
+def _token_bucket_take(bucket_tokens, bucket_time_last, time_now, rate, burst, tokens):
+    """Refill bucket up to now, then take tokens.
+
+    Returns:
+        tuple: (tokens left, time of refill, seconds to wait)
+
+    """
+    bucket_tokens = min(burst, bucket_tokens + max(0.0, time_now - bucket_time_last) * rate)
+    bucket_tokens -= tokens
+
+    wait_secs = -bucket_tokens / rate if bucket_tokens < 0 else 0.0
+
+    return bucket_tokens, time_now, wait_secs
+
+
+class RequestRateLimiter(object):
+    """Client-side rate limit of requests, a token bucket per host or per request label.
+
+    Share one instance between the RequestMvIntegration instances of a
+    process; give same 'state_dir' to limiters of many processes to share
+    their buckets.
+
+    Args:
+        rate: Requests per second of each host or label, None to limit
+            only those of 'rate_limits'.
+        burst: (optional) Requests sent at once before being limited,
+            defaults to 'rate'.
+        rate_limit_key: (optional) RateLimitKey
+        rate_limits: (optional) Dictionary of host or label to
+            (rate, burst) tuple overriding 'rate' and 'burst'.
+        state_dir: (optional) Directory of files keeping shared bucket state.
+    """
+
+    def __init__(
+        self,
+        rate=None,
+        burst=None,
+        rate_limit_key=RateLimitKey.HOST,
+        rate_limits=None,
+        state_dir=None,
+    ):
+        if rate_limit_key not in RateLimitKey.ALL:
+            raise TuneRequestValueError(error_message="Rate limit: Invalid 'rate_limit_key': {}".format(rate_limit_key))
+
+        self.rate = rate
+        self.burst = burst
+        self.rate_limit_key = rate_limit_key
+        self.rate_limits = dict(rate_limits or {})
+        self.state_dir = state_dir
+
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    def limit_key(self, request_url, request_label=None):
+        if self.rate_limit_key == RateLimitKey.REQUEST_LABEL:
+            return request_label
+        return urllib.parse.urlsplit(request_url).netloc.lower()
+
+    def bucket(self, limit_key):
+        """Token bucket of host or label, None if it is not limited.
+        """
+        with self.__lock:
+            if limit_key in self.__buckets:
+                return self.__buckets[limit_key]
+
+            rate, burst = self.rate_limits.get(limit_key, (self.rate, self.burst))
+
+            bucket = None
+            if rate:
+                if self.state_dir:
+                    file_name = "rate_limit_{}.state".format(RE_RATE_LIMIT_KEY_UNSAFE.sub('_', str(limit_key)))
+                    bucket = FileTokenBucket(os.path.join(self.state_dir, file_name), rate=rate, burst=burst)
+                else:
+                    bucket = TokenBucket(rate=rate, burst=burst)
+
+            self.__buckets[limit_key] = bucket
+            return bucket
+
+    def reserve(self, request_url, request_label=None):
+        """Take a token for request.
+
+        Returns:
+            Seconds to wait before sending.
+
+        """
+        bucket = self.bucket(self.limit_key(request_url, request_label))
+        return bucket.reserve() if bucket else 0.0
+
+    def acquire(self, request_url, request_label=None):
+        """Block until request may be sent.
+
+        Returns:
+            Seconds waited.
+
+        """
+        wait_secs = self.reserve(request_url, request_label)
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+        return wait_secs
+
+    async def acquire_async(self, request_url, request_label=None):
+        """Wait, without blocking event loop, until request may be sent.
+
+        Returns:
+            Seconds waited.
+
+        """
+        wait_secs = self.reserve(request_url, request_label)
+        if wait_secs > 0:
+            await asyncio.sleep(wait_secs)
+        return wait_secs
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Request Context
+"""
+
+from .retry_backoff import (ExponentialBackoff)
+
+
+class RequestContext(object):
+    """Per-call state of a request with retries.
+
+    Holds retry policy of one call, the TuneRequest pooled session sending it
+    and what it produced (built request cUrl, attempts sent), so that one
+    RequestMvIntegration instance can serve many threads.
+    """
+
+    def __init__(
+        self,
+        timeout,
+        retry_tries,
+        retry_delay,
+        retry_max_delay=None,
+        retry_backoff=0,
+        retry_jitter=0,
+        retry_seed=None,
+        retry_budget=None,
+        retry_http_status_tries=None,
+        request_retry_http_status_codes=None,
+        request_retry_excps=None,
+        request_retry_func=None,
+        request_retry_excps_func=None,
+        request_retry_classifier=None,
+        request_deadline=None,
+        request_label=None,
+    ):
+        self.timeout = timeout
+        self.retry_tries = retry_tries
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_backoff = retry_backoff
+        self.retry_jitter = retry_jitter
+        self.retry_budget = retry_budget
+
+        # Attempts left answered by HTTP status codes retried upon, None if only 'retry_tries' applies.
+        self.retry_http_status_tries = retry_http_status_tries
+
+        # Delays of this call, if 'retry_backoff' is a backoff strategy.
+        self.retry_backoff_delays = None
+        if isinstance(retry_backoff, ExponentialBackoff):
+            self.retry_backoff_delays = retry_backoff.delays(seed=retry_seed)
+
+        self.request_retry_http_status_codes = request_retry_http_status_codes
+        self.request_retry_excps = request_retry_excps
+        self.request_retry_func = request_retry_func
+        self.request_retry_excps_func = request_retry_excps_func
+        self.request_retry_classifier = request_retry_classifier
+        self.request_deadline = request_deadline
+
+        self.request_label = request_label
+
+        self.tune_request = None
+        self.built_request_curl = None
+        self.request_attempts = 0
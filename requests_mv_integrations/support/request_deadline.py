@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Request Deadline
+"""
+
+import time
+
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions.custom import (TuneRequestModuleError)
+
+
+class RequestDeadline(object):
+    """Time budget of a call, across all its attempts and retry delays.
+
+    Created when call starts; hand same instance to nested calls, e.g. the
+    requests of a download, so that they share the budget.
+
+    Args:
+        deadline_secs: Seconds call must complete within.
+        clock: (optional) Function returning monotonic seconds.
+    """
+
+    def __init__(self, deadline_secs, clock=time.monotonic):
+        self.deadline_secs = deadline_secs
+        self.clock = clock
+        self.expires_at = self.clock() + deadline_secs
+
+    @classmethod
+    def from_value(cls, request_deadline):
+        """RequestDeadline from seconds, or as is.
+
+        Args:
+            request_deadline: Seconds, RequestDeadline or None.
+
+        Returns:
+            RequestDeadline or None
+
+        """
+        if request_deadline is None or isinstance(request_deadline, RequestDeadline):
+            return request_deadline
+        return cls(request_deadline)
+
+    @property
+    def remaining(self):
+        """Seconds left, 0.0 once expired.
+        """
+        return max(0.0, self.expires_at - self.clock())
+
+    @property
+    def expired(self):
+        return self.remaining <= 0
+
+    def timeout(self, timeout):
+        """Shrink timeout of an attempt to fit remaining budget.
+
+        Args:
+            timeout: Seconds, (connect, read) tuple, or None.
+
+        Returns:
+            Timeout of same form, no longer than remaining budget.
+
+        """
+        remaining = self.remaining
+
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if value is None else min(value, remaining) for value in timeout)
+        return min(timeout, remaining)
+
+    def fits(self, delay):
+        """Whether an attempt still fits after sleeping 'delay'.
+        """
+        return delay < self.remaining
+
+    def check(self, request_label=None, request_url=None, error_request_curl=None):
+        """Raise if budget is exhausted.
+
+        Raises:
+            TuneRequestModuleError: REQ_ERR_DEADLINE_EXCEEDED
+
+        """
+        if self.expired:
+            self.exceeded(request_label, request_url, error_request_curl)
+
+    def exceeded(self, request_label=None, request_url=None, error_request_curl=None):
+        raise TuneRequestModuleError(
+            error_message="Deadline Exceeded: {} secs: {}: {}".format(self.deadline_secs, request_label, request_url),
+            error_request_curl=error_request_curl,
+            error_code=TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED
+        )
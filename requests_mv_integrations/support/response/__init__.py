@@ -3,7 +3,15 @@
 #  @copyright 2016 TUNE, Inc. (http://www.tune.com)
 #  @namespace requests_mv_integrations
 
-from .csv import (csv_skip_last_row,)
+from .csv import (
+    ChunksRawIO,
+    CsvBatchFormat,
+    CsvRowFormat,
+    csv_column_batches,
+    csv_response_text,
+    csv_skip_last_row,
+    csv_stream_rows,
+)
 from .parse import (
     requests_response_text_html,
     requests_response_text_xml,
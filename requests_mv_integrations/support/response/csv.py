@@ -14,9 +14,16 @@ from requests_mv_integrations.errors import (
     get_exception_message,
     TuneRequestErrorCodes,
 )
-from requests_mv_integrations.exceptions.custom import (TuneRequestModuleError,)
+from requests_mv_integrations.exceptions.custom import (
+    TuneRequestModuleError,
+    TuneRequestValueError,
+)
+from requests_mv_integrations.support.bom_encoding import (BomStreamStripper)
+from requests_mv_integrations.support.download_writer import (DOWNLOAD_CHUNK_SIZE)
 from requests_mv_integrations.support.utils import (base_class_name, python_check_version)
 
+log = logging.getLogger(__name__)
+
 
 def csv_skip_last_row(iterator):
     """Skip last CSV row.
@@ -31,3 +38,338 @@ def csv_skip_last_row(iterator):
     for item in iterator:
         yield prev
         prev = item
+
+
+class ChunksRawIO(io.RawIOBase):
+    """Read-only raw binary stream over an iterator of bytes chunks.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.__chunk = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self.__chunk:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return 0
+            self.__chunk = memoryview(chunk)
+
+        size = min(len(b), len(self.__chunk))
+        b[:size] = self.__chunk[:size]
+        self.__chunk = self.__chunk[size:]
+        return size
+
+
+def csv_response_text(response, encoding_read=None, chunk_size=DOWNLOAD_CHUNK_SIZE, newline=None):
+    """Text file object reading CSV straight from streamed response, BOM removed.
+
+    Args:
+        response: requests.Response requested with stream=True.
+        encoding_read: (optional) Encoding of CSV, default 'utf-8'.
+        chunk_size: (optional) Bytes read from response per chunk.
+        newline: (optional) Newline mode of io.TextIOWrapper, '' to keep
+            line endings within quoted fields as is.
+
+    Returns:
+        io.TextIOWrapper
+
+    """
+    csv_chunks = BomStreamStripper(response.iter_content(chunk_size=chunk_size))
+
+    return io.TextIOWrapper(
+        io.BufferedReader(ChunksRawIO(csv_chunks), buffer_size=chunk_size),
+        encoding=encoding_read or 'utf-8',
+        newline=newline
+    )
+
+
+class CsvRowFormat(object):
+    """Format of rows yielded by :func:`csv_stream_rows`.
+
+    TUPLE: Tuple of values, header excluded.
+    DICT: Dictionary of values by header keys.
+    COLUMNS: Batches of rows as dictionary of value lists by header keys.
+    """
+    TUPLE = 'tuple'
+    DICT = 'dict'
+    COLUMNS = 'columns'
+
+    ALL = (TUPLE, DICT, COLUMNS)
+
+
+def csv_stream_rows(
+    csv_file_r,
+    csv_delimiter=',',
+    csv_header=None,
+    csv_row_format=CsvRowFormat.DICT,
+    batch_size=10000,
+):
+    """Yield CSV rows parsed from a text stream.
+
+    Parsing is left to a single csv.reader over the whole stream, so quoted
+    fields spanning several lines are handled and no per-line parser state
+    is rebuilt.
+
+    Args:
+        csv_file_r: Text file object, opened with newline=''.
+        csv_delimiter: (optional) Delimiter character, default comma ','.
+        csv_header: (optional) Header keys, if CSV first row is not header.
+        csv_row_format: (optional) CsvRowFormat of yielded rows.
+        batch_size: (optional) Rows per batch for CsvRowFormat.COLUMNS.
+
+    Returns:
+        Generator of rows.
+
+    """
+    if csv_row_format not in CsvRowFormat.ALL:
+        raise ValueError("Unexpected 'csv_row_format': '{}'".format(csv_row_format))
+
+    csv_reader = csv.reader(csv_file_r, delimiter=csv_delimiter)
+
+    csv_keys_list = csv_header
+    if csv_keys_list is None:
+        for csv_keys_list in csv_reader:
+            if csv_keys_list:
+                break
+        else:
+            return
+
+        csv_keys_list = [csv_key.strip() for csv_key in csv_keys_list]
+
+    csv_keys_list_len = len(csv_keys_list)
+
+    csv_rows = []
+    for csv_values_list in csv_reader:
+        if not csv_values_list:  # filter out blank lines
+            continue
+
+        if len(csv_values_list) != csv_keys_list_len:
+            log.error(
+                "Mismatch: CSV Key",
+                extra={
+                    'line': csv_reader.line_num,
+                    'csv_keys_list_len': csv_keys_list_len,
+                    'csv_keys_list': csv_keys_list,
+                    'csv_values_list_len': len(csv_values_list),
+                    'csv_values_list': csv_values_list,
+                }
+            )
+            raise TuneRequestModuleError(
+                error_message="Mismatch: CSV Key '{}': Values '{}'".format(csv_keys_list, csv_values_list),
+                error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE
+            )
+
+        if csv_row_format == CsvRowFormat.DICT:
+            yield dict(zip(csv_keys_list, csv_values_list))
+        elif csv_row_format == CsvRowFormat.TUPLE:
+            yield tuple(csv_values_list)
+        else:
+            csv_rows.append(csv_values_list)
+            if len(csv_rows) >= batch_size:
+                yield dict(zip(csv_keys_list, map(list, zip(*csv_rows))))
+                csv_rows = []
+
+    if csv_rows:
+        yield dict(zip(csv_keys_list, map(list, zip(*csv_rows))))
+
+
+class CsvBatchFormat(object):
+    """Format of column batches yielded by :func:`csv_column_batches`.
+
+    PYTHON: Dictionary of typed value lists by header keys.
+    NUMPY: Dictionary of numpy arrays by header keys, requires numpy.
+    ARROW: pyarrow.RecordBatch, requires pyarrow.
+    """
+    PYTHON = 'python'
+    NUMPY = 'numpy'
+    ARROW = 'arrow'
+
+    ALL = (PYTHON, NUMPY, ARROW)
+
+
+CSV_COLUMN_TYPES = (int, float, str)
+
+
+def csv_column_cast(csv_values, csv_type):
+    """Cast CSV column values to type, empty values cast to None.
+
+    Args:
+        csv_values: List of str values.
+        csv_type: int, float or str.
+
+    Returns:
+        List of typed values.
+
+    Raises:
+        ValueError: if a non-empty value is not of type.
+
+    """
+    if csv_type is str:
+        return [csv_value if csv_value != '' else None for csv_value in csv_values]
+
+    try:
+        return list(map(csv_type, csv_values))
+    except ValueError:
+        return [csv_type(csv_value) if csv_value != '' else None for csv_value in csv_values]
+
+
+def csv_column_infer(csv_values, csv_types=CSV_COLUMN_TYPES):
+    """Cast CSV column values to first of types that fits all of them.
+
+    A column of empty values only is str, the one type fitting any value.
+
+    Args:
+        csv_values: List of str values.
+        csv_types: (optional) Candidate types, narrowest first.
+
+    Returns:
+        (type, list of typed values)
+
+    """
+    if not any(csv_values):
+        return str, csv_column_cast(csv_values, str)
+
+    for csv_type in csv_types:
+        try:
+            return csv_type, csv_column_cast(csv_values, csv_type)
+        except ValueError:
+            continue
+
+    return str, csv_column_cast(csv_values, str)
+
+
+def _csv_batch_module(csv_batch_format):
+    """Import module of optional dependency required by batch format.
+    """
+    module_name = 'pyarrow' if csv_batch_format == CsvBatchFormat.ARROW else 'numpy'
+    try:
+        return __import__(module_name)
+    except ImportError as ex:
+        raise TuneRequestValueError(
+            error_message="CSV Batch Format '{}': Requires '{}' installed".format(csv_batch_format, module_name),
+            errors=ex
+        )
+
+
+def csv_column_batches(
+    csv_rows,
+    csv_keys_list,
+    batch_size=10000,
+    csv_schema=None,
+    csv_batch_format=CsvBatchFormat.PYTHON,
+):
+    """Yield CSV rows as batches of typed columns.
+
+    Column types are taken from 'csv_schema', else inferred from the first
+    batch as the narrowest of int, float and str fitting every non-empty
+    value; empty values are None. Inferred types are kept for later batches,
+    so that all batches share one schema: a later value not fitting its
+    column type, of 'csv_schema' or inferred, raises TuneRequestValueError.
+    Give 'csv_schema' of columns whose first batch is not representative.
+
+    Args:
+        csv_rows: Iterator of CSV rows as lists of str values.
+        csv_keys_list: Header keys.
+        batch_size: (optional) Rows per batch.
+        csv_schema: (optional) Dictionary of column types (int, float or str)
+            by header keys; columns missing from it are inferred.
+        csv_batch_format: (optional) CsvBatchFormat of yielded batches.
+
+    Returns:
+        Generator of column batches in 'csv_batch_format'.
+
+    """
+    if csv_batch_format not in CsvBatchFormat.ALL:
+        raise TuneRequestValueError(error_message="Unexpected 'csv_batch_format': '{}'".format(csv_batch_format))
+
+    csv_schema = csv_schema or {}
+    for csv_key, csv_type in csv_schema.items():
+        if csv_type not in CSV_COLUMN_TYPES:
+            raise TuneRequestValueError(
+                error_message="CSV Schema: Unexpected type of column '{}': '{}'".format(csv_key, csv_type)
+            )
+
+    batch_module = None
+    if csv_batch_format != CsvBatchFormat.PYTHON:
+        batch_module = _csv_batch_module(csv_batch_format)
+
+    csv_types = [csv_schema.get(csv_key) for csv_key in csv_keys_list]
+
+    csv_keys_list_len = len(csv_keys_list)
+
+    while True:
+        csv_batch = [csv_row for _, csv_row in zip(range(batch_size), csv_rows)]
+        if not csv_batch:
+            return
+
+        for csv_row in csv_batch:
+            if len(csv_row) != csv_keys_list_len:
+                raise TuneRequestModuleError(
+                    error_message="Mismatch: CSV Key '{}': Values '{}'".format(csv_keys_list, csv_row),
+                    error_code=TuneRequestErrorCodes.REQ_ERR_UNEXPECTED_VALUE
+                )
+
+        csv_columns = []
+        for idx, csv_values in enumerate(zip(*csv_batch)):
+            csv_values = list(csv_values)
+            csv_type = csv_types[idx]
+
+            if csv_type is None:
+                csv_types[idx], csv_values = csv_column_infer(csv_values)
+            else:
+                try:
+                    csv_values = csv_column_cast(csv_values, csv_type)
+                except ValueError as ex:
+                    raise TuneRequestValueError(
+                        error_message="CSV Schema: Column '{}' not of type '{}'{}".format(
+                            csv_keys_list[idx], csv_type.__name__,
+                            "" if csv_keys_list[idx] in csv_schema else ", inferred from first batch"
+                        ),
+                        errors=ex
+                    )
+
+            csv_columns.append(csv_values)
+
+        if csv_batch_format == CsvBatchFormat.PYTHON:
+            yield dict(zip(csv_keys_list, csv_columns))
+
+        elif csv_batch_format == CsvBatchFormat.NUMPY:
+            yield {
+                csv_key: _csv_numpy_array(batch_module, csv_values, csv_type)
+                for csv_key, csv_values, csv_type in zip(csv_keys_list, csv_columns, csv_types)
+            }
+
+        else:
+            yield batch_module.RecordBatch.from_arrays(
+                [
+                    batch_module.array(csv_values, type=_csv_arrow_type(batch_module, csv_type))
+                    for csv_values, csv_type in zip(csv_columns, csv_types)
+                ],
+                names=list(csv_keys_list)
+            )
+
+
+def _csv_arrow_type(pyarrow, csv_type):
+    """Arrow type of CSV column type, same for every batch whatever its values.
+    """
+    if csv_type is int:
+        return pyarrow.int64()
+    if csv_type is float:
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _csv_numpy_array(numpy, csv_values, csv_type):
+    """Numpy array of typed CSV column, None cast to NaN for numbers.
+    """
+    if csv_type is str:
+        return numpy.array(csv_values, dtype=object)
+
+    if csv_type is int and None not in csv_values:
+        return numpy.array(csv_values, dtype=numpy.int64)
+
+    return numpy.array(csv_values, dtype=numpy.float64)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Retry Backoff Strategies
+"""
+
+import random
+import threading
+import time
+
+
+class ExponentialBackoff(object):
+    """Delay before each retry: 'base_delay' * 'factor' ** retry, capped by 'max_delay'.
+
+    A strategy is configuration, shared by calls: :meth:`delays` gives each
+    call its own sequence of delays, randomized by its own generator so that
+    workers failing together do not retry together.
+
+    Args:
+        base_delay: Delay before first retry, in seconds.
+        factor: (optional) Multiplier applied to delay between retries.
+        max_delay: (optional) Maximum delay, None for no limit.
+        seed: (optional) Seed of random delays, for reproducible sequences;
+            None to seed each call from system entropy.
+    """
+
+    def __init__(self, base_delay=1.0, factor=2.0, max_delay=None, seed=None):
+        self.base_delay = base_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.seed = seed
+
+    def delays(self, seed=None):
+        """Delays of one call.
+
+        Args:
+            seed: (optional) Seed of this call, overriding that of strategy.
+
+        Returns:
+            Generator of delays in seconds, one per retry, endless.
+
+        """
+        random_ = random.Random(seed if seed is not None else self.seed)
+
+        retry, delay = 0, self.base_delay
+        while True:
+            delay = self.backoff_delay(retry, delay, random_)
+            if self.max_delay is not None:
+                delay = min(delay, self.max_delay)
+            yield delay
+            retry += 1
+
+    def exponential_delay(self, retry):
+        delay = self.base_delay * self.factor ** retry
+        return min(delay, self.max_delay) if self.max_delay is not None else delay
+
+    def backoff_delay(self, retry, prev_delay, random_):
+        """Delay before retry.
+
+        Args:
+            retry: Index of retry, 0 for first one.
+            prev_delay: Delay before previous retry, 'base_delay' for first one.
+            random_: random.Random of call.
+
+        Returns:
+            Delay in seconds.
+
+        """
+        return self.exponential_delay(retry)
+
+
+class FullJitterBackoff(ExponentialBackoff):
+    """Delay drawn uniformly between 0 and exponential delay.
+    """
+
+    def backoff_delay(self, retry, prev_delay, random_):
+        return random_.uniform(0, self.exponential_delay(retry))
+
+
+class EqualJitterBackoff(ExponentialBackoff):
+    """Half of exponential delay, plus a uniformly drawn share of other half.
+    """
+
+    def backoff_delay(self, retry, prev_delay, random_):
+        delay = self.exponential_delay(retry) / 2
+        return delay + random_.uniform(0, delay)
+
+
+class DecorrelatedJitterBackoff(ExponentialBackoff):
+    """Delay drawn uniformly between 'base_delay' and 'factor' times previous delay.
+    Defaults to factor 3.
+    """
+
+    def __init__(self, base_delay=1.0, factor=3.0, max_delay=None, seed=None):
+        super(DecorrelatedJitterBackoff, self).__init__(
+            base_delay=base_delay, factor=factor, max_delay=max_delay, seed=seed
+        )
+
+    def backoff_delay(self, retry, prev_delay, random_):
+        return random_.uniform(self.base_delay, max(self.base_delay, prev_delay * self.factor))
+
+
+class RetryBudget(object):
+    """Cap retries to a ratio of requests, shared by calls.
+
+    Within each window of 'window_secs', retries are allowed while fewer than
+    'min_retries' plus 'retry_ratio' of the requests made in the window, so
+    that a failing partner gets a bounded share of extra load instead of
+    every call retrying to its tries.
+
+    Args:
+        retry_ratio: Retries allowed per request.
+        min_retries: (optional) Retries allowed per window whatever the requests.
+        window_secs: (optional) Window length in seconds.
+        clock: (optional) Function returning monotonic seconds.
+    """
+
+    def __init__(self, retry_ratio=0.2, min_retries=10, window_secs=10.0, clock=time.monotonic):
+        self.retry_ratio = retry_ratio
+        self.min_retries = min_retries
+        self.window_secs = window_secs
+        self.clock = clock
+
+        self.__requests = 0
+        self.__retries = 0
+        self.__window_start = self.clock()
+        self.__lock = threading.Lock()
+
+    def request(self):
+        """Count a request.
+        """
+        with self.__lock:
+            self.__window()
+            self.__requests += 1
+
+    def withdraw(self):
+        """Take a retry from budget.
+
+        Returns:
+            True if retry is allowed.
+
+        """
+        with self.__lock:
+            self.__window()
+            if self.__retries >= self.min_retries + self.retry_ratio * self.__requests:
+                return False
+            self.__retries += 1
+            return True
+
+    def __window(self):
+        time_now = self.clock()
+        if time_now - self.__window_start >= self.window_secs:
+            self.__requests = 0
+            self.__retries = 0
+            self.__window_start = time_now
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Retry Classifier
+"""
+
+import email.utils
+import http.client as http_client
+import time
+
+from requests.packages.urllib3.exceptions import (
+    ConnectTimeoutError,
+    NewConnectionError,
+    ProtocolError,
+)
+from requests_mv_integrations.exceptions.base import (TuneRequestBaseError)
+from .utils import (base_class_name)
+
+RETRY_CONNECTION_RESET_EXCPS = (
+    http_client.RemoteDisconnected,
+    ConnectionResetError,
+)
+
+# Request never reached server: safe to retry whatever the method.
+RETRY_CONNECT_EXCPS = (
+    NewConnectionError,
+    ConnectTimeoutError,
+)
+
+# Connection dropped once request was sent: safe to retry idempotent methods only.
+RETRY_READ_EXCPS = (ProtocolError, ) + RETRY_CONNECTION_RESET_EXCPS
+
+RETRY_IDEMPOTENT_METHODS = frozenset(['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'])
+
+# X-RateLimit-Reset above this is an epoch timestamp, else seconds to wait.
+RATE_LIMIT_RESET_EPOCH_MIN = 10 ** 9
+
+
+class RetryDelaySource(object):
+    """What delay before next attempt was taken from.
+
+    RETRY_POLICY: Delay, backoff and jitter of retry configuration.
+    RETRY_AFTER: 'Retry-After' response header.
+    RATE_LIMIT_RESET: 'X-RateLimit-Reset' (or 'RateLimit-Reset') response header.
+    """
+    RETRY_POLICY = 'Retry Policy'
+    RETRY_AFTER = 'Retry-After'
+    RATE_LIMIT_RESET = 'X-RateLimit-Reset'
+
+    ALL = (RETRY_POLICY, RETRY_AFTER, RATE_LIMIT_RESET)
+
+
+def retry_after_delay(headers, now=None):
+    """Seconds server asks to wait before next attempt, from response headers.
+
+    'Retry-After' is either seconds or an HTTP-date. 'X-RateLimit-Reset' is
+    either seconds or epoch timestamp of when limit resets; 'RateLimit-Reset'
+    is seconds.
+
+    Args:
+        headers: Response headers, a dictionary.
+        now: (optional) Epoch time, defaults to time.time().
+
+    Returns:
+        tuple: (delay in seconds, RetryDelaySource), (None, None) if no header.
+
+    """
+    if not headers:
+        return None, None
+
+    headers = {str(key).lower(): str(value).strip() for key, value in headers.items()}
+    now = time.time() if now is None else now
+
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after)), RetryDelaySource.RETRY_AFTER
+        except ValueError:
+            pass
+        try:
+            retry_after_date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError, IndexError):
+            retry_after_date = None
+        if retry_after_date is not None and retry_after_date.tzinfo is not None:
+            return max(0.0, retry_after_date.timestamp() - now), RetryDelaySource.RETRY_AFTER
+
+    for header_name in ('x-ratelimit-reset', 'ratelimit-reset'):
+        try:
+            rate_limit_reset = float(headers.get(header_name, ''))
+        except ValueError:
+            continue
+        if header_name == 'x-ratelimit-reset' and rate_limit_reset >= RATE_LIMIT_RESET_EPOCH_MIN:
+            rate_limit_reset -= now
+        return max(0.0, rate_limit_reset), RetryDelaySource.RATE_LIMIT_RESET
+
+    return None, None
+
+
+def retry_cause_excps(request_method=None):
+    """Connection failures retried upon when found in exception chain of an attempt.
+
+    Args:
+        request_method: (optional) HTTP method, None if unknown.
+
+    Returns:
+        Tuple of exceptions.
+
+    """
+    if request_method and request_method.upper() in RETRY_IDEMPOTENT_METHODS:
+        return RETRY_CONNECT_EXCPS + RETRY_READ_EXCPS
+    return RETRY_CONNECT_EXCPS
+
+
+def excp_chain(excp):
+    """Iterate exception and those it was raised from, breadth first.
+
+    Follows '__cause__' and '__context__', 'errors' of TUNE Request errors,
+    'reason' of urllib3 errors and exceptions given as arguments, e.g.
+    ProtocolError('Connection aborted.', RemoteDisconnected(...)).
+
+    Args:
+        excp: Exception
+
+    Returns:
+        Generator of exceptions, starting with 'excp'.
+
+    """
+    excps = [excp]
+    excps_seen = set()
+
+    while excps:
+        excp = excps.pop(0)
+        if not isinstance(excp, BaseException) or id(excp) in excps_seen:
+            continue
+        excps_seen.add(id(excp))
+
+        yield excp
+
+        excps.extend((excp.__cause__, excp.__context__))
+        if isinstance(excp, TuneRequestBaseError):
+            excps.append(excp.errors)
+        excps.append(getattr(excp, 'reason', None))
+        excps.extend(excp.args)
+
+
+class RetryExcpKind(object):
+    """Kind of exception raised by an attempt.
+
+    EXPECTED: One of the exceptions to retry upon, or raised from one.
+    INTEGRATION: TUNE Request error.
+    UNEXPECTED: Any other exception.
+    """
+    EXPECTED = 'Expected'
+    INTEGRATION = 'Integration'
+    UNEXPECTED = 'Unexpected'
+
+    ALL = (EXPECTED, INTEGRATION, UNEXPECTED)
+
+
+class RetryDecision(object):
+    """Outcome of classifying an attempt.
+
+    Args:
+        retry: True if attempt is a retry candidate.
+        reason: What decided it, for logging.
+        excp_kind: (optional) RetryExcpKind of exception classified.
+        delay: (optional) Seconds to wait before next attempt,
+            None to follow retry policy.
+        delay_source: (optional) RetryDelaySource of 'delay'.
+        http_status_code: (optional) HTTP status code retried upon, if any.
+    """
+
+    def __init__(self, retry, reason, excp_kind=None, delay=None, delay_source=None, http_status_code=None):
+        self.retry = retry
+        self.reason = reason
+        self.excp_kind = excp_kind
+        self.http_status_code = http_status_code
+        self.delay = delay
+        self.delay_source = delay_source if delay is not None else RetryDelaySource.RETRY_POLICY
+
+    def __bool__(self):
+        return self.retry
+
+    def __repr__(self):
+        return "RetryDecision(retry={}, reason={!r}, excp_kind={!r}, delay={!r}, delay_source={!r})".format(
+            self.retry, self.reason, self.excp_kind, self.delay, self.delay_source
+        )
+
+    def with_headers(self, headers):
+        """Take delay of a retry candidate from response headers, if they set one.
+
+        Args:
+            headers: Response headers.
+
+        Returns:
+            self
+
+        """
+        if self.retry:
+            delay, delay_source = retry_after_delay(headers)
+            if delay is not None:
+                self.delay, self.delay_source = delay, delay_source
+        return self
+
+
+class RequestRetryClassifier(object):
+    """Decide whether an attempt is retried, from the response or exception it produced.
+
+    Exceptions are classified by type, of the exception itself and of
+    exceptions it was raised from (see :func:`excp_chain`), never by message.
+    Delay of a retry candidate is taken from 'Retry-After' or
+    'X-RateLimit-Reset' headers of response, or of TUNE Request error.
+
+    Args:
+        retry_excps: (optional) Tuple of exceptions retried upon.
+        retry_excps_func: (optional) Function(excp, request_label) returning
+            True if other exceptions are retried upon.
+        retry_func: (optional) Function(response) returning True if
+            response is retried upon.
+        retry_http_status_codes: (optional) HTTP status codes of responses
+            and of TUNE Request errors retried upon.
+        retry_cause_excps: (optional) Tuple of exceptions retried upon when
+            found anywhere in the exception chain.
+    """
+
+    def __init__(
+        self,
+        retry_excps=None,
+        retry_excps_func=None,
+        retry_func=None,
+        retry_http_status_codes=None,
+        retry_cause_excps=None,
+    ):
+        self.retry_excps = retry_excps
+        self.retry_excps_func = retry_excps_func
+        self.retry_func = retry_func
+        self.retry_http_status_codes = retry_http_status_codes
+        self.retry_cause_excps = retry_cause_excps
+
+    def classify_response(self, response):
+        """Classify response of an attempt.
+
+        Args:
+            response: requests.Response
+
+        Returns:
+            RetryDecision
+
+        """
+        if self.retry_http_status_codes and \
+                response.status_code in self.retry_http_status_codes:
+            retry_decision = RetryDecision(
+                True, "HTTP Status: {}".format(response.status_code), http_status_code=response.status_code
+            )
+        elif self.retry_func is not None and self.retry_func(response):
+            retry_decision = RetryDecision(True, "Retry Func: {}".format(self.retry_func.__name__))
+        else:
+            return RetryDecision(False, "Valid")
+
+        return retry_decision.with_headers(response.headers)
+
+    def classify_excp(self, excp, request_label=None):
+        """Classify exception raised by an attempt.
+
+        Args:
+            excp: Exception
+            request_label: (optional) Label, passed to 'retry_excps_func'.
+
+        Returns:
+            RetryDecision
+
+        """
+        retry_decision = self._classify_excp(excp, request_label)
+
+        if isinstance(excp, TuneRequestBaseError):
+            retry_decision.with_headers(excp.error_headers)
+
+        return retry_decision
+
+    def _classify_excp(self, excp, request_label=None):
+        if self.retry_excps is not None and isinstance(excp, self.retry_excps):
+            return RetryDecision(True, base_class_name(excp), RetryExcpKind.EXPECTED)
+
+        excp_kind = RetryExcpKind.INTEGRATION if isinstance(excp, TuneRequestBaseError) else RetryExcpKind.UNEXPECTED
+
+        if self.retry_http_status_codes and isinstance(excp, TuneRequestBaseError):
+            for http_status_code in (excp.error_status, excp.error_code):
+                if http_status_code in self.retry_http_status_codes:
+                    return RetryDecision(
+                        True, "HTTP Status: {}".format(http_status_code), excp_kind, http_status_code=http_status_code
+                    )
+
+        if self.retry_cause_excps:
+            for cause_excp in excp_chain(excp):
+                if isinstance(cause_excp, self.retry_cause_excps):
+                    return RetryDecision(
+                        True, "Cause: {}".format(base_class_name(cause_excp)), RetryExcpKind.EXPECTED
+                    )
+
+        if self.retry_excps_func is not None and self.retry_excps_func(excp, request_label):
+            return RetryDecision(True, "Retry Exception Func: {}".format(self.retry_excps_func.__name__), excp_kind)
+
+        return RetryDecision(False, base_class_name(excp), excp_kind)
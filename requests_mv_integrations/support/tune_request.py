@@ -3,40 +3,232 @@
 #  @copyright 2016 TUNE, Inc. (http://www.tune.com)
 #  @namespace requests_mv_integrations
 
+import asyncio
+from collections import (deque)
+from concurrent.futures import (FIRST_COMPLETED, ThreadPoolExecutor, wait)
+from functools import partial
 from logging import getLogger
-# import grequests
+import threading
+import time
+
 import requests
 from requests.adapters import (HTTPAdapter, DEFAULT_POOLSIZE)
 from requests.packages.urllib3.util.retry import Retry
+from requests_mv_integrations.exceptions import (build_request_error)
 from requests_mv_integrations.support import (REQUEST_RETRY_HTTP_STATUS_CODES)
-from .singleton import (Singleton)
+from .retry_backoff import (ExponentialBackoff)
+from .retry_classifier import (retry_after_delay)
+from .utils import (base_class_name)
 
 log = getLogger(__name__)
 
 
-class TuneRequest(metaclass=Singleton):
+class TuneRetry(Retry):
+    """Adapter retries waiting as long as 'Retry-After', or else
+    'X-RateLimit-Reset', response header asks, and otherwise as
+    'backoff_strategy', if any, instead of 'backoff_factor'.
+    """
+
+    def __init__(self, backoff_strategy=None, backoff_delays=None, **kwargs):
+        super(TuneRetry, self).__init__(**kwargs)
+        self.backoff_strategy = backoff_strategy
+        self.backoff_delays = backoff_delays
+
+    def new(self, **kw):
+        # Retries of one request share delays of strategy, created on first retry.
+        kw.setdefault('backoff_strategy', self.backoff_strategy)
+        kw.setdefault('backoff_delays', self.backoff_delays)
+        return super(TuneRetry, self).new(**kw)
+
+    def get_backoff_time(self):
+        if self.backoff_strategy is None:
+            return super(TuneRetry, self).get_backoff_time()
+
+        if self.backoff_delays is None:
+            self.backoff_delays = self.backoff_strategy.delays()
+        return next(self.backoff_delays)
+
+    def get_retry_after(self, response):
+        retry_after, _ = retry_after_delay(response.headers)
+        return retry_after
+
+
+class TuneRequest(object):
     POOL_SIZE = DEFAULT_POOLSIZE
-    request_buffer = []
+    POOL_PREFIXES = ('http://', 'https://')
 
     __session = None
 
-    def __init__(self, retry_tries=3, retry_backoff=0.1, retry_codes=None):
+    def __init__(
+        self,
+        retry_tries=0,
+        retry_backoff=0,
+        retry_codes=None,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=False,
+        pool_adapters=None,
+    ):
+        """Pooled session with retries.
+
+        Args:
+            retry_tries: Retries made by adapter, default 0: caller owns
+                retries, as :class:`RequestMvIntegration` does, so that each
+                attempt it counts is one request sent.
+            retry_backoff: Backoff factor of adapter retries, or backoff
+                strategy, e.g. :class:`FullJitterBackoff`.
+            retry_codes: HTTP status codes retried by adapter.
+            pool_connections: Number of host pools to cache.
+            pool_maxsize: Maximum number of connections kept per host pool.
+            pool_block: Block when a host pool has no free connection
+                instead of opening a connection that is discarded afterwards.
+            pool_adapters: (optional) Dictionary of URL prefix, e.g.
+                'https://api.partner.com', to dictionary overriding
+                'pool_connections', 'pool_maxsize' or 'pool_block' for that prefix.
+        """
         self.session = requests.session()
+        self.last_used = time.monotonic()
+
+        self.__calls_in_use = 0
+        self.__calls_in_use_lock = threading.Lock()
 
         if retry_codes is None:
             retry_codes = set(REQUEST_RETRY_HTTP_STATUS_CODES)
 
-        self.session.mount(
-            'http',
-            HTTPAdapter(
-                max_retries=Retry(
-                    total=retry_tries,
-                    backoff_factor=retry_backoff,
-                    status_forcelist=retry_codes,
-                ),
+        self.retry_tries = retry_tries
+        self.retry_backoff = retry_backoff
+        self.retry_codes = retry_codes
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
+        for pool_prefix in self.POOL_PREFIXES:
+            self.mount_adapter(pool_prefix)
+
+        if pool_adapters:
+            for pool_prefix, pool_config in pool_adapters.items():
+                self.mount_adapter(pool_prefix, **pool_config)
+
+    def mount_adapter(self, pool_prefix, pool_connections=None, pool_maxsize=None, pool_block=None):
+        """Mount adapter with its own connection pools upon URL prefix.
+
+        Args:
+            pool_prefix: URL prefix, e.g. 'https://' or 'https://api.partner.com'.
+            pool_connections: (optional) Number of host pools to cache.
+            pool_maxsize: (optional) Maximum number of connections kept per host pool.
+            pool_block: (optional) Block when a host pool has no free connection.
+
+        Returns:
+            HTTPAdapter
+
+        """
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or self.pool_connections,
+            pool_maxsize=pool_maxsize or self.pool_maxsize,
+            pool_block=self.pool_block if pool_block is None else pool_block,
+            max_retries=TuneRetry(
+                total=self.retry_tries,
+                # Without retries, read errors are raised as such, e.g. ReadTimeout,
+                # instead of being wrapped as exhausting retries.
+                read=None if self.retry_tries else False,
+                backoff_factor=0 if isinstance(self.retry_backoff, ExponentialBackoff) else self.retry_backoff,
+                backoff_strategy=self.retry_backoff if isinstance(self.retry_backoff, ExponentialBackoff) else None,
+                status_forcelist=self.retry_codes,
+                raise_on_status=False,
             ),
         )
 
+        self.session.mount(pool_prefix, adapter)
+
+        return adapter
+
+    def pool_stats(self):
+        """Connection pool hit and miss counters of pools currently cached.
+
+        A miss is a request that had to open a new connection, a hit is a
+        request served by a pooled connection. Counters of host pools evicted
+        from an adapter (beyond 'pool_connections') are lost.
+
+        Returns:
+            Dictionary: 'pools' list of per host pool counters and totals.
+
+        """
+        pools_stats = []
+
+        for pool_prefix, pool in self._pools():
+            pool_misses = pool.num_connections
+            pool_requests = pool.num_requests
+
+            pools_stats.append({
+                'pool_prefix': pool_prefix,
+                'scheme': pool.scheme,
+                'host': pool.host,
+                'port': pool.port,
+                'pool_maxsize': pool.pool.maxsize if pool.pool else None,
+                'pool_requests': pool_requests,
+                'pool_hits': max(pool_requests - pool_misses, 0),
+                'pool_misses': pool_misses,
+            })
+
+        return {
+            'pools': pools_stats,
+            'pool_requests': sum(pool_stats['pool_requests'] for pool_stats in pools_stats),
+            'pool_hits': sum(pool_stats['pool_hits'] for pool_stats in pools_stats),
+            'pool_misses': sum(pool_stats['pool_misses'] for pool_stats in pools_stats),
+        }
+
+    def connections_in_use(self):
+        """Connections taken from pools and not given back yet, e.g. that of
+        a streamed response being read.
+        """
+        return sum(
+            max(0, pool.pool.maxsize - pool.pool.qsize()) for _, pool in self._pools() if pool.pool is not None
+        )
+
+    def _pools(self):
+        """Host pools currently cached by adapters of session.
+
+        Returns:
+            Generator of (pool_prefix, HTTPConnectionPool)
+
+        """
+        adapters = []
+
+        for pool_prefix, adapter in self.session.adapters.items():
+            if adapter in adapters or not hasattr(adapter, 'poolmanager'):
+                continue
+            adapters.append(adapter)
+
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                yield pool_prefix, pool
+
+    @property
+    def in_use(self):
+        """Whether a call holds session, see :meth:`acquire`, or a response
+        still holds one of its connections.
+        """
+        return self.__calls_in_use > 0 or self.connections_in_use() > 0
+
+    def acquire(self):
+        """Hold session for a call, across its attempts and retry delays,
+        so that it is not closed as idle; give back with :meth:`release`.
+        """
+        with self.__calls_in_use_lock:
+            self.__calls_in_use += 1
+        self.last_used = time.monotonic()
+
+    def release(self):
+        """Give back session held by :meth:`acquire`; idle time starts now.
+        """
+        with self.__calls_in_use_lock:
+            self.__calls_in_use = max(0, self.__calls_in_use - 1)
+        self.last_used = time.monotonic()
+
     @property
     def session(self):
         return self.__session
@@ -46,12 +238,20 @@ class TuneRequest(metaclass=Singleton):
         self.__session = value
 
     def request(self, request_method, request_url, **kwargs):
+        self.last_used = time.monotonic()
+
         response = self.session.request(method=request_method, url=request_url, **kwargs)
 
         return response
 
+    def close(self):
+        """Close pooled connections not in use.
+        """
+        self.session.close()
+
     def request_safe(self, request_method, request_url, response_hook=None, exception_handler=None, **kwargs):
         response_hook, exception_handler = self.create_hooks(response_hook, exception_handler)
+        self.last_used = time.monotonic()
 
         try:
             return self.session.request(
@@ -61,19 +261,88 @@ class TuneRequest(metaclass=Singleton):
             exception_handler(e)
             return None
 
-    # def request_async(self, request_method, request_urls, response_hook=None, exception_handler=None, **kwargs):
-    #     response_hook, exception_handler = self.create_hooks(response_hook, exception_handler)
-    #
-    #     unsent = [
-    #         grequests.request(
-    #             method=request_method,
-    #             url=request_url,
-    #             session=self.session,
-    #             hooks={'response': response_hook},
-    #             **kwargs
-    #         ) for request_url in request_urls
-    #     ]
-    #     return grequests.imap(unsent, size=self.POOL_SIZE, exception_handler=exception_handler)
+    def request_many(self, request_specs, max_workers=None, ordered=False, mv_request=None):
+        """Request many through pooled session using a bounded thread pool.
+
+        Each request is made by :meth:`RequestMvIntegration.request`, so it
+        is retried, classified and its errors mapped as any other request.
+
+        Args:
+            request_specs: Iterable of dictionaries of arguments of
+                :meth:`RequestMvIntegration.request`, e.g. 'request_method',
+                'request_url', 'request_params' and 'request_retry'.
+            max_workers: (optional) Maximum concurrent requests, default pool_maxsize.
+            ordered: (optional) Yield in order of request_specs instead of
+                order of completion.
+            mv_request: (optional) RequestMvIntegration making requests,
+                default one using this pooled session.
+
+        Returns:
+            Generator of requests.Response or TuneRequestBaseError, one per request spec.
+
+        """
+        if mv_request is None:
+            # Imported here: RequestMvIntegration is built upon this module.
+            from requests_mv_integrations.request_mv_integration import (RequestMvIntegration)
+            mv_request = RequestMvIntegration(tune_request=self)
+
+        max_workers = max_workers or self.pool_maxsize
+        request_specs = iter(request_specs)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = deque()
+
+        def submit():
+            for request_spec in request_specs:
+                futures.append(executor.submit(self._request_spec, mv_request, request_spec))
+                if len(futures) >= max_workers * 2:
+                    break
+
+        try:
+            submit()
+            while futures:
+                if ordered:
+                    yield futures.popleft().result()
+                else:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        futures.remove(future)
+                        yield future.result()
+                submit()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _request_spec(mv_request, request_spec):
+        try:
+            return mv_request.request(**request_spec)
+        except Exception as ex:
+            log.warning(
+                "Request Many: Failed", extra={'request_url': request_spec.get('request_url'),
+                                               'error_exception': base_class_name(ex)}
+            )
+            return build_request_error(ex)
+
+    async def request_async(self, request_method, request_url, executor=None, **kwargs):
+        """Request through pooled session without blocking the event loop.
+
+        Args:
+            request_method:
+            request_url:
+            executor: (optional) Executor sending request, None for the event loop default.
+            **kwargs: Arguments of :meth:`requests.Session.request`.
+
+        Returns:
+            requests.Response
+
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            executor, partial(self.request, request_method, request_url, **kwargs)
+        )
 
     def response_hook(self, r, *args, **kwargs):
         log.info("{0} {1} {2}".format(r.request.method, r.url, str(r.status_code)))
@@ -107,11 +376,13 @@ class TuneRequest(metaclass=Singleton):
 
 
 def backoff(factor, max_delay):
+    """Exponential backoff: each call returns previous delay times 'factor', capped by 'max_delay'.
+    """
     sleep_time = 1
 
     def inner():
-        asleep_time = sleep_time * factor
-        asleep_time = asleep_time if asleep_time < max_delay else max_delay
-        return asleep_time
+        nonlocal sleep_time
+        sleep_time = min(sleep_time * factor, max_delay)
+        return sleep_time
 
     return inner
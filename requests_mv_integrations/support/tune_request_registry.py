@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Registry of TuneRequest pooled sessions
+"""
+
+import threading
+import time
+from collections import (OrderedDict)
+from logging import getLogger
+
+from .singleton import (Singleton)
+from .tune_request import (TuneRequest)
+
+log = getLogger(__name__)
+
+
+class TuneRequestRegistry(metaclass=Singleton):
+    """Process wide registry of TuneRequest pooled sessions.
+
+    Sessions are keyed by retry policy, pool configuration and host group,
+    so integrations with different retry profiles get separate sessions.
+    Least recently used sessions are closed once there are more than
+    'max_sessions', and sessions unused for 'max_idle_secs' are closed
+    to release their sockets. Sessions in use, held by a call across its
+    retries or by a response being streamed, are never closed.
+    """
+
+    def __init__(self, max_sessions=32, max_idle_secs=300):
+        self.max_sessions = max_sessions
+        self.max_idle_secs = max_idle_secs
+
+        self.__lock = threading.Lock()
+        self.__tune_requests = OrderedDict()
+
+    def __len__(self):
+        return len(self.__tune_requests)
+
+    @staticmethod
+    def tune_request_key(host_group=None, retry_tries=0, retry_backoff=0, retry_codes=None, **pool_config):
+        pool_adapters = pool_config.pop('pool_adapters', None)
+        if pool_adapters:
+            pool_adapters = tuple(
+                (pool_prefix, tuple(sorted(pool_adapter_config.items())))
+                for pool_prefix, pool_adapter_config in sorted(pool_adapters.items())
+            )
+
+        return (
+            host_group,
+            retry_tries,
+            retry_backoff,
+            frozenset(retry_codes) if retry_codes is not None else None,
+            tuple(sorted(pool_config.items())),
+            pool_adapters,
+        )
+
+    def get(self, host_group=None, retry_tries=0, retry_backoff=0, retry_codes=None, **pool_config):
+        """Get TuneRequest for retry policy and host group, create if none.
+
+        Args:
+            host_group: (optional) Name of group of hosts sharing a session, e.g. partner name.
+            retry_tries:
+            retry_backoff:
+            retry_codes:
+            **pool_config: Pool configuration of :class:`TuneRequest`.
+
+        Returns:
+            TuneRequest
+
+        """
+        tune_request_key = self.tune_request_key(
+            host_group=host_group,
+            retry_tries=retry_tries,
+            retry_backoff=retry_backoff,
+            retry_codes=retry_codes,
+            **pool_config
+        )
+
+        with self.__lock:
+            self._evict(time.monotonic())
+
+            tune_request = self.__tune_requests.get(tune_request_key, None)
+            if tune_request is None:
+                log.debug(
+                    "TuneRequest Registry: Create",
+                    extra={'host_group': host_group,
+                           'sessions': len(self.__tune_requests) + 1}
+                )
+                tune_request = TuneRequest(
+                    retry_tries=retry_tries, retry_backoff=retry_backoff, retry_codes=retry_codes, **pool_config
+                )
+                self.__tune_requests[tune_request_key] = tune_request
+            else:
+                self.__tune_requests.move_to_end(tune_request_key)
+
+            tune_request.last_used = time.monotonic()
+
+            for tune_request_lru_key, tune_request_lru in list(self.__tune_requests.items()):
+                if len(self.__tune_requests) <= self.max_sessions:
+                    break
+                if tune_request_lru is tune_request or tune_request_lru.in_use:
+                    continue
+                del self.__tune_requests[tune_request_lru_key]
+                tune_request_lru.close()
+
+        return tune_request
+
+    def evict_idle(self):
+        """Close sessions unused for more than 'max_idle_secs'.
+        """
+        with self.__lock:
+            self._evict(time.monotonic())
+
+    def close(self):
+        """Close all sessions.
+        """
+        with self.__lock:
+            while self.__tune_requests:
+                _, tune_request = self.__tune_requests.popitem(last=False)
+                tune_request.close()
+
+    def _evict(self, now):
+        if self.max_idle_secs is None:
+            return
+
+        for tune_request_key, tune_request in list(self.__tune_requests.items()):
+            if now - tune_request.last_used > self.max_idle_secs and not tune_request.in_use:
+                log.debug("TuneRequest Registry: Evict Idle", extra={'host_group': tune_request_key[0]})
+                del self.__tune_requests[tune_request_key]
+                tune_request.close()
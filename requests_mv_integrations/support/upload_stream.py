@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Helpers: Streaming Upload
+"""
+
+import json
+import queue
+import tempfile
+import threading
+import time
+import zlib
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+
+class UploadFormat(object):
+    """Serialization of records streamed by :class:`UploadStream`.
+
+    JSON: Records as one JSON array.
+    NDJSON: Records as newline delimited JSON.
+    BYTES: Records are bytes (or str, encoded UTF-8) sent as is.
+    """
+    JSON = 'json'
+    NDJSON = 'ndjson'
+    BYTES = 'bytes'
+
+    ALL = (JSON, NDJSON, BYTES)
+
+    CONTENT_TYPES = {
+        JSON: 'application/json; charset=utf8',
+        NDJSON: 'application/x-ndjson; charset=utf8',
+        BYTES: 'application/octet-stream',
+    }
+
+
+class UploadStream(object):
+    """Request body serializing, and optionally gzipping, records as it is sent.
+
+    Records are pulled only as the connection accepts the body, so memory
+    is bounded by 'chunk_size' and a slow upload slows the producer down.
+
+    'records' is either an iterable, or a callable returning a new iterable
+    of same records, in which case body can be iterated again, e.g. to
+    retry the upload.
+
+    Body is sent with chunked transfer encoding, unless 'content_length'
+    of uncompressed bytes body is known.
+    """
+
+    def __init__(
+        self,
+        records,
+        upload_format=UploadFormat.NDJSON,
+        gzip_level=None,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        content_length=None,
+        progress_func=None,
+    ):
+        if upload_format not in UploadFormat.ALL:
+            raise ValueError("Unexpected 'upload_format': '{}'".format(upload_format))
+        if content_length is not None and (gzip_level is not None or upload_format != UploadFormat.BYTES):
+            raise ValueError("'content_length' is only known for uncompressed bytes")
+
+        self.records = records
+        self.upload_format = upload_format
+        self.gzip_level = gzip_level
+        self.chunk_size = chunk_size
+        self.content_length = content_length
+        self.progress_func = progress_func
+
+        self.iterations = 0
+        self.records_count = 0
+        self.bytes_read = 0
+        self.bytes_sent = 0
+        self.time_start = None
+
+    @property
+    def is_repeatable(self):
+        return callable(self.records)
+
+    @property
+    def content_type(self):
+        if self.gzip_level is not None:
+            return 'application/gzip'
+        return UploadFormat.CONTENT_TYPES[self.upload_format]
+
+    @property
+    def upload_progress(self):
+        elapsed_secs = time.monotonic() - self.time_start if self.time_start else 0.0
+        return {
+            'records_count': self.records_count,
+            'bytes_read': self.bytes_read,
+            'bytes_sent': self.bytes_sent,
+            'elapsed_secs': elapsed_secs,
+            'bytes_per_sec': self.bytes_sent / elapsed_secs if elapsed_secs else 0.0,
+        }
+
+    def __len__(self):
+        # requests sends 'Content-Length' if not 0, else 'Transfer-Encoding: chunked'.
+        return self.content_length or 0
+
+    def __bool__(self):
+        return True
+
+    def __iter__(self):
+        if self.iterations and not self.is_repeatable:
+            raise ValueError("Upload Stream: Records cannot be iterated again")
+
+        self.iterations += 1
+        self.records_count = 0
+        self.bytes_read = 0
+        self.bytes_sent = 0
+        self.time_start = time.monotonic()
+
+        records = self.records() if self.is_repeatable else self.records
+
+        compressor = None
+        if self.gzip_level is not None:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+        buffer = bytearray()
+        for data in self.__serialize(records):
+            self.bytes_read += len(data)
+            buffer += compressor.compress(data) if compressor else data
+
+            if len(buffer) >= self.chunk_size:
+                yield self.__sent(buffer)
+                buffer = bytearray()
+
+        if compressor:
+            buffer += compressor.flush()
+        if buffer:
+            yield self.__sent(buffer)
+
+    def __sent(self, buffer):
+        chunk = bytes(buffer)
+        self.bytes_sent += len(chunk)
+        if self.progress_func:
+            self.progress_func(self.upload_progress)
+        return chunk
+
+    def __serialize(self, records):
+        if self.upload_format == UploadFormat.BYTES:
+            for record in records:
+                self.records_count += 1
+                yield record.encode('utf-8') if isinstance(record, str) else record
+            return
+
+        if self.upload_format == UploadFormat.NDJSON:
+            for record in records:
+                self.records_count += 1
+                yield (json.dumps(record) + '\n').encode('utf-8')
+            return
+
+        delimiter = '['
+        for record in records:
+            self.records_count += 1
+            yield (delimiter + json.dumps(record)).encode('utf-8')
+            delimiter = ','
+        yield b'[]' if delimiter == '[' else b']'
+
+
+class GzipFileStream(object):
+    """Request body gzipping a file as it is sent, without writing a '.gz' file.
+
+    File is read and compressed by a worker thread into a bounded queue of
+    chunks, so compression overlaps sending while memory stays bounded by
+    'queue_size' chunks. Body can be iterated again, e.g. to retry upload.
+
+    Compressed size being unknown, body is sent with chunked transfer
+    encoding, which some servers reject, e.g. S3 presigned PUT URLs; use
+    :class:`GzipSpooledFile` for those.
+
+    Worker gives up if no chunk is taken from the queue for 'put_timeout'
+    seconds, e.g. because upload was abandoned, and body iteration then
+    fails instead of waiting forever.
+    """
+
+    def __init__(self, file_path, gzip_level=6, chunk_size=UPLOAD_CHUNK_SIZE, queue_size=8, put_timeout=60):
+        self.file_path = file_path
+        self.gzip_level = gzip_level
+        self.chunk_size = chunk_size
+        self.queue_size = queue_size
+        self.put_timeout = put_timeout
+
+        self.bytes_read = 0
+        self.bytes_sent = 0
+
+        self.__stop = None
+
+    def __len__(self):
+        return 0
+
+    def __bool__(self):
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def __iter__(self):
+        # Worker of previous pass, e.g. of an abandoned attempt, must not count into this one.
+        if self.__stop is not None:
+            self.__stop.set()
+        stop = self.__stop = threading.Event()
+
+        self.bytes_read = 0
+        self.bytes_sent = 0
+
+        chunks = queue.Queue(maxsize=self.queue_size)
+
+        worker = threading.Thread(
+            target=self.__compress, args=(chunks, stop), name="GzipFileStream", daemon=True
+        )
+        worker.start()
+
+        try:
+            while True:
+                try:
+                    chunk = chunks.get(timeout=0.1)
+                except queue.Empty:
+                    if worker.is_alive() or not chunks.empty():
+                        continue
+                    raise IOError("Gzip File Stream: Compression stopped: {}".format(self.file_path))
+
+                if chunk is None:
+                    return
+                if isinstance(chunk, BaseException):
+                    raise chunk
+
+                self.bytes_sent += len(chunk)
+                yield chunk
+        finally:
+            stop.set()
+
+    def __compress(self, chunks, stop):
+        def put(item):
+            put_until = time.monotonic() + self.put_timeout
+            while not stop.is_set() and time.monotonic() < put_until:
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            buffer = bytearray()
+            bytes_read = 0
+
+            with open(self.file_path, 'rb') as file_rb:
+                for data in iter(lambda: file_rb.read(self.chunk_size), b''):
+                    bytes_read += len(data)
+                    if not stop.is_set():
+                        self.bytes_read = bytes_read
+                    buffer += compressor.compress(data)
+                    if len(buffer) >= self.chunk_size:
+                        if not put(bytes(buffer)):
+                            return
+                        buffer = bytearray()
+
+            buffer += compressor.flush()
+            if buffer and not put(bytes(buffer)):
+                return
+
+            put(None)
+
+        except Exception as ex:
+            put(ex)
+
+
+class GzipSpooledFile(object):
+    """Request body of a file gzipped into a spooled temporary file before it is sent.
+
+    Compressed size being known once file is gzipped, body is sent with
+    'Content-Length', as required by servers rejecting chunked transfer
+    encoding, e.g. S3 presigned PUT URLs. Compressed bytes are kept in
+    memory up to 'spool_max_size', then spill to a temporary file, which
+    is removed on exit. Body can be iterated again, e.g. to retry upload.
+    """
+
+    def __init__(self, file_path, gzip_level=6, chunk_size=UPLOAD_CHUNK_SIZE, spool_max_size=UPLOAD_PART_SIZE):
+        self.file_path = file_path
+        self.gzip_level = gzip_level
+        self.chunk_size = chunk_size
+        self.spool_max_size = spool_max_size
+
+        self.bytes_read = 0
+        self.bytes_sent = 0
+        self.content_length = None
+
+        self.__spool_file = None
+
+    def __len__(self):
+        return self.__spooled().content_length
+
+    def __bool__(self):
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.__spool_file is not None:
+            self.__spool_file.close()
+            self.__spool_file = None
+
+    def __iter__(self):
+        self.__spooled()
+
+        spool_file = self.__spool_file
+        spool_file.seek(0)
+
+        self.bytes_sent = 0
+        for chunk in iter(lambda: spool_file.read(self.chunk_size), b''):
+            self.bytes_sent += len(chunk)
+            yield chunk
+
+    def __spooled(self):
+        if self.__spool_file is not None:
+            return self
+
+        spool_file = tempfile.SpooledTemporaryFile(max_size=self.spool_max_size)
+        try:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+            self.bytes_read = 0
+            with open(self.file_path, 'rb') as file_rb:
+                for data in iter(lambda: file_rb.read(self.chunk_size), b''):
+                    self.bytes_read += len(data)
+                    spool_file.write(compressor.compress(data))
+
+            spool_file.write(compressor.flush())
+        except Exception:
+            spool_file.close()
+            raise
+
+        self.content_length = spool_file.tell()
+        self.__spool_file = spool_file
+        return self
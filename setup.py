@@ -40,12 +40,11 @@ CLASSIFIERS = [
     'Natural Language :: English',
     'Programming Language :: Python',
     'Programming Language :: Python :: 3',
-    'Programming Language :: Python :: 3.0',
-    'Programming Language :: Python :: 3.1',
-    'Programming Language :: Python :: 3.2',
-    'Programming Language :: Python :: 3.3',
-    'Programming Language :: Python :: 3.4',
-    'Programming Language :: Python :: 3.5',
+    'Programming Language :: Python :: 3.7',
+    'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Programming Language :: Python :: 3.11',
     'Topic :: Software Development :: Libraries :: Python Modules'
 ]
 
@@ -67,6 +66,7 @@ setup(
     author_email='jefft@tune.com',
     url='https://github.com/TuneLab/requests-mv-integrations',
     install_requires=REQUIREMENTS,
+    python_requires='>=3.7',
     packages=PACKAGES,
     package_dir={'requests-mv-integrations': 'requests-mv-integrations'},
     include_package_data=True,
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: CircuitBreaker states, with a stub clock, and within the retry loop.
+"""
+
+import http.server
+import logging
+import socketserver
+import threading
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegration)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (
+    TuneRequestClientError,
+    TuneRequestServiceError,
+    TuneRequestValueError,
+)
+from requests_mv_integrations.support import (
+    CircuitBreaker,
+    CircuitState,
+    RequestCircuitBreakers,
+)
+
+
+class StubClock(object):
+    """Monotonic clock moved forward by tests only.
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, secs):
+        self.now += secs
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = StubClock()
+        self.circuit_breaker = CircuitBreaker(
+            name='api.partner.com', failure_threshold=3, recovery_secs=30.0, clock=self.clock
+        )
+
+    def open_circuit(self):
+        for _ in range(3):
+            self.assertTrue(self.circuit_breaker.allow())
+            self.circuit_breaker.record_failure()
+        self.assertEqual(self.circuit_breaker.state, CircuitState.OPEN)
+
+    def test_closed_until_threshold(self):
+        for _ in range(2):
+            self.assertTrue(self.circuit_breaker.allow())
+            self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+        self.assertEqual(self.circuit_breaker.failures, 2)
+        self.assertEqual(self.circuit_breaker.retry_after, 0.0)
+
+    def test_success_resets_failures(self):
+        for _ in range(2):
+            self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        for _ in range(2):
+            self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+        self.assertEqual(self.circuit_breaker.failures, 2)
+
+    def test_open_fails_fast_until_recovery(self):
+        self.open_circuit()
+
+        self.assertFalse(self.circuit_breaker.allow())
+        self.assertEqual(self.circuit_breaker.retry_after, 30.0)
+
+        self.clock.advance(29.0)
+        self.assertFalse(self.circuit_breaker.allow())
+        self.assertEqual(self.circuit_breaker.retry_after, 1.0)
+
+    def test_half_open_trial_success_closes(self):
+        self.open_circuit()
+        self.clock.advance(30.0)
+
+        self.assertTrue(self.circuit_breaker.allow())
+        self.assertEqual(self.circuit_breaker.state, CircuitState.HALF_OPEN)
+        self.assertFalse(self.circuit_breaker.allow())
+
+        self.circuit_breaker.record_success()
+
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+        self.assertEqual(self.circuit_breaker.failures, 0)
+        self.assertTrue(self.circuit_breaker.allow())
+
+    def test_half_open_trial_failure_opens(self):
+        self.open_circuit()
+        self.clock.advance(30.0)
+
+        self.assertTrue(self.circuit_breaker.allow())
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, CircuitState.OPEN)
+        self.assertEqual(self.circuit_breaker.retry_after, 30.0)
+        self.assertFalse(self.circuit_breaker.allow())
+
+    def test_half_open_release(self):
+        self.open_circuit()
+        self.clock.advance(30.0)
+
+        self.assertTrue(self.circuit_breaker.allow())
+        self.circuit_breaker.release()
+
+        self.assertEqual(self.circuit_breaker.state, CircuitState.HALF_OPEN)
+        self.assertTrue(self.circuit_breaker.allow())
+        self.assertFalse(self.circuit_breaker.allow())
+
+
+class TestRequestCircuitBreakers(unittest.TestCase):
+
+    def test_invalid_failure_threshold(self):
+        with self.assertRaises(TuneRequestValueError):
+            RequestCircuitBreakers(failure_threshold=0)
+
+    def test_circuit_breaker_per_host(self):
+        circuit_breakers = RequestCircuitBreakers(failure_threshold=1)
+
+        circuit_breaker = circuit_breakers.circuit_breaker('https://API.partner.com/v1/report')
+        self.assertIs(circuit_breakers.circuit_breaker('https://api.partner.com/v2/status'), circuit_breaker)
+        self.assertIsNot(circuit_breakers.circuit_breaker('https://api.other.com/v1/report'), circuit_breaker)
+
+        circuit_breaker.record_failure()
+        self.assertEqual(
+            circuit_breakers.circuit_states(), {
+                'api.partner.com': CircuitState.OPEN,
+                'api.other.com': CircuitState.CLOSED
+            }
+        )
+
+    def test_is_failure(self):
+        self.assertTrue(RequestCircuitBreakers.is_failure(ConnectionResetError()))
+        self.assertTrue(RequestCircuitBreakers.is_failure(TuneRequestServiceError(error_code=503)))
+        self.assertFalse(RequestCircuitBreakers.is_failure(TuneRequestClientError(error_code=404)))
+        self.assertFalse(RequestCircuitBreakers.is_failure(TuneRequestValueError()))
+
+
+class StubUnavailableHandler(http.server.BaseHTTPRequestHandler):
+    """GET /ok answers 200, any other path 503.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+
+        self.send_response(200 if self.path == '/ok' else 503)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class StubUnavailableServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestCircuitBreakerRequest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubUnavailableServer(('127.0.0.1', 0), StubUnavailableHandler)
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits = 0
+        self.clock = StubClock()
+        self.circuit_breakers = RequestCircuitBreakers(failure_threshold=2, recovery_secs=30.0, clock=self.clock)
+        self.mv_request = RequestMvIntegration(logger_level=logging.CRITICAL, circuit_breakers=self.circuit_breakers)
+        self.circuit_breaker = self.circuit_breakers.circuit_breaker(self.server_url)
+
+    def request(self, path, tries=5):
+        return self.mv_request.request('GET', self.server_url + path, request_retry={'tries': tries, 'delay': 0})
+
+    def test_circuit_opens_within_retries(self):
+        with self.assertRaises(TuneRequestServiceError) as context:
+            self.request('/unavailable')
+
+        self.assertEqual(context.exception.error_code, TuneRequestErrorCodes.REQ_ERR_CIRCUIT_OPEN)
+        self.assertEqual(self.server.hits, 2)
+        self.assertEqual(self.circuit_breaker.state, CircuitState.OPEN)
+
+        with self.assertRaises(TuneRequestServiceError):
+            self.request('/ok')
+        self.assertEqual(self.server.hits, 2)
+
+    def test_circuit_closes_upon_trial_success(self):
+        with self.assertRaises(TuneRequestServiceError):
+            self.request('/unavailable')
+
+        self.clock.advance(30.0)
+        response = self.request('/ok')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+
+    def test_interrupted_attempt_releases_trial(self):
+        with self.assertRaises(TuneRequestServiceError):
+            self.request('/unavailable')
+        self.clock.advance(30.0)
+
+        def interrupted(request_url, timeout):
+            raise KeyboardInterrupt()
+
+        request_context = self.mv_request._prep_request_retry(request_retry={'tries': 5, 'delay': 0})
+        with self.assertRaises(KeyboardInterrupt):
+            self.mv_request._request_retry(
+                call_func=interrupted, fkwargs={'request_url': self.server_url + '/ok'}, request_context=request_context
+            )
+
+        self.assertEqual(self.circuit_breaker.state, CircuitState.HALF_OPEN)
+        response = self.request('/ok')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+
+
+if __name__ == '__main__':
+    unittest.main()
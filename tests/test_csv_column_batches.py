@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: Typed column batches of CSV rows.
+"""
+
+import unittest
+
+from requests_mv_integrations.exceptions import (TuneRequestValueError)
+from requests_mv_integrations.support import (
+    CsvBatchFormat,
+    csv_column_batches,
+)
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+CSV_KEYS = ['id', 'name', 'value']
+
+
+def column_batches(csv_rows, **kwargs):
+    return list(csv_column_batches(iter(csv_rows), CSV_KEYS, batch_size=2, **kwargs))
+
+
+class TestCsvColumnBatches(unittest.TestCase):
+
+    def test_inferred_types(self):
+        batches = column_batches([['1', 'a', '0.5'], ['2', 'b', '3']])
+
+        self.assertEqual(batches, [{'id': [1, 2], 'name': ['a', 'b'], 'value': [0.5, 3.0]}])
+
+    def test_empty_values_none(self):
+        batches = column_batches([['1', '', ''], ['', 'b', '2.5']])
+
+        self.assertEqual(batches, [{'id': [1, None], 'name': [None, 'b'], 'value': [None, 2.5]}])
+
+    def test_empty_column_str(self):
+        batches = column_batches([['1', '', 'a'], ['2', '', 'b'], ['3', 'c', 'd']])
+
+        self.assertEqual(batches[0]['name'], [None, None])
+        self.assertEqual(batches[1]['name'], ['c'])
+
+    def test_inferred_types_kept(self):
+        batches = column_batches([['1', 'a', '1'], ['2', 'b', '2'], ['3', 'c', '']])
+
+        self.assertEqual(batches[1], {'id': [3], 'name': ['c'], 'value': [None]})
+        self.assertIsInstance(batches[1]['id'][0], int)
+
+    def test_inferred_type_not_fitting_later_batch(self):
+        with self.assertRaises(TuneRequestValueError):
+            column_batches([['1', 'a', '1'], ['2', 'b', '2'], ['3', 'c', '2.5']])
+
+    def test_schema(self):
+        batches = column_batches(
+            [['1', 'a', '1'], ['2', 'b', '2'], ['3', '', '2.5']], csv_schema={'value': float,
+                                                                             'name': str}
+        )
+
+        self.assertEqual(batches[0]['value'], [1.0, 2.0])
+        self.assertEqual(batches[1], {'id': [3], 'name': [None], 'value': [2.5]})
+
+    def test_schema_not_fitting(self):
+        with self.assertRaises(TuneRequestValueError):
+            column_batches([['x', 'a', '1']], csv_schema={'id': int})
+
+    def test_schema_unexpected_type(self):
+        with self.assertRaises(TuneRequestValueError):
+            column_batches([['1', 'a', '1']], csv_schema={'id': bool})
+
+    def test_unexpected_batch_format(self):
+        with self.assertRaises(TuneRequestValueError):
+            column_batches([['1', 'a', '1']], csv_batch_format='bad')
+
+    @unittest.skipIf(pyarrow is None, "Requires 'pyarrow' installed")
+    def test_arrow_schema_same_for_all_batches(self):
+        batches = column_batches(
+            [['1', 'a', '1'], ['2', 'b', '2'], ['', '', '']], csv_batch_format=CsvBatchFormat.ARROW
+        )
+
+        self.assertEqual(batches[0].schema, batches[1].schema)
+        self.assertEqual(batches[0].schema.types, [pyarrow.int64(), pyarrow.string(), pyarrow.int64()])
+
+
+if __name__ == '__main__':
+    unittest.main()
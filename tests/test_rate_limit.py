@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: Token buckets of RequestRateLimiter, with a stub clock.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from requests_mv_integrations.exceptions import (TuneRequestValueError)
+from requests_mv_integrations.support import (
+    FileTokenBucket,
+    RateLimitKey,
+    RequestRateLimiter,
+    TokenBucket,
+)
+
+
+class StubClock(object):
+    """Clock moved forward by tests only.
+    """
+
+    def __init__(self, now=1500000000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, secs):
+        self.now += secs
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = StubClock()
+
+    def test_invalid_rate(self):
+        for rate in (None, 0, -1):
+            with self.assertRaises(TuneRequestValueError):
+                TokenBucket(rate=rate)
+
+    def test_burst_defaults_to_rate(self):
+        self.assertEqual(TokenBucket(rate=5).burst, 5.0)
+        self.assertEqual(TokenBucket(rate=0.5).burst, 1.0)
+
+    def test_burst_then_queue(self):
+        bucket = TokenBucket(rate=2, burst=3, clock=self.clock)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        # Tokens go negative: each request waits for its own token.
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.5, 1.0, 1.5])
+
+    def test_refill(self):
+        bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        self.assertEqual(bucket.reserve(), 0.5)
+
+        # Token owed by last request is refilled first.
+        self.clock.advance(1.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_refill_capped_by_burst(self):
+        bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+        bucket.reserve()
+
+        self.clock.advance(60.0)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.5])
+
+
+class TestFileTokenBucket(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = StubClock()
+        self.tmp_directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.tmp_directory, 'rate_limit.state')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_directory)
+
+    def test_shared_by_buckets_of_same_file(self):
+        # As if each bucket were that of another process.
+        buckets = [FileTokenBucket(self.file_path, rate=1, burst=2, clock=self.clock) for _ in range(2)]
+
+        self.assertEqual(buckets[0].reserve(), 0.0)
+        self.assertEqual(buckets[1].reserve(), 0.0)
+        self.assertEqual(buckets[0].reserve(), 1.0)
+        self.assertEqual(buckets[1].reserve(), 2.0)
+
+    def test_refill(self):
+        bucket = FileTokenBucket(self.file_path, rate=1, burst=2, clock=self.clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        self.clock.advance(1.0)
+        self.assertEqual(FileTokenBucket(self.file_path, rate=1, burst=2, clock=self.clock).reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 1.0)
+
+    def test_state_file(self):
+        FileTokenBucket(self.file_path, rate=1, burst=3, clock=self.clock).reserve()
+
+        with open(self.file_path) as state_file:
+            bucket_tokens, bucket_time_last = (float(value) for value in state_file.read().split())
+
+        self.assertEqual(bucket_tokens, 2.0)
+        self.assertEqual(bucket_time_last, self.clock.now)
+
+    def test_invalid_state_file(self):
+        with open(self.file_path, 'w') as state_file:
+            state_file.write('garbage')
+
+        bucket = FileTokenBucket(self.file_path, rate=1, burst=1, clock=self.clock)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 1.0)
+
+
+class TestRequestRateLimiter(unittest.TestCase):
+
+    def test_invalid_rate_limit_key(self):
+        with self.assertRaises(TuneRequestValueError):
+            RequestRateLimiter(rate=1, rate_limit_key='path')
+
+    def test_bucket_per_host(self):
+        rate_limiter = RequestRateLimiter(rate=1, burst=1)
+
+        self.assertEqual(rate_limiter.reserve('https://API.partner.com/v1/report'), 0.0)
+        self.assertGreater(rate_limiter.reserve('https://api.partner.com/v2/status'), 0.0)
+        self.assertEqual(rate_limiter.reserve('https://api.other.com/v1/report'), 0.0)
+
+    def test_bucket_per_request_label(self):
+        rate_limiter = RequestRateLimiter(rate=1, burst=1, rate_limit_key=RateLimitKey.REQUEST_LABEL)
+
+        self.assertEqual(rate_limiter.reserve('https://api.partner.com/v1/report', 'Report'), 0.0)
+        self.assertGreater(rate_limiter.reserve('https://api.other.com/v1/report', 'Report'), 0.0)
+        self.assertEqual(rate_limiter.reserve('https://api.partner.com/v1/report', 'Status'), 0.0)
+
+    def test_rate_limits(self):
+        rate_limiter = RequestRateLimiter(rate_limits={'api.partner.com': (1, 1)})
+
+        self.assertIsNone(rate_limiter.bucket('api.other.com'))
+        self.assertEqual([rate_limiter.reserve('https://api.other.com/') for _ in range(3)], [0.0, 0.0, 0.0])
+
+        bucket = rate_limiter.bucket('api.partner.com')
+        self.assertEqual((bucket.rate, bucket.burst), (1.0, 1.0))
+        self.assertIs(rate_limiter.bucket('api.partner.com'), bucket)
+
+    def test_state_dir(self):
+        tmp_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_directory)
+
+        rate_limiter = RequestRateLimiter(rate=1, state_dir=tmp_directory)
+        bucket = rate_limiter.bucket('api.partner.com:8443')
+
+        self.assertIsInstance(bucket, FileTokenBucket)
+        self.assertEqual(bucket.file_path, os.path.join(tmp_directory, 'rate_limit_api.partner.com_8443.state'))
+
+
+if __name__ == '__main__':
+    unittest.main()
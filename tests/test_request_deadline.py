@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: RequestDeadline, with a stub clock, and within the retry loop.
+"""
+
+import http.server
+import logging
+import socketserver
+import threading
+import time
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegration)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (TuneRequestModuleError)
+from requests_mv_integrations.support import (
+    RequestDeadline,
+    RequestRateLimiter,
+)
+
+
+class StubClock(object):
+    """Monotonic clock moved forward by tests, and by stub server, only.
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, secs):
+        self.now += secs
+
+
+class TestRequestDeadline(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = StubClock()
+        self.request_deadline = RequestDeadline(10.0, clock=self.clock)
+
+    def test_remaining(self):
+        self.assertEqual(self.request_deadline.remaining, 10.0)
+        self.assertFalse(self.request_deadline.expired)
+
+        self.clock.advance(7.5)
+        self.assertEqual(self.request_deadline.remaining, 2.5)
+
+        self.clock.advance(5.0)
+        self.assertEqual(self.request_deadline.remaining, 0.0)
+        self.assertTrue(self.request_deadline.expired)
+
+    def test_timeout(self):
+        self.clock.advance(6.0)
+
+        self.assertEqual(self.request_deadline.timeout(None), 4.0)
+        self.assertEqual(self.request_deadline.timeout(2.0), 2.0)
+        self.assertEqual(self.request_deadline.timeout(60), 4.0)
+        self.assertEqual(self.request_deadline.timeout((2.0, 60)), (2.0, 4.0))
+        self.assertEqual(self.request_deadline.timeout((None, 3.0)), (4.0, 3.0))
+
+    def test_fits(self):
+        self.clock.advance(6.0)
+
+        self.assertTrue(self.request_deadline.fits(3.9))
+        self.assertFalse(self.request_deadline.fits(4.0))
+
+    def test_check(self):
+        self.clock.advance(9.9)
+        self.request_deadline.check('Label', 'https://api.partner.com/')
+
+        self.clock.advance(0.1)
+        with self.assertRaises(TuneRequestModuleError) as context:
+            self.request_deadline.check('Label', 'https://api.partner.com/')
+
+        self.assertEqual(context.exception.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+
+    def test_from_value(self):
+        self.assertIsNone(RequestDeadline.from_value(None))
+        self.assertIs(RequestDeadline.from_value(self.request_deadline), self.request_deadline)
+
+        request_deadline = RequestDeadline.from_value(30)
+        self.assertIsInstance(request_deadline, RequestDeadline)
+        self.assertEqual(request_deadline.deadline_secs, 30)
+
+
+class StubRateLimiter(RequestRateLimiter):
+    """Rate limiter counting tokens taken, each to be waited 'wait_secs' for.
+    """
+
+    def __init__(self, wait_secs):
+        super(StubRateLimiter, self).__init__(rate=1)
+        self.wait_secs = wait_secs
+        self.reserves = 0
+
+    def reserve(self, request_url, request_label=None):
+        self.reserves += 1
+        return self.wait_secs
+
+
+class StubUnavailableHandler(http.server.BaseHTTPRequestHandler):
+    """GET always answers 503, each answer taking 'server.secs_per_hit' of stub clock.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+            self.server.clock.advance(self.server.secs_per_hit)
+
+        self.send_response(503)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class StubUnavailableServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestRequestDeadlineRequest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubUnavailableServer(('127.0.0.1', 0), StubUnavailableHandler)
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}/report'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.clock = StubClock()
+        self.server.clock = self.clock
+        self.server.hits = 0
+        self.server.secs_per_hit = 0.0
+        self.mv_request = RequestMvIntegration(logger_level=logging.CRITICAL)
+
+    def request(self, request_deadline, delay=0):
+        with self.assertRaises(TuneRequestModuleError) as context:
+            self.mv_request.request(
+                'GET',
+                self.server_url,
+                request_retry={'tries': 10,
+                               'delay': delay},
+                request_deadline=request_deadline
+            )
+        return context.exception
+
+    def test_expired_before_first_attempt(self):
+        request_deadline = RequestDeadline(5.0, clock=self.clock)
+        self.clock.advance(5.0)
+
+        excp = self.request(request_deadline)
+
+        self.assertEqual(excp.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertEqual(self.server.hits, 0)
+
+    def test_retry_delay_exceeds_deadline(self):
+        excp = self.request(RequestDeadline(5.0, clock=self.clock), delay=10)
+
+        self.assertEqual(excp.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_attempts_exhaust_deadline(self):
+        self.server.secs_per_hit = 2.0
+
+        excp = self.request(RequestDeadline(5.0, clock=self.clock))
+
+        self.assertEqual(excp.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertEqual(self.server.hits, 3)
+
+    def test_deadline_shared_by_calls(self):
+        self.server.secs_per_hit = 2.0
+        request_deadline = RequestDeadline(5.0, clock=self.clock)
+
+        self.request(request_deadline)
+        excp = self.request(request_deadline)
+
+        self.assertEqual(excp.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertEqual(self.server.hits, 3)
+
+    def test_expired_deadline_takes_no_token(self):
+        rate_limiter = StubRateLimiter(wait_secs=0.0)
+        self.mv_request.rate_limiter = rate_limiter
+
+        request_deadline = RequestDeadline(5.0, clock=self.clock)
+        self.clock.advance(5.0)
+
+        excp = self.request(request_deadline)
+
+        self.assertEqual(excp.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertEqual(rate_limiter.reserves, 0)
+        self.assertEqual(self.server.hits, 0)
+
+    def test_rate_limit_wait_capped_by_deadline(self):
+        self.mv_request.rate_limiter = StubRateLimiter(wait_secs=3600.0)
+
+        time_start = time.monotonic()
+        excp = self.request(RequestDeadline(0.1))
+
+        self.assertEqual(excp.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertLess(time.monotonic() - time_start, 5.0)
+        self.assertEqual(self.server.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
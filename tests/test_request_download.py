@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: RequestMvIntegrationDownload retries against a local stub server.
+"""
+
+import http.server
+import logging
+import shutil
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegrationDownload)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (TuneRequestModuleError)
+from requests_mv_integrations.request_mv_integration_download import (DOWNLOAD_RETRY_CONFIG)
+
+CSV_CONTENT = b'id,name\n' + b''.join('{},n{}\n'.format(i, i).encode('utf-8') for i in range(1000))
+
+
+class StubDownloadHandler(http.server.BaseHTTPRequestHandler):
+    """GET answers, in turn, each reply of 'server.replies', then full CSV:
+
+    'unavailable': 503.
+    'truncated': 200 with half of CSV then connection closed.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+            reply = self.server.replies.pop(0) if self.server.replies else None
+
+        if reply == 'unavailable':
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Content-Length', '{}'.format(len(CSV_CONTENT)))
+        self.end_headers()
+
+        if reply == 'truncated':
+            self.wfile.write(CSV_CONTENT[:len(CSV_CONTENT) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(CSV_CONTENT)
+
+
+class StubDownloadServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestRequestDownloadAttempts(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubDownloadServer(('127.0.0.1', 0), StubDownloadHandler)
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}/report.csv'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits = 0
+        self.server.replies = []
+
+        self.tmp_directory = tempfile.mkdtemp()
+        self.download = RequestMvIntegrationDownload(logger_level=logging.CRITICAL)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_directory)
+
+    def request_csv_download(self, tries):
+        return list(
+            self.download.request_csv_download(
+                'GET',
+                self.server_url,
+                'report.csv',
+                tmp_directory=self.tmp_directory,
+                request_retry={'tries': tries, 'delay': 0}
+            )
+        )
+
+    def test_download_retry_policy_default(self):
+        self.assertEqual(
+            self.download._download_retry_policy(None), (DOWNLOAD_RETRY_CONFIG['tries'], DOWNLOAD_RETRY_CONFIG['delay'])
+        )
+        self.assertEqual(self.download._download_retry_policy({'tries': 3}), (3, DOWNLOAD_RETRY_CONFIG['delay']))
+
+    def test_no_retry(self):
+        rows = self.request_csv_download(tries=1)
+
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_tries_shared_by_request_and_content(self):
+        self.server.replies = ['unavailable', 'truncated']
+
+        rows = self.request_csv_download(tries=3)
+
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(self.server.hits, 3)
+
+    def test_tries_exhausted_by_request_and_content(self):
+        self.server.replies = ['unavailable', 'truncated']
+
+        with self.assertRaises(TuneRequestModuleError) as context:
+            self.request_csv_download(tries=2)
+
+        self.assertEqual(context.exception.error_code, TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED)
+        self.assertEqual(self.server.hits, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: Delay between attempts taken from 'Retry-After' and 'X-RateLimit-Reset' headers.
+"""
+
+import http.server
+import logging
+import socketserver
+import threading
+import time
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegration)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (TuneRequestModuleError)
+from requests_mv_integrations.support import (RequestDeadline)
+
+# Retry delay of policy, far longer than tests last: retries happen in time only upon header delays.
+RETRY_DELAY_LONG = 3600
+
+
+class StubRetryAfterHandler(http.server.BaseHTTPRequestHandler):
+    """GET answers, in turn, each (status, headers) of 'server.replies', then 200.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+            status, headers = self.server.replies.pop(0) if self.server.replies else (200, {})
+
+        self.send_response(status)
+        for header_name, header_value in headers.items():
+            self.send_header(header_name, header_value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class StubRetryAfterServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestRequestRetryAfter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubRetryAfterServer(('127.0.0.1', 0), StubRetryAfterHandler)
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}/report'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits = 0
+        self.server.replies = []
+        self.mv_request = RequestMvIntegration(logger_level=logging.CRITICAL)
+
+    def request(self, request_retry, request_deadline=None):
+        request_retry = dict({'tries': 3, 'delay': RETRY_DELAY_LONG}, **request_retry)
+        return self.mv_request.request(
+            'GET', self.server_url, request_retry=request_retry, request_deadline=request_deadline
+        )
+
+    def test_retry_after_over_retry_delay(self):
+        self.server.replies = [(503, {'Retry-After': '0'}), (429, {'Retry-After': '0.1'})]
+
+        time_start = time.monotonic()
+        response = self.request({})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 3)
+        self.assertGreaterEqual(time.monotonic() - time_start, 0.1)
+
+    def test_rate_limit_reset_over_retry_delay(self):
+        self.server.replies = [(429, {'X-RateLimit-Reset': '0'}), (429, {'RateLimit-Reset': '0'})]
+
+        response = self.request({})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 3)
+
+    def test_retry_after_capped_by_max_delay(self):
+        self.server.replies = [(503, {'Retry-After': '{}'.format(RETRY_DELAY_LONG)})]
+
+        response = self.request({'delay': 0, 'max_delay': 0})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 2)
+
+    def test_retry_after_exceeds_deadline(self):
+        self.server.replies = [(503, {'Retry-After': '{}'.format(RETRY_DELAY_LONG)})]
+
+        with self.assertRaises(TuneRequestModuleError) as context:
+            self.request({'delay': 0}, request_deadline=RequestDeadline(60))
+
+        self.assertEqual(context.exception.error_code, TuneRequestErrorCodes.REQ_ERR_DEADLINE_EXCEEDED)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_retry_after_of_valid_response_ignored(self):
+        self.server.replies = [(200, {'Retry-After': '{}'.format(RETRY_DELAY_LONG)})]
+
+        response = self.request({})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: RequestMvIntegrationUpload.request_upload_multipart against a local stub server.
+"""
+
+import http.server
+import logging
+import os
+import re
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegrationUpload)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (TuneRequestBaseError, TuneRequestModuleError)
+
+
+class StubMultipartHandler(http.server.BaseHTTPRequestHandler):
+    """S3-style multipart stub: PUT /<upload>/<part>, POST and DELETE /<upload>.
+
+    Upload named 'fail' refuses part 2, upload named 'noetag' answers parts
+    without 'ETag'.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_PUT(self):
+        upload_name, part_number = self.path.strip('/').split('/')
+        body = self.rfile.read(int(self.headers['Content-Length']))
+
+        if upload_name == 'fail' and part_number == '2':
+            self._reply(403)
+            return
+
+        self.server.parts[(upload_name, int(part_number))] = body
+        self._reply(200, None if upload_name == 'noetag' else '"etag-{}"'.format(part_number))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.completed[self.path.strip('/')] = body.decode('utf-8')
+        self._reply(200)
+
+    def do_DELETE(self):
+        self.server.aborted.append(self.path.strip('/'))
+        self._reply(204)
+
+    def _reply(self, status, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class StubMultipartServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestRequestUploadMultipart(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubMultipartServer(('127.0.0.1', 0), StubMultipartHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.parts = {}
+        self.server.completed = {}
+        self.server.aborted = []
+
+        self.file_data = os.urandom(10 * 1024 + 123)
+        with tempfile.NamedTemporaryFile(delete=False) as file_w:
+            file_w.write(self.file_data)
+        self.file_path = file_w.name
+
+        self.upload = RequestMvIntegrationUpload(logger_level=logging.CRITICAL)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def upload_multipart(self, upload_name, **kwargs):
+        return self.upload.request_upload_multipart(
+            upload_part_url_func=lambda part_number: '{}/{}/{}'.format(self.server_url, upload_name, part_number),
+            upload_data_file_path=self.file_path,
+            request_label='Test',
+            upload_part_size=4 * 1024,
+            upload_part_tries=1,
+            **kwargs
+        )
+
+    def test_parts_uploaded_and_completed(self):
+        response = self.upload_multipart('ok', upload_complete_url='{}/ok'.format(self.server_url))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b''.join(self.server.parts[('ok', part_number)] for part_number in (1, 2, 3)), self.file_data
+        )
+        self.assertEqual(
+            re.findall(r'<PartNumber>(\d+)</PartNumber><ETag>"etag-(\d+)"</ETag>', self.server.completed['ok']),
+            [('1', '1'), ('2', '2'), ('3', '3')]
+        )
+        self.assertEqual(self.server.aborted, [])
+
+    def test_parts_returned_without_commit(self):
+        upload_parts = self.upload_multipart('parts')
+
+        self.assertEqual(upload_parts, [(1, '"etag-1"'), (2, '"etag-2"'), (3, '"etag-3"')])
+
+    def test_part_url_resolved_as_part_starts(self):
+        parts_uploaded_at_url = []
+
+        def upload_part_url_func(part_number):
+            parts_uploaded_at_url.append(len(self.server.parts))
+            return '{}/late/{}'.format(self.server_url, part_number)
+
+        self.upload.request_upload_multipart(
+            upload_part_url_func=upload_part_url_func,
+            upload_data_file_path=self.file_path,
+            request_label='Test',
+            upload_part_size=4 * 1024,
+            upload_part_tries=1,
+            upload_workers=1
+        )
+
+        self.assertEqual(parts_uploaded_at_url, [0, 1, 2])
+
+    def test_part_failed_aborts_upload(self):
+        with self.assertRaises(TuneRequestBaseError):
+            self.upload_multipart(
+                'fail',
+                upload_complete_url='{}/fail'.format(self.server_url),
+                upload_abort_url='{}/fail'.format(self.server_url)
+            )
+
+        self.assertEqual(self.server.aborted, ['fail'])
+        self.assertEqual(self.server.completed, {})
+
+    def test_part_failed_calls_abort_func(self):
+        aborted = []
+
+        with self.assertRaises(TuneRequestBaseError):
+            self.upload_multipart('fail', upload_abort_func=lambda: aborted.append(True))
+
+        self.assertEqual(aborted, [True])
+
+    def test_part_without_etag_raises(self):
+        with self.assertRaises(TuneRequestModuleError) as context:
+            self.upload_multipart('noetag', upload_complete_url='{}/noetag'.format(self.server_url))
+
+        self.assertEqual(context.exception.error_code, TuneRequestErrorCodes.REQ_ERR_UPLOAD_DATA)
+        self.assertEqual(self.server.completed, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
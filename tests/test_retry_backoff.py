@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: Backoff strategies and RetryBudget, with seeded delays and a stub clock.
+"""
+
+import http.server
+import itertools
+import logging
+import socketserver
+import threading
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegration)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (TuneRequestModuleError)
+from requests_mv_integrations.support import (
+    DecorrelatedJitterBackoff,
+    EqualJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+    RetryBudget,
+)
+
+
+class StubClock(object):
+    """Monotonic clock moved forward by tests only.
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, secs):
+        self.now += secs
+
+
+def first_delays(backoff, count=20, seed=None):
+    return list(itertools.islice(backoff.delays(seed), count))
+
+
+class TestBackoffStrategies(unittest.TestCase):
+
+    def test_exponential(self):
+        backoff = ExponentialBackoff(base_delay=1.0, factor=2.0, max_delay=10.0)
+        self.assertEqual(first_delays(backoff, 6), [1.0, 2.0, 4.0, 8.0, 10.0, 10.0])
+
+    def test_full_jitter_bounds(self):
+        backoff = FullJitterBackoff(base_delay=0.5, factor=2.0, max_delay=8.0)
+
+        for seed in range(20):
+            for retry, delay in enumerate(first_delays(backoff, seed=seed)):
+                self.assertGreaterEqual(delay, 0.0)
+                self.assertLessEqual(delay, min(8.0, 0.5 * 2.0 ** retry))
+
+    def test_equal_jitter_bounds(self):
+        backoff = EqualJitterBackoff(base_delay=0.5, factor=2.0, max_delay=8.0)
+
+        for seed in range(20):
+            for retry, delay in enumerate(first_delays(backoff, seed=seed)):
+                exponential_delay = min(8.0, 0.5 * 2.0 ** retry)
+                self.assertGreaterEqual(delay, exponential_delay / 2)
+                self.assertLessEqual(delay, exponential_delay)
+
+    def test_decorrelated_jitter_bounds(self):
+        backoff = DecorrelatedJitterBackoff(base_delay=0.5, max_delay=8.0)
+
+        for seed in range(20):
+            prev_delay = 0.5
+            for delay in first_delays(backoff, seed=seed):
+                self.assertGreaterEqual(delay, 0.5)
+                self.assertLessEqual(delay, min(8.0, max(0.5, prev_delay * 3.0)))
+                prev_delay = delay
+
+    def test_seeded_delays_reproducible(self):
+        backoff = FullJitterBackoff(base_delay=1.0, max_delay=30.0, seed=42)
+
+        self.assertEqual(first_delays(backoff), first_delays(backoff))
+        self.assertEqual(first_delays(backoff, seed=7), first_delays(FullJitterBackoff(1.0, max_delay=30.0), seed=7))
+        self.assertNotEqual(first_delays(backoff), first_delays(backoff, seed=7))
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = StubClock()
+
+    def test_min_retries(self):
+        retry_budget = RetryBudget(retry_ratio=0.0, min_retries=3, clock=self.clock)
+
+        self.assertEqual([retry_budget.withdraw() for _ in range(5)], [True, True, True, False, False])
+
+    def test_retry_ratio(self):
+        retry_budget = RetryBudget(retry_ratio=0.5, min_retries=0, clock=self.clock)
+        for _ in range(4):
+            retry_budget.request()
+
+        self.assertEqual([retry_budget.withdraw() for _ in range(3)], [True, True, False])
+
+        retry_budget.request()
+        retry_budget.request()
+        self.assertTrue(retry_budget.withdraw())
+        self.assertFalse(retry_budget.withdraw())
+
+    def test_window_reset(self):
+        retry_budget = RetryBudget(retry_ratio=0.0, min_retries=1, window_secs=10.0, clock=self.clock)
+
+        self.assertTrue(retry_budget.withdraw())
+        self.assertFalse(retry_budget.withdraw())
+
+        self.clock.advance(9.9)
+        self.assertFalse(retry_budget.withdraw())
+
+        self.clock.advance(0.1)
+        self.assertTrue(retry_budget.withdraw())
+        self.assertFalse(retry_budget.withdraw())
+
+
+class StubUnavailableHandler(http.server.BaseHTTPRequestHandler):
+    """GET always answers 503.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+
+        self.send_response(503)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class StubUnavailableServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestRetryBudgetRequest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubUnavailableServer(('127.0.0.1', 0), StubUnavailableHandler)
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}/report'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.hits = 0
+        self.mv_request = RequestMvIntegration(logger_level=logging.CRITICAL)
+
+    def test_retry_budget_exhausted(self):
+        retry_budget = RetryBudget(retry_ratio=0.0, min_retries=2, clock=StubClock())
+
+        with self.assertRaises(TuneRequestModuleError) as context:
+            self.mv_request.request(
+                'GET', self.server_url, request_retry={'tries': 10,
+                                                       'delay': 0,
+                                                       'budget': retry_budget}
+            )
+
+        self.assertEqual(context.exception.error_code, TuneRequestErrorCodes.REQ_ERR_RETRY_EXHAUSTED)
+        self.assertEqual(self.server.hits, 3)
+
+    def test_retry_budget_shared_by_calls(self):
+        retry_budget = RetryBudget(retry_ratio=0.0, min_retries=2, clock=StubClock())
+
+        for _ in range(2):
+            with self.assertRaises(TuneRequestModuleError):
+                self.mv_request.request(
+                    'GET', self.server_url, request_retry={'tries': 10,
+                                                           'delay': 0,
+                                                           'budget': retry_budget}
+                )
+
+        self.assertEqual(self.server.hits, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: Retry decisions of RequestRetryClassifier, excp_chain and retry_after_delay.
+"""
+
+import email.utils
+import http.client as http_client
+import unittest
+
+import requests
+from requests.packages.urllib3.exceptions import (
+    NewConnectionError,
+    ProtocolError,
+)
+from requests_mv_integrations.exceptions import (
+    TuneRequestClientError,
+    TuneRequestServiceError,
+)
+from requests_mv_integrations.support import (
+    excp_chain,
+    RequestRetryClassifier,
+    retry_after_delay,
+    retry_cause_excps,
+    RetryDelaySource,
+    RetryExcpKind,
+)
+
+NOW = 1500000000.0
+
+
+def connection_aborted_error():
+    """requests.ConnectionError raised by urllib3 once server dropped connection after request was sent."""
+    try:
+        try:
+            raise ProtocolError('Connection aborted.', http_client.RemoteDisconnected('Remote end closed connection'))
+        except ProtocolError as ex:
+            raise requests.exceptions.ConnectionError(ex)
+    except requests.exceptions.ConnectionError as ex:
+        return ex
+
+
+def connection_refused_error():
+    """requests.ConnectionError raised by urllib3 when request never reached server."""
+    return requests.exceptions.ConnectionError(NewConnectionError(None, 'Connection refused'))
+
+
+def stub_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+class TestRetryAfterDelay(unittest.TestCase):
+
+    def test_no_header(self):
+        self.assertEqual(retry_after_delay(None, now=NOW), (None, None))
+        self.assertEqual(retry_after_delay({'Content-Type': 'text/csv'}, now=NOW), (None, None))
+
+    def test_retry_after_seconds(self):
+        self.assertEqual(retry_after_delay({'Retry-After': '120'}, now=NOW), (120.0, RetryDelaySource.RETRY_AFTER))
+        self.assertEqual(retry_after_delay({'retry-after': ' 5 '}, now=NOW), (5.0, RetryDelaySource.RETRY_AFTER))
+
+    def test_retry_after_http_date(self):
+        headers = {'Retry-After': email.utils.formatdate(NOW + 30, usegmt=True)}
+        self.assertEqual(retry_after_delay(headers, now=NOW), (30.0, RetryDelaySource.RETRY_AFTER))
+
+    def test_retry_after_never_negative(self):
+        headers = {'Retry-After': email.utils.formatdate(NOW - 30, usegmt=True)}
+        self.assertEqual(retry_after_delay(headers, now=NOW), (0.0, RetryDelaySource.RETRY_AFTER))
+        self.assertEqual(retry_after_delay({'Retry-After': '-5'}, now=NOW), (0.0, RetryDelaySource.RETRY_AFTER))
+
+    def test_retry_after_invalid_falls_back_to_rate_limit_reset(self):
+        headers = {'Retry-After': 'soon', 'X-RateLimit-Reset': '10'}
+        self.assertEqual(retry_after_delay(headers, now=NOW), (10.0, RetryDelaySource.RATE_LIMIT_RESET))
+
+    def test_retry_after_wins_over_rate_limit_reset(self):
+        headers = {'Retry-After': '3', 'X-RateLimit-Reset': '10'}
+        self.assertEqual(retry_after_delay(headers, now=NOW), (3.0, RetryDelaySource.RETRY_AFTER))
+
+    def test_rate_limit_reset_delta(self):
+        self.assertEqual(
+            retry_after_delay({'X-RateLimit-Reset': '20'}, now=NOW), (20.0, RetryDelaySource.RATE_LIMIT_RESET)
+        )
+        self.assertEqual(
+            retry_after_delay({'RateLimit-Reset': '7'}, now=NOW), (7.0, RetryDelaySource.RATE_LIMIT_RESET)
+        )
+
+    def test_rate_limit_reset_epoch(self):
+        headers = {'X-RateLimit-Reset': '{}'.format(int(NOW) + 45)}
+        self.assertEqual(retry_after_delay(headers, now=NOW), (45.0, RetryDelaySource.RATE_LIMIT_RESET))
+
+    def test_rate_limit_reset_epoch_passed(self):
+        headers = {'X-RateLimit-Reset': '{}'.format(int(NOW) - 45)}
+        self.assertEqual(retry_after_delay(headers, now=NOW), (0.0, RetryDelaySource.RATE_LIMIT_RESET))
+
+
+class TestExcpChain(unittest.TestCase):
+
+    def test_single(self):
+        excp = ValueError('bad')
+        self.assertEqual(list(excp_chain(excp)), [excp])
+
+    def test_cause_and_args(self):
+        excp = connection_aborted_error()
+        excps = list(excp_chain(excp))
+
+        self.assertIs(excps[0], excp)
+        self.assertTrue(any(isinstance(cause, ProtocolError) for cause in excps))
+        self.assertTrue(any(isinstance(cause, http_client.RemoteDisconnected) for cause in excps))
+
+    def test_tune_request_errors(self):
+        cause = ConnectionResetError('reset')
+        excp = TuneRequestServiceError(error_message='Service failed', errors=cause)
+        self.assertIn(cause, list(excp_chain(excp)))
+
+    def test_each_once(self):
+        cause = ConnectionResetError('reset')
+        excp = RuntimeError(cause)
+        excp.__cause__ = cause
+        excp.__context__ = cause
+
+        self.assertEqual(list(excp_chain(excp)), [excp, cause])
+
+
+class TestRetryCauseExcps(unittest.TestCase):
+
+    def test_idempotent_methods(self):
+        for request_method in ('GET', 'get', 'PUT', 'DELETE', 'HEAD'):
+            self.assertIn(ProtocolError, retry_cause_excps(request_method))
+            self.assertIn(NewConnectionError, retry_cause_excps(request_method))
+
+    def test_other_methods(self):
+        for request_method in ('POST', 'PATCH', None):
+            self.assertNotIn(ProtocolError, retry_cause_excps(request_method))
+            self.assertIn(NewConnectionError, retry_cause_excps(request_method))
+
+
+class TestRequestRetryClassifier(unittest.TestCase):
+
+    def test_response_valid(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[503])
+        retry_decision = classifier.classify_response(stub_response(200))
+
+        self.assertFalse(retry_decision)
+        self.assertIsNone(retry_decision.http_status_code)
+
+    def test_response_http_status(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[503])
+        retry_decision = classifier.classify_response(stub_response(503))
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.http_status_code, 503)
+        self.assertIsNone(retry_decision.delay)
+        self.assertEqual(retry_decision.delay_source, RetryDelaySource.RETRY_POLICY)
+
+    def test_response_retry_after(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[429])
+        retry_decision = classifier.classify_response(stub_response(429, {'Retry-After': '12'}))
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.delay, 12.0)
+        self.assertEqual(retry_decision.delay_source, RetryDelaySource.RETRY_AFTER)
+
+    def test_response_retry_after_ignored_if_not_retried(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[429])
+        retry_decision = classifier.classify_response(stub_response(200, {'Retry-After': '12'}))
+
+        self.assertFalse(retry_decision)
+        self.assertIsNone(retry_decision.delay)
+
+    def test_response_retry_func(self):
+
+        def retry_empty(response):
+            return not response.content
+
+        classifier = RequestRetryClassifier(retry_func=retry_empty)
+        retry_decision = classifier.classify_response(stub_response(200))
+
+        self.assertTrue(retry_decision)
+        self.assertIsNone(retry_decision.http_status_code)
+
+    def test_excp_expected(self):
+        classifier = RequestRetryClassifier(retry_excps=(requests.exceptions.Timeout, ))
+        retry_decision = classifier.classify_excp(requests.exceptions.ReadTimeout())
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.excp_kind, RetryExcpKind.EXPECTED)
+
+    def test_excp_unexpected(self):
+        classifier = RequestRetryClassifier(retry_excps=(requests.exceptions.Timeout, ))
+        retry_decision = classifier.classify_excp(ValueError('bad'))
+
+        self.assertFalse(retry_decision)
+        self.assertEqual(retry_decision.excp_kind, RetryExcpKind.UNEXPECTED)
+
+    def test_excp_cause_idempotent_method(self):
+        classifier = RequestRetryClassifier(retry_cause_excps=retry_cause_excps('GET'))
+        retry_decision = classifier.classify_excp(connection_aborted_error())
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.excp_kind, RetryExcpKind.EXPECTED)
+
+    def test_excp_cause_not_idempotent_method(self):
+        classifier = RequestRetryClassifier(retry_cause_excps=retry_cause_excps('POST'))
+
+        self.assertFalse(classifier.classify_excp(connection_aborted_error()))
+        self.assertTrue(classifier.classify_excp(connection_refused_error()))
+
+    def test_excp_tune_request_error_status(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[503])
+        retry_decision = classifier.classify_excp(
+            TuneRequestServiceError(error_message='Service Unavailable', error_status=503, error_code=600)
+        )
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.excp_kind, RetryExcpKind.INTEGRATION)
+        self.assertEqual(retry_decision.http_status_code, 503)
+
+    def test_excp_tune_request_error_code(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[502])
+        retry_decision = classifier.classify_excp(
+            TuneRequestServiceError(error_message='Bad Gateway', error_code=502)
+        )
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.http_status_code, 502)
+
+    def test_excp_tune_request_error_not_retried(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[503])
+        retry_decision = classifier.classify_excp(TuneRequestClientError(error_message='Not Found', error_code=404))
+
+        self.assertFalse(retry_decision)
+        self.assertEqual(retry_decision.excp_kind, RetryExcpKind.INTEGRATION)
+
+    def test_excp_tune_request_error_headers(self):
+        classifier = RequestRetryClassifier(retry_http_status_codes=[429])
+        retry_decision = classifier.classify_excp(
+            TuneRequestClientError(error_message='Too Many Requests', error_code=429, error_headers={'Retry-After': '8'})
+        )
+
+        self.assertTrue(retry_decision)
+        self.assertEqual(retry_decision.delay, 8.0)
+        self.assertEqual(retry_decision.delay_source, RetryDelaySource.RETRY_AFTER)
+
+    def test_excp_retry_excps_func(self):
+        labels = []
+
+        def retry_value_error(excp, request_label):
+            labels.append(request_label)
+            return isinstance(excp, ValueError)
+
+        classifier = RequestRetryClassifier(retry_excps_func=retry_value_error)
+
+        self.assertTrue(classifier.classify_excp(ValueError('bad'), request_label='Label'))
+        self.assertFalse(classifier.classify_excp(KeyError('bad'), request_label='Label'))
+        self.assertEqual(labels, ['Label', 'Label'])
+
+
+if __name__ == '__main__':
+    unittest.main()
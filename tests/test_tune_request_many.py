@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: TuneRequest.request_many against a local stub server.
+"""
+
+import http.server
+import logging
+import socketserver
+import threading
+import time
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegration)
+from requests_mv_integrations.errors import (TuneRequestErrorCodes)
+from requests_mv_integrations.exceptions import (TuneRequestBaseError, TuneRequestClientError)
+from requests_mv_integrations.support import (TuneRequest)
+
+
+class StubManyHandler(http.server.BaseHTTPRequestHandler):
+    """GET /ok/<n> answers <n> after 'delay' secs, /nf/<n> answers 404,
+    /flaky/<n> answers 503 once then <n>.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        route, number = self.path.strip('/').split('/')
+
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+            hits = self.server.hits[self.path]
+
+        try:
+            # Later requests answer first, so completion order differs from request order.
+            time.sleep(self.server.delay * (10 - int(number) % 10))
+
+            if route == 'nf':
+                self._reply(404, b'')
+            elif route == 'flaky' and hits == 1:
+                self._reply(503, b'')
+            else:
+                self._reply(200, number.encode('utf-8'))
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Length', '{}'.format(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubManyServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class TestTuneRequestMany(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubManyServer(('127.0.0.1', 0), StubManyHandler)
+        cls.server.lock = threading.Lock()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.delay = 0.005
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.hits = {}
+
+        self.tune_request = TuneRequest()
+        self.mv_request = RequestMvIntegration(logger_level=logging.CRITICAL, tune_request=self.tune_request)
+
+    def tearDown(self):
+        self.tune_request.close()
+
+    def request_specs(self, route, numbers):
+        return [
+            {'request_method': 'GET',
+             'request_url': '{}/{}/{}'.format(self.server_url, route, number),
+             'request_retry': {'tries': 3, 'delay': 0}} for number in numbers
+        ]
+
+    def test_ordered(self):
+        responses = list(
+            self.tune_request.request_many(
+                self.request_specs('ok', range(10)), max_workers=4, ordered=True, mv_request=self.mv_request
+            )
+        )
+
+        self.assertEqual([response.text for response in responses], [str(number) for number in range(10)])
+
+    def test_completion_order(self):
+        self.server.delay = 0.05
+
+        responses = list(
+            self.tune_request.request_many(
+                self.request_specs('ok', range(4)), max_workers=4, mv_request=self.mv_request
+            )
+        )
+
+        self.assertEqual(sorted(response.text for response in responses), ['0', '1', '2', '3'])
+        self.assertEqual(responses[0].text, '3')
+
+    def test_http_error_yielded(self):
+        results = list(
+            self.tune_request.request_many(
+                self.request_specs('nf', [1]) + self.request_specs('ok', [2]), ordered=True, mv_request=self.mv_request
+            )
+        )
+
+        self.assertIsInstance(results[0], TuneRequestClientError)
+        self.assertEqual(results[0].error_code, 404)
+        self.assertEqual(results[1].status_code, 200)
+
+    def test_connect_error_yielded(self):
+        results = list(
+            self.tune_request.request_many(
+                [{'request_method': 'GET',
+                  'request_url': 'http://127.0.0.1:1/x',
+                  'request_retry': {'tries': 1, 'delay': 0}}],
+                mv_request=self.mv_request
+            )
+        )
+
+        self.assertIsInstance(results[0], TuneRequestBaseError)
+        self.assertEqual(results[0].error_code, TuneRequestErrorCodes.REQ_ERR_REQUEST_CONNECT)
+
+    def test_retried(self):
+        responses = list(
+            self.tune_request.request_many(self.request_specs('flaky', [7]), mv_request=self.mv_request)
+        )
+
+        self.assertEqual(responses[0].status_code, 200)
+        self.assertEqual(self.server.hits['/flaky/7'], 2)
+
+    def test_default_mv_request(self):
+        responses = list(self.tune_request.request_many(self.request_specs('ok', [5])))
+
+        self.assertEqual(responses[0].text, '5')
+
+    def test_in_flight_bound(self):
+        specs_taken = []
+
+        def request_specs():
+            for request_spec in self.request_specs('ok', range(20)):
+                specs_taken.append(request_spec)
+                yield request_spec
+
+        results = self.tune_request.request_many(request_specs(), max_workers=2, mv_request=self.mv_request)
+        next(results)
+
+        # Specs are taken from generator as requests complete, at most twice 'max_workers' ahead.
+        self.assertLessEqual(len(specs_taken), 2 * 2 + 1)
+
+        self.assertEqual(len(list(results)), 19)
+        self.assertLessEqual(self.server.max_in_flight, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: TuneRequestRegistry never closes sessions in use.
+"""
+
+import http.server
+import logging
+import socketserver
+import threading
+import unittest
+
+from requests_mv_integrations import (RequestMvIntegration)
+from requests_mv_integrations.support import (TuneRequest, TuneRequestRegistry)
+
+CONTENT = b'x' * 100000
+
+
+class StubContentHandler(http.server.BaseHTTPRequestHandler):
+    """GET answers CONTENT.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '{}'.format(len(CONTENT)))
+        self.end_headers()
+        self.wfile.write(CONTENT)
+
+
+class StubContentServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+def tune_request_registry(**kwargs):
+    """Registry of its own, not process wide singleton."""
+    return type.__call__(TuneRequestRegistry, **kwargs)
+
+
+class TestTuneRequestRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubContentServer(('127.0.0.1', 0), StubContentHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.server_url = 'http://127.0.0.1:{}/report'.format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.registry = tune_request_registry(max_sessions=2, max_idle_secs=60)
+
+    def tearDown(self):
+        self.registry.close()
+
+    def test_singleton(self):
+        self.assertIs(TuneRequestRegistry(), TuneRequestRegistry())
+        self.assertIsNot(self.registry, TuneRequestRegistry())
+
+    def test_same_key_same_session(self):
+        tune_request = self.registry.get(host_group='partner')
+
+        self.assertIs(self.registry.get(host_group='partner'), tune_request)
+        self.assertIsNot(self.registry.get(host_group='other'), tune_request)
+
+    def test_idle_evicted(self):
+        tune_request = self.registry.get(host_group='partner')
+        tune_request.last_used -= 61
+
+        self.registry.evict_idle()
+
+        self.assertEqual(len(self.registry), 0)
+        self.assertIsNot(self.registry.get(host_group='partner'), tune_request)
+
+    def test_held_not_evicted(self):
+        tune_request = self.registry.get(host_group='partner')
+        tune_request.acquire()
+        tune_request.last_used -= 61
+
+        self.registry.evict_idle()
+        self.assertIs(self.registry.get(host_group='partner'), tune_request)
+
+        tune_request.release()
+        self.assertFalse(tune_request.in_use)
+
+        # Idle time starts once released.
+        self.registry.evict_idle()
+        self.assertEqual(len(self.registry), 1)
+
+    def test_streamed_response_not_evicted(self):
+        tune_request = self.registry.get(host_group='partner')
+
+        response = tune_request.request('GET', self.server_url, stream=True)
+        self.assertEqual(tune_request.connections_in_use(), 1)
+        self.assertTrue(tune_request.in_use)
+
+        tune_request.last_used -= 61
+        self.registry.evict_idle()
+        self.assertEqual(len(self.registry), 1)
+
+        self.assertEqual(len(response.content), len(CONTENT))
+        self.assertEqual(tune_request.connections_in_use(), 0)
+
+        self.registry.evict_idle()
+        self.assertEqual(len(self.registry), 0)
+
+    def test_least_recently_used_in_use_not_evicted(self):
+        tune_request_lru = self.registry.get(host_group='a')
+        tune_request_lru.acquire()
+        self.registry.get(host_group='b')
+        tune_request_c = self.registry.get(host_group='c')
+
+        self.assertEqual(len(self.registry), 2)
+        self.assertIs(self.registry.get(host_group='a'), tune_request_lru)
+
+        tune_request_lru.release()
+        self.registry.get(host_group='d')
+
+        self.assertEqual(len(self.registry), 2)
+        self.assertIs(self.registry.get(host_group='a'), tune_request_lru)
+        self.assertIsNot(self.registry.get(host_group='c'), tune_request_c)
+
+    def test_request_holds_session_across_retries(self):
+        held = []
+        mv_request = RequestMvIntegration(logger_level=logging.CRITICAL, tune_request=TuneRequest())
+
+        def retry_func(response):
+            response.close()  # Gives connection back: session is held by call only.
+            held.append(mv_request.tune_request.in_use)
+            return len(held) < 2
+
+        response = mv_request.request(
+            'GET', self.server_url, request_retry={'tries': 3,
+                                                   'delay': 0}, request_retry_func=retry_func
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(held, [True, True])
+        self.assertFalse(mv_request.tune_request.in_use)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#  @copyright 2016 TUNE, Inc. (http://www.tune.com)
+#  @namespace requests_mv_integrations
+"""
+Tests: Gzipped file request bodies, iterated again as upload retries do.
+"""
+
+import gzip
+import os
+import tempfile
+import time
+import unittest
+
+from requests_mv_integrations.support import (
+    GzipFileStream,
+    GzipSpooledFile,
+)
+
+
+class TestGzipFileBodies(unittest.TestCase):
+
+    def setUp(self):
+        self.file_data = b''.join('{},name {}\n'.format(i, i).encode('utf-8') for i in range(50000))
+        with tempfile.NamedTemporaryFile(delete=False) as file_w:
+            file_w.write(self.file_data)
+        self.file_path = file_w.name
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def test_spooled_file_iterated_again(self):
+        with GzipSpooledFile(self.file_path, chunk_size=4096) as upload_fp:
+            for _ in range(2):
+                self.assertEqual(gzip.decompress(b''.join(upload_fp)), self.file_data)
+                self.assertEqual(upload_fp.bytes_read, len(self.file_data))
+                self.assertEqual(upload_fp.bytes_sent, len(upload_fp))
+
+    def test_spooled_file_spooled_again(self):
+        upload_fp = GzipSpooledFile(self.file_path, chunk_size=4096)
+        b''.join(upload_fp)
+        upload_fp.close()
+
+        self.assertEqual(gzip.decompress(b''.join(upload_fp)), self.file_data)
+        self.assertEqual(upload_fp.bytes_read, len(self.file_data))
+        upload_fp.close()
+
+    def test_file_stream_iterated_again(self):
+        upload_fp = GzipFileStream(self.file_path, chunk_size=4096)
+
+        for _ in range(2):
+            self.assertEqual(gzip.decompress(b''.join(upload_fp)), self.file_data)
+            self.assertEqual(upload_fp.bytes_read, len(self.file_data))
+
+    def test_file_stream_abandoned_pass_not_counted(self):
+        upload_fp = GzipFileStream(self.file_path, chunk_size=1024, queue_size=2)
+
+        # Attempt abandoned after its first chunk, its generator left open.
+        abandoned_chunks = iter(upload_fp)
+        next(abandoned_chunks)
+
+        self.assertEqual(gzip.decompress(b''.join(upload_fp)), self.file_data)
+        time.sleep(0.3)
+
+        self.assertEqual(upload_fp.bytes_read, len(self.file_data))
+        with self.assertRaises(IOError):
+            b''.join(abandoned_chunks)
+
+
+if __name__ == '__main__':
+    unittest.main()